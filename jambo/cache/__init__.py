@@ -0,0 +1,25 @@
+from .bounded_ref_cache import BoundedRefCache, CacheBudget, estimate_size
+from .disk_cache import DiskCache
+from .model_cache import CacheInfo, ModelCache
+from .ref_graph import RefGraph
+from .schema_hash import schema_hash
+from .single_flight import SingleFlight
+from .staged_ref_cache import StagedRefCache
+from .validation_cache import ValidationCache
+from .weak_ref_cache import WeakRefCache
+
+
+__all__ = [
+    "BoundedRefCache",
+    "CacheBudget",
+    "CacheInfo",
+    "DiskCache",
+    "estimate_size",
+    "ModelCache",
+    "RefGraph",
+    "schema_hash",
+    "SingleFlight",
+    "StagedRefCache",
+    "ValidationCache",
+    "WeakRefCache",
+]
@@ -0,0 +1,396 @@
+from jambo.cache.model_cache import CacheInfo
+from jambo.cache.ref_graph import get_dependencies
+
+from pydantic import BaseModel
+from typing_extensions import (
+    Any,
+    Callable,
+    ForwardRef,
+    Iterator,
+    Literal,
+    MutableMapping,
+    Optional,
+)
+
+import sys
+from collections import OrderedDict
+from enum import Enum
+from itertools import count
+from threading import Lock, RLock
+from weakref import WeakValueDictionary
+
+
+RefCacheValue = ForwardRef | type | None
+
+EvictionPolicy = Literal["lru", "lfu"]
+
+_ticks = count()
+
+
+def estimate_size(value: RefCacheValue) -> int:
+    """
+    Approximates the memory held by a cached reference, in bytes.
+
+    The size of a model is dominated by its core schema, which is only measured once
+    it was built, models still pending their build are estimated from their fields.
+    :param value: The cached reference.
+    :return: The approximate size of the reference.
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        core_schema = value.__dict__.get("__pydantic_core_schema__")
+        if isinstance(core_schema, dict):
+            size += _deep_sizeof(core_schema, set())
+        else:
+            size += sum(
+                _deep_sizeof(vars(field), set())
+                for field in value.model_fields.values()
+            )
+    elif isinstance(value, type) and issubclass(value, Enum):
+        size += sum(
+            _deep_sizeof(member.value, set()) + sys.getsizeof(member)
+            for member in value
+        )
+
+    return size
+
+
+def _deep_sizeof(obj: Any, seen: set[int]) -> int:
+    if id(obj) in seen or isinstance(obj, type) or callable(obj):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "size", "hits", "tick", "type_ids", "names")
+
+    def __init__(self, value: RefCacheValue, size: int) -> None:
+        self.value = value
+        self.size = size
+        self.hits = 0
+        self.tick = next(_ticks)
+        self.type_ids, self.names = get_dependencies(value)
+
+
+class CacheBudget:
+    """
+    Global limits shared by several `BoundedRefCache` instances, typically one per namespace.
+
+    When the total of the caches exceeds a limit, the entry ranked lowest by its own
+    cache policy across all caches is evicted, until the totals fit again.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = None, max_memory: Optional[int] = None
+    ) -> None:
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be a non-negative integer")
+        if max_memory is not None and max_memory < 0:
+            raise ValueError("max_memory must be a non-negative integer")
+
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+
+        # Mappings are unhashable, so caches are tracked by their identity
+        self._caches: WeakValueDictionary[int, BoundedRefCache] = WeakValueDictionary()
+        self._entries = 0
+        self._memory = 0
+        self._lock = Lock()
+
+    @property
+    def entries(self) -> int:
+        """
+        :return: The number of entries held by every cache of the budget.
+        """
+        with self._lock:
+            return self._entries
+
+    @property
+    def memory(self) -> int:
+        """
+        :return: The approximate memory held by every cache of the budget, in bytes.
+        """
+        with self._lock:
+            return self._memory
+
+    def register(self, cache: "BoundedRefCache") -> None:
+        with self._lock:
+            self._caches[id(cache)] = cache
+
+    def unregister(self, cache: "BoundedRefCache") -> None:
+        with self._lock:
+            self._caches.pop(id(cache), None)
+
+    def update(self, entries: int, memory: int) -> None:
+        with self._lock:
+            self._entries += entries
+            self._memory += memory
+
+    def is_exceeded(self) -> bool:
+        with self._lock:
+            return (
+                self.max_entries is not None and self._entries > self.max_entries
+            ) or (self.max_memory is not None and self._memory > self.max_memory)
+
+    def enforce(self) -> None:
+        """
+        Evicts entries from the registered caches until the totals fit the limits.
+        """
+        while self.is_exceeded():
+            with self._lock:
+                caches = list(self._caches.values())
+
+            # The lock of the budget is not held while the caches are inspected,
+            # since every cache updates the budget while holding its own lock
+            candidates = [
+                (candidate, cache)
+                for cache in caches
+                if (candidate := cache.eviction_candidate()) is not None
+            ]
+            if not candidates:
+                return
+
+            (_, key), cache = min(candidates, key=lambda item: item[0][0])
+            cache.evict(key)
+
+
+class BoundedRefCache(MutableMapping[str, RefCacheValue]):
+    """
+    Reference cache with a bounded number of entries and approximate memory.
+
+    It can be used wherever a `RefCacheDict` is expected, for example as the reference cache
+    of the namespaces of a `SchemaConverter`. When a limit is exceeded the entries are evicted
+    by the given policy, least recently used (`lru`) or least frequently used (`lfu`).
+
+    Evicting a model also evicts every cached model that depends on it, so the cache never
+    holds a model whose dependencies would be rebuilt as different classes. The most recently
+    stored entry and its dependencies are never evicted, so the limits may be exceeded while a
+    single model needs more room than they allow.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        policy: EvictionPolicy = "lru",
+        budget: Optional[CacheBudget] = None,
+        sizeof: Callable[[RefCacheValue], int] = estimate_size,
+    ) -> None:
+        """
+        :param maxsize: The maximum number of entries of the cache.
+        :param max_memory: The maximum approximate memory of the cache, in bytes.
+        :param policy: The eviction policy, `lru` or `lfu`.
+        :param budget: Global limits shared with other caches.
+        :param sizeof: Estimates the memory held by a cached reference.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+        if max_memory is not None and max_memory < 0:
+            raise ValueError("max_memory must be a non-negative integer")
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unsupported eviction policy: {policy}")
+
+        self._maxsize = maxsize
+        self._max_memory = max_memory
+        self._policy = policy
+        self._budget = budget
+        self._sizeof = sizeof
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys_by_type_id: dict[int, str] = {}
+        self._memory = 0
+        self._newest: Optional[str] = None
+        self._lock = RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if budget is not None:
+            budget.register(self)
+
+    def __getitem__(self, key: str) -> RefCacheValue:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                raise KeyError(key)
+
+            self._hits += 1
+            entry.hits += 1
+            entry.tick = next(_ticks)
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def __setitem__(self, key: str, value: RefCacheValue) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            entry = _Entry(value, self._sizeof(value))
+            self._entries[key] = entry
+            if isinstance(value, type):
+                self._keys_by_type_id[id(value)] = key
+            self._memory += entry.size
+            self._newest = key
+
+            if self._budget is not None:
+                self._budget.update(1, entry.size)
+
+            while self._is_exceeded():
+                candidate = self.eviction_candidate()
+                if candidate is None:
+                    break
+                self.evict(candidate[1])
+
+        if self._budget is not None:
+            self._budget.enforce()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._remove(key)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def peek(self, key: str) -> RefCacheValue:
+        """
+        Gets an entry without counting a hit, nor making it more recently used.
+        :param key: The key of the entry.
+        :return: The cached reference.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(key)
+            return entry.value
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        :return: The approximate memory held by the cached references, in bytes.
+        """
+        with self._lock:
+            return self._memory
+
+    def cache_info(self) -> CacheInfo:
+        """
+        :return: The hit/miss and eviction statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def eviction_candidate(self) -> Optional[tuple[tuple[int, ...], str]]:
+        """
+        Finds the entry the policy would evict next.
+        :return: The rank of the entry, lowest first, and its key, or None if nothing can be evicted.
+        """
+        with self._lock:
+            protected = self._protected_keys()
+
+            candidates = (
+                (self._rank(entry), key)
+                for key, entry in self._entries.items()
+                if key not in protected
+            )
+            return min(candidates, default=None)
+
+    def evict(self, key: str) -> list[str]:
+        """
+        Evicts an entry along with every cached entry that depends on it.
+        :param key: The key of the entry to evict.
+        :return: The keys of the evicted entries.
+        """
+        with self._lock:
+            evicted = []
+            pending = [key]
+            while pending:
+                current = pending.pop()
+                if current not in self._entries:
+                    continue
+
+                entry = self._remove(current)
+                evicted.append(current)
+                self._evictions += 1
+
+                pending.extend(
+                    other_key
+                    for other_key, other in self._entries.items()
+                    if current in other.names or id(entry.value) in other.type_ids
+                )
+
+            return evicted
+
+    def _rank(self, entry: _Entry) -> tuple[int, ...]:
+        if self._policy == "lfu":
+            return (entry.hits, entry.tick)
+        return (entry.tick,)
+
+    def _is_exceeded(self) -> bool:
+        return (self._maxsize is not None and len(self._entries) > self._maxsize) or (
+            self._max_memory is not None and self._memory > self._max_memory
+        )
+
+    def _protected_keys(self) -> set[str]:
+        """
+        Gets the most recently stored entry and every cached entry it depends on.
+        """
+        protected: set[str] = set()
+        pending = [self._newest] if self._newest is not None else []
+        while pending:
+            key = pending.pop()
+            if key in protected or key not in self._entries:
+                continue
+            protected.add(key)
+
+            entry = self._entries[key]
+            pending.extend(entry.names)
+            pending.extend(
+                self._keys_by_type_id[type_id]
+                for type_id in entry.type_ids
+                if type_id in self._keys_by_type_id
+            )
+
+        return protected
+
+    def _remove(self, key: str) -> _Entry:
+        entry = self._entries.pop(key)
+        if isinstance(entry.value, type):
+            self._keys_by_type_id.pop(id(entry.value), None)
+        self._memory -= entry.size
+        if self._newest == key:
+            self._newest = None
+
+        if self._budget is not None:
+            self._budget.update(-1, -entry.size)
+
+        return entry
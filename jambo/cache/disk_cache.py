@@ -0,0 +1,216 @@
+from pydantic import VERSION as PYDANTIC_VERSION
+from typing_extensions import Optional
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from threading import RLock
+from types import ModuleType
+
+
+@lru_cache(maxsize=1)
+def _jambo_version() -> str:
+    """
+    Identifies the code of jambo generating the cached modules, even in a source checkout
+    whose installed version doesn't change with the code.
+    """
+    try:
+        version = importlib.metadata.version("jambo")
+    except importlib.metadata.PackageNotFoundError:
+        version = "dev"
+
+    digest = hashlib.sha256()
+    package_directory = Path(__file__).resolve().parents[1]
+    for path in sorted(package_directory.rglob("*.py")):
+        digest.update(path.relative_to(package_directory).as_posix().encode())
+        digest.update(path.read_bytes())
+
+    return f"{version}+{digest.hexdigest()[:12]}"
+
+
+class DiskCache:
+    """
+    Size-bounded on-disk cache of generated model modules keyed by schema hash.
+
+    Entries are stored in a subdirectory named after the Python, jambo and pydantic versions,
+    the jambo version including a hash of its source, so changing any of them invalidates
+    the cache automatically. Entries that fail to load are removed and treated as misses.
+    Writes are atomic, so the same directory can be shared by concurrent processes. When the
+    directory grows over `max_size` bytes, the least recently used entries are removed,
+    starting with the ones left behind by other versions.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike, max_size: int = 64 * 1024 * 1024
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+        self._version_directory = self.directory / self.version_tag()
+        self._lock = RLock()
+
+    @staticmethod
+    def version_tag() -> str:
+        """
+        Returns the tag identifying the versions the cached entries were generated with.
+        """
+        python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        return f"py{python_version}-jambo{_jambo_version()}-pydantic{PYDANTIC_VERSION}"
+
+    def get(self, key: str) -> Optional[ModuleType]:
+        """
+        Loads a cached module, marking it as the most recently used.
+        :param key: The schema hash of the module.
+        :return: The loaded module, or None if not found.
+        """
+        path = self._entry_path(key)
+
+        with self._lock:
+            if (module := sys.modules.get(self._module_name(key))) is not None:
+                return module
+
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+
+            return self._load_module(key, path)
+
+    def put(self, key: str, source: str) -> None:
+        """
+        Atomically stores the source of a generated module, evicting old entries if needed.
+        :param key: The schema hash of the module.
+        :param source: The source of the generated module.
+        """
+        with self._lock:
+            self._version_directory.mkdir(parents=True, exist_ok=True)
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=self._version_directory, prefix=f".{key}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    temp_file.write(source)
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+
+            self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Removes a single entry from the cache.
+        :param key: The schema hash of the module.
+        :return: True if an entry was removed, False otherwise.
+        """
+        with self._lock:
+            sys.modules.pop(self._module_name(key), None)
+            return self._remove(self._entry_path(key))
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache, including the ones of other versions.
+        """
+        with self._lock:
+            for path in self._entries():
+                sys.modules.pop(self._module_name(path.stem), None)
+                self._remove(path)
+
+    def size(self) -> int:
+        """
+        Returns the total size in bytes of the cached entries.
+        """
+        return sum(self._file_size(path) for path in self._entries())
+
+    def _entry_path(self, key: str) -> Path:
+        return self._version_directory / f"{key}.py"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob("*/*.py"))
+
+    @staticmethod
+    def _module_name(key: str) -> str:
+        return f"_jambo_disk_cache_{key}"
+
+    def _load_module(self, key: str, path: Path) -> Optional[ModuleType]:
+        module_name = self._module_name(key)
+
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except FileNotFoundError:
+            # The entry was evicted by another process while loading it
+            sys.modules.pop(module_name, None)
+            return None
+        except Exception:
+            # A corrupted entry is a miss, it's removed so the module is generated again
+            sys.modules.pop(module_name, None)
+            self._remove(path)
+            return None
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+
+        return module
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total_size = sum(self._file_size(path) for path in entries)
+        if total_size <= self.max_size:
+            return
+
+        # Entries of other versions are never used again, so they are evicted first
+        entries.sort(
+            key=lambda path: (
+                path.parent == self._version_directory,
+                self._modification_time(path),
+            )
+        )
+        for path in entries:
+            if total_size <= self.max_size:
+                break
+            total_size -= self._file_size(path)
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        for bytecode in path.parent.glob(f"__pycache__/{path.stem}.*.pyc"):
+            bytecode.unlink(missing_ok=True)
+
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _modification_time(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
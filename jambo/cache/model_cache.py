@@ -0,0 +1,116 @@
+from pydantic import BaseModel
+from typing_extensions import NamedTuple, Optional
+
+from collections import OrderedDict
+from threading import RLock
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class ModelCache:
+    """
+    Size-bounded LRU cache of compiled Pydantic models keyed by schema hash.
+
+    The cache is safe to share between threads. When the number of entries exceeds
+    `maxsize`, the least recently used model is evicted.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, type[BaseModel]] = OrderedDict()
+        self._lock = RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[type[BaseModel]]:
+        """
+        Gets a cached model, marking it as the most recently used.
+        :param key: The schema hash of the model.
+        :return: The cached model, or None if not found.
+        """
+        with self._lock:
+            model = self._entries.get(key)
+            if model is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return model
+
+    def put(self, key: str, model: type[BaseModel]) -> None:
+        """
+        Stores a model in the cache, evicting the least recently used entries if needed.
+        :param key: The schema hash of the model.
+        :param model: The compiled model.
+        """
+        with self._lock:
+            self._entries[key] = model
+            self._entries.move_to_end(key)
+            self._evict(self._maxsize)
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Removes a single entry from the cache.
+        :param key: The schema hash of the model.
+        :return: True if an entry was removed, False otherwise.
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache and resets its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the maximum size of the cache, evicting entries if needed.
+        :param maxsize: The new maximum number of entries.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict(maxsize)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the hit/miss statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, maxsize: int) -> None:
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
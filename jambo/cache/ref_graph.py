@@ -0,0 +1,210 @@
+from pydantic import BaseModel
+from typing_extensions import (
+    Any,
+    ForwardRef,
+    Iterable,
+    Mapping,
+    Optional,
+    get_args,
+)
+
+
+RefCacheValue = ForwardRef | type | None
+
+
+def get_dependencies(value: RefCacheValue) -> tuple[set[int], set[str]]:
+    """
+    Collects the types and forward reference names a cached model refers to.
+    :param value: The cached reference.
+    :return: The ids of the referenced types and the referenced forward names.
+    """
+    types, names = _get_references(value)
+    return set(types), names
+
+
+def _get_references(value: RefCacheValue) -> tuple[dict[int, type], set[str]]:
+    types: dict[int, type] = {}
+    names: set[str] = set()
+
+    def visit(tp: Any) -> None:
+        if isinstance(tp, ForwardRef):
+            names.add(tp.__forward_arg__)
+            return
+        if isinstance(tp, str):
+            names.add(tp)
+            return
+        if isinstance(tp, type):
+            types[id(tp)] = tp
+        for arg in get_args(tp):
+            visit(arg)
+
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        for field in value.model_fields.values():
+            visit(field.annotation)
+
+    return types, names
+
+
+def peek(ref_cache: Mapping[str, RefCacheValue], name: str) -> RefCacheValue:
+    """
+    Gets a cached reference without counting it as a lookup, for caches keeping statistics.
+    :param ref_cache: The reference cache.
+    :param name: The name of the reference.
+    :return: The cached reference.
+    """
+    peek_entry = getattr(ref_cache, "peek", None)
+    if peek_entry is not None:
+        return peek_entry(name)
+    return ref_cache[name]
+
+
+class RefGraph:
+    """
+    Dependency graph of the models of a reference cache.
+
+    A model depends on the cached types its fields refer to, either directly or through a forward
+    reference. Mutually recursive models form the strongly connected components of the graph.
+    """
+
+    def __init__(self, dependencies: Mapping[str, Iterable[str]]) -> None:
+        """
+        :param dependencies: The names each name depends on, names missing from the mapping have no dependencies.
+        """
+        self.dependencies = {
+            name: tuple(dict.fromkeys(depends_on))
+            for name, depends_on in dependencies.items()
+        }
+
+    @classmethod
+    def from_ref_cache(
+        cls,
+        ref_cache: Mapping[str, RefCacheValue],
+        names: Optional[Iterable[str]] = None,
+    ) -> "RefGraph":
+        """
+        Builds the dependency graph of the models of a reference cache.
+        :param ref_cache: The reference cache holding the models.
+        :param names: The names the graph starts from, along with the cached models they depend on,
+            every cached name by default.
+        :return: The dependency graph.
+        """
+        return cls.from_entries(cls.get_entries(ref_cache, names))
+
+    @staticmethod
+    def get_entries(
+        ref_cache: Mapping[str, RefCacheValue],
+        names: Optional[Iterable[str]] = None,
+    ) -> dict[str, RefCacheValue]:
+        """
+        Reads the given names of a reference cache and every cached model they depend on,
+        without counting the reads as lookups of the cache.
+        :param ref_cache: The reference cache holding the models.
+        :param names: The names to read, every cached name by default.
+        :return: The cached references, by name.
+        """
+        if names is None:
+            return {name: peek(ref_cache, name) for name in list(ref_cache)}
+
+        entries: dict[str, RefCacheValue] = {}
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in entries or name not in ref_cache:
+                continue
+
+            value = entries[name] = peek(ref_cache, name)
+            types, forward_names = _get_references(value)
+            pending.extend(forward_names)
+            # Cached models are named after their key, the name is only followed if it's the same model
+            pending.extend(
+                tp.__name__
+                for tp in types.values()
+                if tp.__name__ in ref_cache and peek(ref_cache, tp.__name__) is tp
+            )
+
+        return entries
+
+    @classmethod
+    def from_entries(cls, entries: Mapping[str, RefCacheValue]) -> "RefGraph":
+        """
+        Builds the dependency graph of cached references, dependencies on other names are left out.
+        :param entries: The cached references, by name.
+        :return: The dependency graph.
+        """
+        names_by_type_id = {
+            id(value): name
+            for name, value in entries.items()
+            if isinstance(value, type)
+        }
+
+        dependencies: dict[str, list[str]] = {}
+        for name, value in entries.items():
+            type_ids, forward_names = get_dependencies(value)
+            depends_on = {
+                names_by_type_id[type_id]
+                for type_id in type_ids
+                if type_id in names_by_type_id
+            }
+            dependencies[name] = sorted((depends_on | forward_names) & set(entries))
+
+        return cls(dependencies)
+
+    def components(self) -> list[list[str]]:
+        """
+        Finds the strongly connected components of the graph, with Tarjan's algorithm.
+        :return: The components, in topological order: every component comes after the components it depends on.
+        """
+        index: dict[str, int] = {}
+        low_link: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        for root in self.dependencies:
+            if root in index:
+                continue
+
+            # Iterative depth-first search, so long chains don't hit the recursion limit
+            pending: list[tuple[str, int]] = [(root, 0)]
+            while pending:
+                name, position = pending.pop()
+                if position == 0:
+                    index[name] = low_link[name] = len(index)
+                    stack.append(name)
+                    on_stack.add(name)
+
+                depends_on = self.dependencies.get(name, ())
+                if position < len(depends_on):
+                    pending.append((name, position + 1))
+
+                    dependency = depends_on[position]
+                    if dependency not in index:
+                        pending.append((dependency, 0))
+                    elif dependency in on_stack:
+                        low_link[name] = min(low_link[name], index[dependency])
+                    continue
+
+                if pending:
+                    parent = pending[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[name])
+
+                if low_link[name] == index[name]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == name:
+                            break
+                    components.append(component[::-1])
+
+        return components
+
+    def is_recursive(self, component: list[str]) -> bool:
+        """
+        :param component: A strongly connected component of the graph.
+        :return: Whether the models of the component refer to themselves.
+        """
+        return len(component) > 1 or component[0] in self.dependencies.get(
+            component[0], ()
+        )
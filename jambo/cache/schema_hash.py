@@ -0,0 +1,26 @@
+from jambo.types.json_schema_type import JSONSchema
+
+from typing_extensions import Any
+
+import hashlib
+import json
+
+
+def schema_hash(schema: JSONSchema | Any) -> str:
+    """
+    Computes a canonical hash of a JSON Schema.
+
+    The schema is serialized with sorted keys and without insignificant whitespace,
+    so two schemas that are structurally identical produce the same hash regardless
+    of key order.
+        :param schema: The JSON Schema to hash.
+        :return: The hexadecimal SHA-256 digest of the canonical serialization.
+    """
+    canonical = json.dumps(
+        schema,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,57 @@
+from typing_extensions import Callable, Generic, Hashable, TypeVar
+
+from concurrent.futures import Future
+from threading import Lock
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Deduplicates concurrent calls sharing the same key.
+
+    The first caller of a key runs the call, every caller arriving while it runs
+    blocks until it finishes and gets the same result, or the same exception.
+    Results are not kept once the call finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, Future[V]] = {}
+        self._lock = Lock()
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """
+        Runs `fn`, unless a call with the same key is already running.
+        :param key: The key identifying the call.
+        :param fn: The call to run.
+        :return: The result of the call that ran for this key.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """
+        :return: The number of calls currently running.
+        """
+        with self._lock:
+            return len(self._calls)
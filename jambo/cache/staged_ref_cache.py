@@ -0,0 +1,96 @@
+from jambo.cache.ref_graph import peek
+from jambo.types import RefCacheDict
+
+from typing_extensions import ForwardRef, Iterator, MutableMapping
+
+
+_DELETED = object()
+
+
+class StagedRefCache(MutableMapping[str, ForwardRef | type | None]):
+    """
+    Overlay over a reference cache that stages every write until it is committed.
+
+    Reads see the staged entries first and fall back to the underlying cache, while
+    the underlying cache is left untouched until `commit` is called. Discarding the
+    overlay drops the in-progress sentinels and half-built models of a failed build.
+    """
+
+    def __init__(self, base: RefCacheDict) -> None:
+        self._base = base
+        self._staged: dict[str, object] = {}
+
+    def __getitem__(self, key: str) -> ForwardRef | type | None:
+        value = self._staged.get(key, self._base)
+        if value is _DELETED:
+            raise KeyError(key)
+        if value is self._base:
+            return self._base[key]
+        return value  # type: ignore
+
+    def __setitem__(self, key: str, value: ForwardRef | type | None) -> None:
+        self._staged[key] = value
+
+    def peek(self, key: str) -> ForwardRef | type | None:
+        """
+        Gets an entry without counting a hit in the underlying cache.
+        :param key: The key of the entry.
+        :return: The cached reference.
+        """
+        value = self._staged.get(key, self._base)
+        if value is _DELETED:
+            raise KeyError(key)
+        if value is self._base:
+            return peek(self._base, key)
+        return value  # type: ignore
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._staged[key] = _DELETED
+
+    def __iter__(self) -> Iterator[str]:
+        for key, value in self._staged.items():
+            if value is not _DELETED:
+                yield key
+        for key in self._base:
+            if key not in self._staged:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._staged:
+            return self._staged[key] is not _DELETED  # type: ignore
+        return key in self._base
+
+    @property
+    def staged(self) -> dict[str, ForwardRef | type | None]:
+        """
+        :return: The entries written since the overlay was created or last committed.
+        """
+        return {
+            key: value  # type: ignore
+            for key, value in self._staged.items()
+            if value is not _DELETED
+        }
+
+    def commit(self) -> None:
+        """
+        Applies the staged writes to the underlying cache.
+        In-progress sentinels left by the build are not committed.
+        """
+        for key, value in self._staged.items():
+            if value is _DELETED:
+                self._base.pop(key, None)
+            elif value is not None:
+                self._base[key] = value  # type: ignore
+
+        self._staged.clear()
+
+    def discard(self) -> None:
+        """
+        Drops the staged writes, leaving the underlying cache as it was.
+        """
+        self._staged.clear()
@@ -0,0 +1,59 @@
+from typing_extensions import Optional
+
+from collections import OrderedDict
+from threading import RLock
+
+
+class ValidationCache:
+    """
+    Size-bounded LRU record of schemas that already passed meta-schema validation.
+
+    Entries are keyed by the schema dialect (its `$schema`) and the schema hash,
+    so the same schema checked against different dialects is validated once per dialect.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[Optional[str], str], None] = OrderedDict()
+        self._lock = RLock()
+
+    def is_validated(self, dialect: Optional[str], key: str) -> bool:
+        """
+        Checks whether a schema already passed validation, marking it as the most recently used.
+        :param dialect: The `$schema` of the schema, or None for the default dialect.
+        :param key: The schema hash.
+        :return: True if the schema was already validated.
+        """
+        with self._lock:
+            if (dialect, key) not in self._entries:
+                return False
+
+            self._entries.move_to_end((dialect, key))
+            return True
+
+    def mark_validated(self, dialect: Optional[str], key: str) -> None:
+        """
+        Records that a schema passed validation.
+        :param dialect: The `$schema` of the schema, or None for the default dialect.
+        :param key: The schema hash.
+        """
+        with self._lock:
+            self._entries[(dialect, key)] = None
+            self._entries.move_to_end((dialect, key))
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
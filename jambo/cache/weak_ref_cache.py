@@ -0,0 +1,65 @@
+from typing_extensions import (
+    ForwardRef,
+    ItemsView,
+    Iterator,
+    MutableMapping,
+    ValuesView,
+)
+
+from weakref import WeakValueDictionary
+
+
+class WeakRefCache(MutableMapping[str, ForwardRef | type | None]):
+    """
+    Reference cache holding the generated types through weak references.
+
+    It can be used wherever a `RefCacheDict` is expected, for example as the reference cache
+    of the namespaces of a `SchemaConverter`. Types nobody references any more are garbage
+    collected and disappear from the cache, to be rebuilt by the next build that needs them.
+    A cached model keeps the models it depends on alive, so only whole unused models are dropped.
+
+    Forward references and in-progress sentinels are held strongly, they only live while a build runs.
+    """
+
+    def __init__(self) -> None:
+        self._types: WeakValueDictionary[str, type] = WeakValueDictionary()
+        self._pending: dict[str, ForwardRef | None] = {}
+
+    def __getitem__(self, key: str) -> ForwardRef | type | None:
+        if key in self._pending:
+            return self._pending[key]
+        return self._types[key]
+
+    def __setitem__(self, key: str, value: ForwardRef | type | None) -> None:
+        if isinstance(value, type):
+            self._pending.pop(key, None)
+            self._types[key] = value
+        else:
+            self._types.pop(key, None)
+            self._pending[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._pending:
+            del self._pending[key]
+        else:
+            del self._types[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._pending)
+        yield from list(self._types.keys())
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._types)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._pending or key in self._types
+
+    def items(self) -> ItemsView[str, ForwardRef | type | None]:
+        # Snapshots the entries, so types collected while iterating don't raise
+        return self._snapshot().items()
+
+    def values(self) -> ValuesView[ForwardRef | type | None]:
+        return self._snapshot().values()
+
+    def _snapshot(self) -> dict[str, ForwardRef | type | None]:
+        return {**self._pending, **dict(self._types.items())}
@@ -0,0 +1,6 @@
+from .source_generator import SourceGenerator
+
+
+__all__ = [
+    "SourceGenerator",
+]
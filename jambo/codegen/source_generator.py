@@ -0,0 +1,539 @@
+from jambo.exceptions import UnsupportedSchemaException
+from jambo.parser import _validators
+from jambo.parser._validators import (
+    AdaptiveUnionValidator,
+    ConstValidator,
+    OneOfValidator,
+    RoutedUnionValidator,
+    TagDiscriminator,
+)
+from jambo.types import RefCacheDict
+
+from annotated_types import Ge, Gt, Le, Lt, MaxLen, MinLen, MultipleOf
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    Discriminator,
+    FilePath,
+    Tag,
+    WrapValidator,
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+from typing_extensions import (
+    Annotated,
+    Any,
+    ForwardRef,
+    Iterable,
+    Literal,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import builtins
+import datetime
+import inspect
+import keyword
+import math
+import pathlib
+import re
+import sys
+import types
+from enum import Enum
+
+
+HEADER = '''"""
+Generated by jambo, do not edit by hand.
+"""
+'''
+
+FIXED_IMPORTS = (
+    "from enum import Enum\n"
+    "\n"
+    "from pydantic import AfterValidator, BeforeValidator, ConfigDict, Discriminator, Field, Tag, WrapValidator, create_model\n"
+    "from typing_extensions import Annotated, ForwardRef, Literal, Union\n"
+)
+
+RESERVED_NAMES = frozenset(
+    {
+        "Enum",
+        "AfterValidator",
+        "BeforeValidator",
+        "WrapValidator",
+        "Discriminator",
+        "Tag",
+        "ConfigDict",
+        "Field",
+        "create_model",
+        "Annotated",
+        "ForwardRef",
+        "Literal",
+        "Union",
+        "annotated_types",
+        "datetime",
+        "decimal",
+        "ipaddress",
+        "pathlib",
+        "pydantic",
+        "uuid",
+    }
+    | {name for name in vars(_validators) if not name.startswith("__")}
+)
+
+IMPORTABLE_MODULES = frozenset(
+    {"datetime", "decimal", "ipaddress", "pathlib", "pydantic", "uuid"}
+)
+
+CONSTRAINT_MAPPINGS: dict[type, str] = {
+    Gt: "gt",
+    Ge: "ge",
+    Lt: "lt",
+    Le: "le",
+    MultipleOf: "multiple_of",
+    MinLen: "min_length",
+    MaxLen: "max_length",
+}
+
+FIELD_ATTRIBUTES = (
+    "title",
+    "description",
+    "examples",
+    "json_schema_extra",
+    "deprecated",
+    "discriminator",
+)
+
+ALIASES: dict[Any, str] = {
+    FilePath: "pydantic.FilePath",
+}
+
+
+class SourceGenerator:
+    """
+    Renders generated Pydantic models as the source of an importable Python module.
+
+    The rendered module rebuilds the same models, Enums and annotated types as the runtime
+    path, using only pydantic and typing_extensions, so it can be imported without jambo
+    or any JSON Schema processing.
+    """
+
+    def __init__(self, ref_cache: Optional[RefCacheDict] = None) -> None:
+        """
+        :param ref_cache: The reference cache the models were built with, used to resolve forward references by name.
+        """
+        self._ref_cache = ref_cache or {}
+
+        self._identifiers: dict[type, str] = {}
+        self._ordered_types: list[type] = []
+        self._defined_types: set[type] = set()
+        self._imports: set[str] = set()
+        self._uses_validators = False
+
+    def generate(self, models: Iterable[type]) -> str:
+        """
+        Renders the given models, and every type they depend on, as a Python module.
+        :param models: The generated models to render.
+        :return: The source of the module.
+        """
+        roots = list(models)
+        for model in roots:
+            self._collect(model, set())
+
+        body = []
+        for tp in self._ordered_types:
+            body.append(self._render_type_definition(tp))
+            self._defined_types.add(tp)
+
+        rebuilds = [
+            f"{self._identifiers[tp]}.model_rebuild()"
+            for tp in self._ordered_types
+            # Deferred models resolve their forward references on first use
+            if issubclass(tp, BaseModel) and not tp.model_config.get("defer_build")
+        ]
+
+        exported = [self._identifiers[tp] for tp in self._ordered_types]
+
+        sections = [HEADER, self._render_imports()]
+        if self._uses_validators:
+            sections.append(self._render_validators())
+        sections.extend(body)
+        if rebuilds:
+            sections.append("\n".join(rebuilds) + "\n")
+        sections.append(
+            "__all__ = [\n" + "".join(f'    "{name}",\n' for name in exported) + "]\n"
+        )
+
+        return "\n\n\n".join(section.strip("\n") for section in sections) + "\n"
+
+    def get_identifier(self, tp: type) -> str:
+        """
+        Gets the identifier a type is exposed as in the generated module.
+        :param tp: A type rendered by `generate`.
+        :return: The identifier of the type.
+        """
+        return self._identifiers[tp]
+
+    def _collect(self, tp: Any, visiting: set[int]) -> None:
+        """
+        Collects every model and Enum reachable from a type, in dependency order.
+        Forward references don't impose an order, since they are resolved at the end of the module.
+        """
+        if isinstance(tp, ForwardRef):
+            target = self._resolve_forward_ref(tp)
+            if target not in self._identifiers and id(target) not in visiting:
+                self._collect(target, visiting)
+            return
+
+        if isinstance(tp, type) and issubclass(tp, (BaseModel, Enum)):
+            if tp in self._identifiers or id(tp) in visiting:
+                return
+
+            visiting.add(id(tp))
+            if issubclass(tp, BaseModel):
+                for field_info in tp.model_fields.values():
+                    self._collect(field_info.annotation, visiting)
+                    self._collect_metadata(field_info.metadata, visiting)
+            visiting.discard(id(tp))
+
+            self._identifiers[tp] = self._make_identifier(tp.__name__)
+            self._ordered_types.append(tp)
+            return
+
+        for arg in get_args(tp):
+            self._collect(arg, visiting)
+
+        if get_origin(tp) is Annotated:
+            self._collect_metadata(tp.__metadata__, visiting)
+
+    def _collect_metadata(self, metadata: Iterable[Any], visiting: set[int]) -> None:
+        for item in metadata:
+            if isinstance(
+                item, (BeforeValidator, AfterValidator, WrapValidator)
+            ) and isinstance(
+                item.func,
+                (OneOfValidator, RoutedUnionValidator, AdaptiveUnionValidator),
+            ):
+                for subfield_type in item.func.subfield_types:
+                    self._collect(subfield_type, visiting)
+
+    def _resolve_forward_ref(self, ref: ForwardRef) -> type:
+        name = ref.__forward_arg__
+
+        target = self._ref_cache.get(name)
+        if isinstance(target, type):
+            return target
+
+        for tp in self._identifiers:
+            if tp.__name__ == name:
+                return tp
+
+        raise UnsupportedSchemaException(
+            f"Unable to resolve forward reference '{name}' while generating source.",
+            unsupported_field=name,
+        )
+
+    def _make_identifier(self, name: str) -> str:
+        identifier = re.sub(r"\W", "_", name)
+        if not identifier or identifier[0].isdigit():
+            identifier = f"_{identifier}"
+
+        taken = set(self._identifiers.values())
+
+        candidate = identifier
+        suffix = 1
+        while (
+            candidate in taken
+            or candidate in RESERVED_NAMES
+            or keyword.iskeyword(candidate)
+            or hasattr(builtins, candidate)
+        ):
+            suffix += 1
+            candidate = f"{identifier}_{suffix}"
+
+        return candidate
+
+    def _render_imports(self) -> str:
+        module_imports = "".join(
+            f"import {module}\n" for module in sorted(self._imports)
+        )
+        if not module_imports:
+            return FIXED_IMPORTS
+
+        return f"{module_imports}\n{FIXED_IMPORTS}"
+
+    def _render_validators(self) -> str:
+        return inspect.getsource(_validators)
+
+    def _render_type_definition(self, tp: type) -> str:
+        identifier = self._identifiers[tp]
+
+        if issubclass(tp, Enum):
+            members = ", ".join(
+                f"{member.name!r}: {self._render_value(member.value)}" for member in tp
+            )
+            return (
+                f"{identifier} = Enum({tp.__name__!r}, {{{members}}})\n"
+                f"{identifier}.__doc__ = {tp.__doc__!r}\n"
+            )
+
+        if not issubclass(tp, BaseModel):
+            raise UnsupportedSchemaException(
+                f"Unable to generate source for type {tp!r}.",
+                unsupported_field=tp.__name__,
+            )
+
+        config = ", ".join(
+            f"{key}={self._render_value(value)}"
+            for key, value in tp.model_config.items()
+        )
+        fields = "".join(
+            f"        {field_name!r}: ({self._render_field(field_info)}),\n"
+            for field_name, field_info in tp.model_fields.items()
+        )
+
+        return (
+            f"{identifier} = create_model(\n"
+            f"    {tp.__name__!r},\n"
+            f"    __config__=ConfigDict({config}),\n"
+            f"    __doc__={tp.__doc__!r},\n"
+            f"    **{{\n"
+            f"{fields}"
+            f"    }},\n"
+            f")\n"
+        )
+
+    def _render_field(self, field_info: FieldInfo) -> str:
+        annotation = self._render_type(field_info.annotation)
+
+        validators = [
+            self._render_metadata(item)
+            for item in field_info.metadata
+            if type(item) not in CONSTRAINT_MAPPINGS
+            and not self._is_general_metadata(item)
+        ]
+        if validators:
+            annotation = f"Annotated[{annotation}, {', '.join(validators)}]"
+
+        return (
+            f"{annotation}, {self._render_field_info(field_info, with_metadata=False)}"
+        )
+
+    def _render_field_info(self, field_info: FieldInfo, with_metadata: bool) -> str:
+        arguments = []
+
+        if field_info.default is not PydanticUndefined:
+            arguments.append(f"default={self._render_value(field_info.default)}")
+
+        if field_info.default_factory is not None:
+            default_value = field_info.default_factory()  # type: ignore[call-arg]
+            arguments.append(
+                f"default_factory=lambda: {self._render_value(default_value)}"
+            )
+
+        for attribute in FIELD_ATTRIBUTES:
+            if (value := getattr(field_info, attribute)) is not None:
+                arguments.append(f"{attribute}={self._render_value(value)}")
+
+        for item in field_info.metadata:
+            if (constraint := CONSTRAINT_MAPPINGS.get(type(item))) is not None:
+                arguments.append(
+                    f"{constraint}={self._render_value(getattr(item, constraint))}"
+                )
+            elif self._is_general_metadata(item):
+                arguments.extend(
+                    f"{key}={self._render_value(value)}"
+                    for key, value in vars(item).items()
+                )
+            elif with_metadata:
+                raise UnsupportedSchemaException(
+                    f"Unable to generate source for field metadata {item!r}.",
+                    unsupported_field=repr(item),
+                )
+
+        return f"Field({', '.join(arguments)})"
+
+    @staticmethod
+    def _is_general_metadata(item: Any) -> bool:
+        return type(item).__name__ == "_PydanticGeneralMetadata"
+
+    def _render_metadata(self, item: Any) -> str:
+        if isinstance(item, FieldInfo):
+            return self._render_field_info(item, with_metadata=True)
+
+        if isinstance(item, (BeforeValidator, AfterValidator, WrapValidator)):
+            return f"{type(item).__name__}({self._render_validator(item.func)})"
+
+        if isinstance(item, Discriminator):
+            return f"Discriminator({self._render_validator(item.discriminator)})"
+
+        if isinstance(item, Tag):
+            return f"Tag({item.tag!r})"
+
+        raise UnsupportedSchemaException(
+            f"Unable to generate source for type metadata {item!r}.",
+            unsupported_field=repr(item),
+        )
+
+    def _render_validator(self, func: Any) -> str:
+        self._uses_validators = True
+
+        if isinstance(func, OneOfValidator):
+            subfield_types = ", ".join(
+                self._render_type(subfield_type)
+                for subfield_type in func.subfield_types
+            )
+            return f"OneOfValidator([{subfield_types}])"
+
+        if isinstance(func, RoutedUnionValidator):
+            subfield_types = ", ".join(
+                self._render_type(subfield_type)
+                for subfield_type in func.subfield_types
+            )
+            return (
+                f"RoutedUnionValidator([{subfield_types}], "
+                f"{func.branch_types!r}, one_of={func.one_of!r})"
+            )
+
+        if isinstance(func, AdaptiveUnionValidator):
+            subfield_types = ", ".join(
+                self._render_type(subfield_type)
+                for subfield_type in func.subfield_types
+            )
+            return (
+                f"AdaptiveUnionValidator([{subfield_types}], one_of={func.one_of!r}, "
+                f"branch_types={func.branch_types!r}, reorder_interval={func.reorder_interval!r}, "
+                f"overlapping={func.overlapping!r})"
+            )
+
+        if isinstance(func, ConstValidator):
+            return f"ConstValidator({self._render_value(func.const_value)})"
+
+        if isinstance(func, TagDiscriminator):
+            return f"TagDiscriminator({func.property_name!r})"
+
+        raise UnsupportedSchemaException(
+            f"Unable to generate source for validator {func!r}.",
+            unsupported_field=repr(func),
+        )
+
+    def _render_type(self, tp: Any) -> str:
+        if tp is None or tp is types.NoneType:
+            return "None"
+
+        if tp in ALIASES:
+            self._imports.add(ALIASES[tp].split(".")[0])
+            return ALIASES[tp]
+
+        if isinstance(tp, ForwardRef):
+            tp = self._resolve_forward_ref(tp)
+
+        if tp in self._identifiers:
+            # Types that are not defined yet are part of a cycle, and are resolved at the end of the module
+            if tp not in self._defined_types:
+                return f"ForwardRef({self._identifiers[tp]!r})"
+            return self._identifiers[tp]
+
+        origin = get_origin(tp)
+
+        if origin is Annotated:
+            metadata = ", ".join(
+                self._render_metadata(item) for item in tp.__metadata__
+            )
+            return f"Annotated[{self._render_type(tp.__origin__)}, {metadata}]"
+
+        if origin is Union or origin is types.UnionType:
+            members = ", ".join(self._render_type(arg) for arg in get_args(tp))
+            return f"Union[{members}]"
+
+        if origin is Literal:
+            values = ", ".join(self._render_value(arg) for arg in get_args(tp))
+            return f"Literal[{values}]"
+
+        if origin in (list, set, frozenset, tuple, dict):
+            members = ", ".join(self._render_type(arg) for arg in get_args(tp))
+            return f"{origin.__name__}[{members}]"
+
+        if isinstance(tp, type):
+            return self._render_class(tp)
+
+        raise UnsupportedSchemaException(
+            f"Unable to generate source for type {tp!r}.", unsupported_field=repr(tp)
+        )
+
+    def _render_class(self, cls: type) -> str:
+        if cls.__module__ == "builtins":
+            return cls.__qualname__
+
+        module_name = cls.__module__.split(".")[0]
+        if module_name not in IMPORTABLE_MODULES:
+            raise UnsupportedSchemaException(
+                f"Unable to generate source for type {cls!r}.",
+                unsupported_field=cls.__qualname__,
+            )
+
+        self._imports.add(module_name)
+
+        # Prefer the public location of the class, e.g. pydantic.EmailStr
+        if getattr(sys.modules[module_name], cls.__qualname__, None) is cls:
+            return f"{module_name}.{cls.__qualname__}"
+
+        self._imports.add(cls.__module__)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    def _render_value(self, value: Any) -> str:
+        if isinstance(value, Enum):
+            identifier = self._identifiers[type(value)]
+            return f"{identifier}({self._render_value(value.value)})"
+
+        if value is None or isinstance(value, (bool, int, str, bytes)):
+            return repr(value)
+
+        if isinstance(value, float):
+            if math.isinf(value) or math.isnan(value):
+                return f'float("{value}")'
+            return repr(value)
+
+        if isinstance(value, BaseModel):
+            identifier = self._identifiers[type(value)]
+            data = {name: getattr(value, name) for name in type(value).model_fields}
+            return f"{identifier}.model_validate({self._render_value(data)})"
+
+        if isinstance(value, list):
+            return f"[{', '.join(self._render_value(item) for item in value)}]"
+
+        if isinstance(value, tuple):
+            return f"({''.join(f'{self._render_value(item)}, ' for item in value)})"
+
+        if isinstance(value, (set, frozenset)):
+            if not value:
+                return f"{type(value).__name__}()"
+            items = ", ".join(self._render_value(item) for item in value)
+            if isinstance(value, frozenset):
+                return f"frozenset({{{items}}})"
+            return f"{{{items}}}"
+
+        if isinstance(value, dict):
+            items = ", ".join(
+                f"{self._render_value(key)}: {self._render_value(item)}"
+                for key, item in value.items()
+            )
+            return f"{{{items}}}"
+
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            self._imports.add("datetime")
+            return (
+                f"datetime.{type(value).__name__}.fromisoformat({value.isoformat()!r})"
+            )
+
+        if isinstance(value, datetime.timedelta):
+            self._imports.add("datetime")
+            return repr(value)
+
+        if isinstance(value, pathlib.PurePath):
+            self._imports.add("pathlib")
+            return f"pathlib.Path({str(value)!r})"
+
+        return f"{self._render_class(type(value))}({str(value)!r})"
@@ -0,0 +1,139 @@
+from jambo.parser._validators import TagDiscriminator
+from jambo.registry import parse_pointer
+from jambo.types.json_schema_type import JSONSchema
+
+from pydantic import BaseModel, Discriminator, Field, Tag
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, Any, ForwardRef, Optional, Union, get_origin
+
+
+_NO_TAG = object()
+
+
+def infer_tag_property(
+    sub_properties: list[JSONSchema], context: Optional[JSONSchema]
+) -> Optional[tuple[str, list[str]]]:
+    """
+    Finds a property tagging every branch of a union of objects with a distinct constant,
+    either a `const` or a single value `enum`, required by every branch.
+    :param sub_properties: The schemas of the union branches.
+    :param context: The root schema, used to resolve local references.
+    :return: The name of the tag property and the tag of each branch, or None if there is none.
+    """
+    branches = [_resolve_local_ref(branch, context) for branch in sub_properties]
+    if len(branches) < 2 or any(
+        branch is None or branch.get("type") != "object" for branch in branches
+    ):
+        return None
+
+    for property_name in branches[0].get("properties", {}):  # type: ignore
+        tags = []
+        for branch in branches:
+            if property_name not in branch.get("required", []):  # type: ignore
+                break
+
+            tag_value = _get_tag_value(branch.get("properties", {}).get(property_name))  # type: ignore
+            if tag_value is _NO_TAG:
+                break
+
+            try:
+                tags.append(TagDiscriminator.get_tag(tag_value))
+            except TypeError:
+                break
+        else:
+            if len(set(tags)) == len(tags):
+                return property_name, tags
+
+    return None
+
+
+def build_tagged_union(
+    sub_types: list[tuple[Any, dict]], property_name: str, tags: list[str]
+) -> Optional[Any]:
+    """
+    Builds a union dispatching each value to the branch of its tag.
+    :param sub_types: The type and field properties of each union branch, the types must be models.
+    :param property_name: The name of the tag property.
+    :param tags: The tag of each branch.
+    :return: The tagged union, or None if a branch is not a model.
+    """
+    for branch_type, _ in sub_types:
+        if isinstance(branch_type, ForwardRef):
+            continue
+        if not isinstance(branch_type, type) or not issubclass(branch_type, BaseModel):
+            return None
+
+    # Defaults only apply to the field holding the union, members of a tagged union can't have one
+    tagged_types = [
+        Annotated[
+            branch_type,
+            Field(
+                **{
+                    key: value
+                    for key, value in branch_properties.items()
+                    if key not in ("default", "default_factory")
+                }
+            ),
+            Tag(tag),
+        ]
+        for (branch_type, branch_properties), tag in zip(sub_types, tags)
+    ]
+
+    return Annotated[
+        Union[(*tagged_types,)], Discriminator(TagDiscriminator(property_name))
+    ]
+
+
+def is_tagged_union(field_type: Any) -> bool:
+    """
+    :param field_type: A type built by a parser.
+    :return: Whether the type is a union dispatching values by a discriminator.
+    """
+    if get_origin(field_type) is not Annotated:
+        return False
+
+    return any(
+        isinstance(metadata, Discriminator)
+        or (isinstance(metadata, FieldInfo) and metadata.discriminator is not None)
+        for metadata in field_type.__metadata__
+    )
+
+
+def _resolve_local_ref(
+    properties: JSONSchema, context: Optional[JSONSchema]
+) -> Optional[JSONSchema]:
+    if not isinstance(properties, dict):
+        return None
+
+    if (ref := properties.get("$ref")) is None:
+        return properties
+
+    if context is None or not isinstance(ref, str):
+        return None
+
+    if not ref.startswith("#") or (pointer := parse_pointer(ref[1:])) is None:
+        return None
+
+    target: Any = context
+    for part in pointer:
+        if isinstance(target, list) and part.isdigit():
+            target = target[int(part)] if int(part) < len(target) else None
+            continue
+        if not isinstance(target, dict) or part not in target:
+            return None
+        target = target[part]
+
+    return target
+
+
+def _get_tag_value(properties: Any) -> Any:
+    if not isinstance(properties, dict):
+        return _NO_TAG
+
+    if "const" in properties:
+        return properties["const"]
+
+    if isinstance(enum := properties.get("enum"), list) and len(enum) == 1:
+        return enum[0]
+
+    return _NO_TAG
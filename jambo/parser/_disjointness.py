@@ -0,0 +1,188 @@
+from jambo.parser._discriminator import _NO_TAG, _get_tag_value, _resolve_local_ref
+from jambo.parser._validators import TagDiscriminator
+from jambo.types.json_schema_type import JSONSchema
+
+from typing_extensions import Any, Optional
+
+
+JSON_TYPES = frozenset(
+    ("string", "integer", "number", "boolean", "null", "array", "object")
+)
+
+
+def find_overlapping_branches(
+    sub_properties: list[JSONSchema], context: Optional[JSONSchema]
+) -> list[tuple[int, int]]:
+    """
+    Finds the pairs of union branches a single value could match at the same time.
+
+    Two branches are disjoint when they accept different JSON types, or when both are
+    objects requiring the same property with different constant values. Branches whose
+    types can't be determined are assumed to overlap with every other branch.
+    :param sub_properties: The schemas of the union branches.
+    :param context: The root schema, used to resolve local references.
+    :return: The indexes of every pair of branches that may overlap.
+    """
+    branches = [_resolve_local_ref(branch, context) for branch in sub_properties]
+    branch_types = [
+        get_json_types(branch, context) if branch is not None else None
+        for branch in branches
+    ]
+
+    return [
+        (i, j)
+        for i in range(len(branches))
+        for j in range(i + 1, len(branches))
+        if not _are_disjoint(branches[i], branch_types[i], branches[j], branch_types[j])
+    ]
+
+
+def get_branch_types(
+    sub_properties: list[JSONSchema], context: Optional[JSONSchema]
+) -> list[Optional[list[str]]]:
+    """
+    Gets the JSON types each union branch can accept, to route values by their JSON type.
+    :param sub_properties: The schemas of the union branches.
+    :param context: The root schema, used to resolve local references.
+    :return: The sorted JSON types of each branch, or None for the branches whose types can't be determined.
+    """
+    branch_types = []
+    for branch in sub_properties:
+        types = get_json_types(branch, context) if isinstance(branch, dict) else None
+        branch_types.append(sorted(types) if types is not None else None)
+
+    return branch_types
+
+
+def get_json_types(
+    properties: JSONSchema, context: Optional[JSONSchema], depth: int = 0
+) -> Optional[frozenset[str]]:
+    """
+    Gets the JSON types a schema can accept.
+    :param properties: The schema to inspect.
+    :param context: The root schema, used to resolve local references.
+    :return: The accepted JSON types, or None if they can't be determined.
+    """
+    # Guards against reference cycles, which are treated as unknown types
+    if depth > 32:
+        return None
+
+    types: Optional[frozenset[str]] = None
+
+    if "$ref" in properties:
+        if (target := _resolve_local_ref(properties, context)) is None:
+            return None
+        types = _intersect(types, get_json_types(target, context, depth + 1))
+        if types is None:
+            return None
+
+    if "type" in properties:
+        schema_type = properties["type"]
+        schema_types = [schema_type] if isinstance(schema_type, str) else schema_type
+        types = _intersect(types, frozenset(schema_types) & JSON_TYPES)
+
+    if "const" in properties:
+        types = _intersect(types, frozenset((_get_value_type(properties["const"]),)))
+
+    if isinstance(enum := properties.get("enum"), list):
+        types = _intersect(types, frozenset(map(_get_value_type, enum)))
+
+    for keyword in ("anyOf", "oneOf"):
+        if not isinstance(sub_properties := properties.get(keyword), list):
+            continue
+
+        branch_types = [
+            get_json_types(branch, context, depth + 1)  # type: ignore
+            if isinstance(branch, dict)
+            else None
+            for branch in sub_properties
+        ]
+        if all(branch_type is not None for branch_type in branch_types):
+            types = _intersect(types, frozenset().union(*branch_types))  # type: ignore
+
+    for branch in properties.get("allOf", []):
+        if isinstance(branch, dict):
+            types = _intersect(types, get_json_types(branch, context, depth + 1))
+
+    return types
+
+
+def _are_disjoint(
+    branch: Optional[JSONSchema],
+    branch_types: Optional[frozenset[str]],
+    other: Optional[JSONSchema],
+    other_types: Optional[frozenset[str]],
+) -> bool:
+    if branch is None or other is None or branch_types is None or other_types is None:
+        return False
+
+    if not _types_overlap(branch_types, other_types):
+        return True
+
+    if branch_types == other_types == {"object"}:
+        return _have_distinct_tags(branch, other)
+
+    return False
+
+
+def _types_overlap(types: frozenset[str], other_types: frozenset[str]) -> bool:
+    # Every integer is also a number
+    if "number" in types:
+        types = types | {"integer"}
+    if "number" in other_types:
+        other_types = other_types | {"integer"}
+
+    return not types.isdisjoint(other_types)
+
+
+def _have_distinct_tags(branch: JSONSchema, other: JSONSchema) -> bool:
+    required = set(branch.get("required", [])) & set(other.get("required", []))
+
+    for property_name in required:
+        tag_value = _get_tag_value(branch.get("properties", {}).get(property_name))
+        other_tag_value = _get_tag_value(other.get("properties", {}).get(property_name))
+        if tag_value is _NO_TAG or other_tag_value is _NO_TAG:
+            continue
+
+        try:
+            if TagDiscriminator.get_tag(tag_value) != TagDiscriminator.get_tag(
+                other_tag_value
+            ):
+                return True
+        except TypeError:
+            continue
+
+    return False
+
+
+def _intersect(
+    types: Optional[frozenset[str]], other_types: Optional[frozenset[str]]
+) -> Optional[frozenset[str]]:
+    if types is None:
+        return other_types
+    if other_types is None:
+        return types
+
+    # An integer constraint narrows a number, not the other way around
+    if "integer" in types and "number" in other_types:
+        other_types = other_types | {"integer"}
+    if "integer" in other_types and "number" in types:
+        types = types | {"integer"}
+
+    return types & other_types
+
+
+def _get_value_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
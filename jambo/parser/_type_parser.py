@@ -1,18 +1,69 @@
+from jambo.cache.schema_hash import schema_hash
 from jambo.exceptions import InvalidSchemaException
-from jambo.types.type_parser_options import JSONSchema, TypeParserOptions
+from jambo.parser._discriminator import is_tagged_union
+from jambo.types.type_parser_options import (
+    DeferredCheck,
+    JSONSchema,
+    TypeParserOptions,
+)
+
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import (
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Optional,
+    Self,
+    TypeVar,
+    Unpack,
+    get_args,
+    get_origin,
+)
+
+from abc import ABC, ABCMeta, abstractmethod
+from enum import Enum
+from functools import lru_cache
 
-from pydantic import Field, TypeAdapter
-from typing_extensions import Annotated, Any, ClassVar, Generic, Self, TypeVar, Unpack
 
-from abc import ABC, abstractmethod
+T = TypeVar("T", bound=type)
 
+ParserMatch = tuple[int, type["GenericTypeParser"]]
 
-T = TypeVar("T", bound=type)
+DispatchIndex = dict[str, tuple[Optional[ParserMatch], dict[Any, ParserMatch]]]
+
+# Field attributes that don't take part in the validation of a value
+NON_VALIDATING_ATTRIBUTES = frozenset(
+    {"default", "default_factory", "deprecated", "description", "examples", "title"}
+)
+
+
+class _TypeParserMeta(ABCMeta):
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # Changing the keyword of a parser invalidates the dispatch index
+        if name == "json_schema_type":
+            GenericTypeParser._dispatch_index = None
 
 
-class GenericTypeParser(ABC, Generic[T]):
+class GenericTypeParser(ABC, Generic[T], metaclass=_TypeParserMeta):
+    """
+    Base class of the type parsers.
+
+    Every direct subclass is registered as a parser, in definition order. A schema is parsed
+    by the first registered parser whose `json_schema_type` matches it, either a keyword present
+    in the schema (`allOf`) or a keyword and its value (`type:string`). The built-in precedence is:
+    allOf, anyOf, type:array, type:boolean, const, enum, type:number, type:integer,
+    type:null, type:object, oneOf, $ref, type:string.
+    Use `register_parser` to register a parser at a given precedence.
+    """
+
     json_schema_type: ClassVar[str]
 
+    _registered_parsers: ClassVar[list[type["GenericTypeParser"]]] = []
+    _dispatch_index: ClassVar[Optional[DispatchIndex]] = None
+
     type_mappings: dict[str, str] = {}
 
     default_mappings = {
@@ -23,6 +74,49 @@ class GenericTypeParser(ABC, Generic[T]):
         "deprecated": "deprecated",
     }
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if GenericTypeParser in cls.__bases__:
+            GenericTypeParser.register_parser(cls)
+
+    @staticmethod
+    def register_parser(
+        parser: type["GenericTypeParser"], precedence: Optional[int] = None
+    ) -> None:
+        """
+        Registers a type parser, replacing its previous registration if any.
+        :param parser: The parser class, its `json_schema_type` selects the schemas it parses.
+        :param precedence: The position of the parser among the registered ones, 0 being tried first.
+            The parser is tried last if not provided.
+        """
+        parsers = GenericTypeParser._registered_parsers
+        if parser in parsers:
+            parsers.remove(parser)
+
+        if precedence is None:
+            parsers.append(parser)
+        else:
+            parsers.insert(precedence, parser)
+
+        GenericTypeParser._dispatch_index = None
+
+    @staticmethod
+    def unregister_parser(parser: type["GenericTypeParser"]) -> None:
+        """
+        Removes a type parser from the registered ones.
+        :param parser: The parser class to remove.
+        """
+        GenericTypeParser._registered_parsers.remove(parser)
+        GenericTypeParser._dispatch_index = None
+
+    @staticmethod
+    def get_registered_parsers() -> tuple[type["GenericTypeParser"], ...]:
+        """
+        :return: The registered parsers, in precedence order.
+        """
+        return tuple(GenericTypeParser._registered_parsers)
+
     @abstractmethod
     def from_properties_impl(
         self, name: str, properties: JSONSchema, **kwargs: Unpack[TypeParserOptions]
@@ -49,18 +143,50 @@ class GenericTypeParser(ABC, Generic[T]):
             name, properties, **kwargs
         )
 
-        if not self._validate_default(parsed_type, parsed_properties):
+        if kwargs.get("profile", "strict") == "fast":
+            # The checks are skipped, or deferred if a list to collect them is provided
+            if (deferred_checks := kwargs.get("deferred_checks")) is not None:
+                deferred_checks.append(
+                    DeferredCheck(name, parsed_type, parsed_properties)
+                )
+            return parsed_type, parsed_properties
+
+        self._check_value_properties(name, parsed_type, parsed_properties)
+
+        return parsed_type, parsed_properties
+
+    @staticmethod
+    def run_deferred_checks(
+        deferred_checks: list[DeferredCheck],
+    ) -> list[InvalidSchemaException]:
+        """
+        Runs the default and examples checks skipped by a build with the `fast` profile.
+        :param deferred_checks: The checks collected during the build.
+        :return: The problems found, one per invalid field.
+        """
+        errors = []
+        for name, field_type, field_properties in deferred_checks:
+            try:
+                GenericTypeParser._check_value_properties(
+                    name, field_type, field_properties
+                )
+            except InvalidSchemaException as err:
+                errors.append(err)
+
+        return errors
+
+    @staticmethod
+    def _check_value_properties(name: str, field_type: Any, field_prop: dict) -> None:
+        if not GenericTypeParser._validate_default(field_type, field_prop):
             raise InvalidSchemaException(
                 "Default value is not valid", invalid_field=name
             )
 
-        if not self._validate_examples(parsed_type, parsed_properties):
+        if not GenericTypeParser._validate_examples(field_type, field_prop):
             raise InvalidSchemaException(
                 "Examples values are not valid", invalid_field=name
             )
 
-        return parsed_type, parsed_properties
-
     @classmethod
     def type_from_properties(
         cls, name: str, properties: JSONSchema, **kwargs: Unpack[TypeParserOptions]
@@ -74,16 +200,68 @@ class GenericTypeParser(ABC, Generic[T]):
         :return: A tuple containing the type and its properties.
         """
 
-        parser = cls._get_impl(cls._normalize_properties(properties))
+        properties = cls._normalize_properties(properties)
+        parser = cls._get_impl(properties)
+
+        # References are already shared by name through the reference cache
+        interned_types = kwargs.get("interned_types")
+        if interned_types is None or parser.json_schema_type == "$ref":
+            return parser().from_properties(name=name, properties=properties, **kwargs)
+
+        # References relative to the document mean something else in each document of a batch
+        document = None
+        if (
+            schema_index := kwargs.get("schema_index")
+        ) is not None and _refers_to_document(properties):
+            document = schema_index.document_hash
+
+        # Types are interned as required, the properties of optional fields are derived
+        key = schema_hash(
+            {
+                "schema": properties,
+                "base_uri": kwargs.get("base_uri"),
+                "document": document,
+            }
+        )
+        if (interned := interned_types.get(key)) is None:
+            required_properties = kwargs.copy()
+            required_properties["required"] = True
+            interned = parser().from_properties(
+                name=name, properties=properties, **required_properties
+            )
+            interned_types[key] = interned
+
+        interned_type, interned_properties = interned
+        if kwargs.get("required", False):
+            return interned_type, interned_properties.copy()
+
+        return cls._as_optional(interned_type, interned_properties)
+
+    @staticmethod
+    def _as_optional(field_type: Any, field_prop: dict) -> tuple[Any, dict]:
+        """
+        Derives the type and properties of an optional field from those of a required one.
+        :param field_type: The type built for a required field.
+        :param field_prop: The properties built for a required field.
+        :return: A tuple containing the type and properties of the optional field.
+        """
+        if "default" in field_prop or "default_factory" in field_prop:
+            return field_type, field_prop.copy()
+
+        # Tagged unions can't hold the None default of an optional field by themselves
+        if is_tagged_union(field_type):
+            field_type = Optional[field_type]
 
-        return parser().from_properties(name=name, properties=properties, **kwargs)
+        return field_type, {**field_prop, "default": None}
 
     @staticmethod
     def _normalize_properties(properties: JSONSchema) -> JSONSchema:
         """
         Normalizes the properties dictionary to ensure consistent structure.
+        The given properties are not modified, a normalized copy is returned instead.
         :param properties: The properties to be normalized.
         """
+        properties = properties.copy()
         type_value = properties.pop("type", None)
 
         if isinstance(type_value, str):
@@ -108,18 +286,53 @@ class GenericTypeParser(ABC, Generic[T]):
 
     @classmethod
     def _get_impl(cls, properties: JSONSchema) -> type[Self]:
-        for subcls in cls.__subclasses__():
-            schema_type, schema_value = subcls._get_schema_type()
+        best_match: Optional[ParserMatch] = None
 
-            if schema_type not in properties:
+        for keyword, (
+            any_value_match,
+            value_matches,
+        ) in cls._get_dispatch_index().items():
+            if keyword not in properties:
                 continue
 
-            if schema_value is None or schema_value == properties[schema_type]:  # type: ignore
-                return subcls
+            try:
+                value_match = value_matches.get(properties[keyword])  # type: ignore
+            except TypeError:
+                # Unhashable values never match a parser value
+                value_match = None
 
-        raise InvalidSchemaException(
-            "No suitable type parser found", invalid_field=str(properties)
-        )
+            for match in (any_value_match, value_match):
+                if match is not None and (best_match is None or match < best_match):
+                    best_match = match
+
+        if best_match is None:
+            raise InvalidSchemaException(
+                "No suitable type parser found", invalid_field=str(properties)
+            )
+
+        return best_match[1]  # type: ignore
+
+    @staticmethod
+    def _get_dispatch_index() -> DispatchIndex:
+        """
+        Gets the index mapping each keyword, and each of its values, to the parser with
+        the highest precedence for it. The index is rebuilt after the parsers change.
+        """
+        if (index := GenericTypeParser._dispatch_index) is not None:
+            return index
+
+        index = {}
+        for order, parser in enumerate(GenericTypeParser._registered_parsers):
+            keyword, value = parser._get_schema_type()
+            any_value_match, value_matches = index.setdefault(keyword, (None, {}))
+
+            if value is not None:
+                value_matches.setdefault(value, (order, parser))
+            elif any_value_match is None:
+                index[keyword] = ((order, parser), value_matches)
+
+        GenericTypeParser._dispatch_index = index
+        return index
 
     @classmethod
     def _get_schema_type(cls) -> tuple[str, str | None]:
@@ -139,7 +352,7 @@ class GenericTypeParser(ABC, Generic[T]):
         self, properties, **kwargs: Unpack[TypeParserOptions]
     ) -> dict[str, Any]:
         if not kwargs.get("required", False):
-            properties["default"] = properties.get("default", None)
+            properties = {**properties, "default": properties.get("default", None)}
 
         mappings = self.default_mappings | self.type_mappings
 
@@ -157,7 +370,9 @@ class GenericTypeParser(ABC, Generic[T]):
         if value is None:
             return True
 
-        return GenericTypeParser._is_valid_value(field_type, field_prop, value)
+        return GenericTypeParser._is_valid_value(
+            GenericTypeParser._get_type_adapter(field_type, field_prop), value
+        )
 
     @staticmethod
     def _validate_examples(field_type: T, field_prop: dict) -> bool:
@@ -169,17 +384,87 @@ class GenericTypeParser(ABC, Generic[T]):
         if not isinstance(examples, list):
             return False
 
-        return all(
-            GenericTypeParser._is_valid_value(field_type, field_prop, e)
-            for e in examples
+        # Every example is checked in a single validation call
+        return GenericTypeParser._is_valid_value(
+            GenericTypeParser._get_type_adapter(field_type, field_prop, many=True),
+            examples,
         )
 
     @staticmethod
-    def _is_valid_value(field_type: T, field_prop: dict, value: Any) -> bool:
+    def _is_valid_value(adapter: TypeAdapter, value: Any) -> bool:
         try:
-            field = Annotated[field_type, Field(**field_prop)]  # type: ignore
-            TypeAdapter(field).validate_python(value)
+            adapter.validate_python(value)
         except Exception as _:
             return False
 
         return True
+
+    @staticmethod
+    def _get_type_adapter(
+        field_type: T, field_prop: dict, many: bool = False
+    ) -> TypeAdapter:
+        """
+        Gets the adapter validating values of a field, or lists of them if `many` is set.
+        Adapters are cached by type and validation constraints, except for types depending on
+        generated models or enums, which carry their own validators and must not be kept alive.
+        """
+        constraints = tuple(
+            sorted(
+                (key, value)
+                for key, value in field_prop.items()
+                if key not in NON_VALIDATING_ATTRIBUTES
+            )
+        )
+
+        if _is_static_type(field_type):
+            try:
+                return _get_cached_type_adapter(field_type, constraints, many)
+            except TypeError:
+                # Unhashable constraints can't be cached
+                pass
+
+        return _build_type_adapter(field_type, constraints, many)
+
+
+def _build_type_adapter(
+    field_type: Any, constraints: tuple[tuple[str, Any], ...], many: bool
+) -> TypeAdapter:
+    field = Annotated[field_type, Field(**dict(constraints))]  # type: ignore
+    return TypeAdapter(list[field] if many else field)  # type: ignore
+
+
+_get_cached_type_adapter = lru_cache(maxsize=1024)(_build_type_adapter)
+
+
+def _is_static_type(tp: Any) -> bool:
+    """
+    Checks whether a type only depends on builtin types and literal values, so it can be
+    cached without holding generated models or validators alive.
+    """
+    if isinstance(tp, type):
+        return not issubclass(tp, (BaseModel, Enum))
+
+    if tp is None or isinstance(tp, (str, int, float, bool, bytes)):
+        return True
+
+    if get_origin(tp) is None:
+        return False
+
+    return all(_is_static_type(arg) for arg in get_args(tp))
+
+
+def _refers_to_document(schema: Any) -> bool:
+    """
+    :param schema: A subschema, or any value found in one.
+    :return: Whether it holds a reference relative to its document, such as `#/$defs/...`.
+    """
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#"):
+            return True
+        return any(_refers_to_document(value) for value in schema.values())
+
+    if isinstance(schema, list):
+        return any(_refers_to_document(value) for value in schema)
+
+    return False
@@ -0,0 +1,386 @@
+# Runtime validators used by the generated types.
+#
+# This module must only depend on pydantic and typing_extensions, since its source is
+# embedded as-is in the modules emitted by `jambo.codegen`.
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing_extensions import Any, Optional, Union
+
+import json
+from enum import Enum
+
+
+_SCALAR_TYPES = ("null", "boolean", "integer", "number", "string")
+
+
+def get_route(
+    branch_types: list[Optional[list[str]]], json_type: Optional[str]
+) -> list[int]:
+    """
+    Gets the indexes of the branches accepting a value of the given JSON type.
+    Branches whose JSON types are unknown accept every value, and every branch accepts
+    the values that are not native JSON values.
+    """
+    # Integers and numbers are both accepted by integer and number branches
+    accepted_types = {json_type}
+    if json_type in ("integer", "number"):
+        accepted_types = {"integer", "number"}
+
+    return [
+        i
+        for i, types in enumerate(branch_types)
+        if json_type is None or types is None or not accepted_types.isdisjoint(types)
+    ]
+
+
+class OneOfValidator:
+    """
+    Validates that a value matches exactly one of the given types, in a single pass.
+
+    It is meant to be used as a wrap validator: the value is validated once against every
+    type and the result of the only matching type is returned as the validated value,
+    stopping as soon as a second match proves the value invalid.
+
+    The validator of each type is compiled on the first validation and reused afterwards,
+    so types referring to models that are not built yet can still be given.
+    """
+
+    def __init__(self, subfield_types: list[Any]) -> None:
+        self.subfield_types = subfield_types
+        self._adapters: Optional[list[TypeAdapter]] = None
+
+    @property
+    def adapters(self) -> list[TypeAdapter]:
+        if self._adapters is None:
+            self._adapters = [
+                TypeAdapter(field_type) for field_type in self.subfield_types
+            ]
+        return self._adapters
+
+    def __call__(self, value: Any, handler: Any) -> Any:
+        matched = False
+        result = None
+
+        for adapter in self.adapters:
+            try:
+                branch_result = adapter.validate_python(value)
+            except ValidationError:
+                continue
+
+            if matched:
+                raise ValueError(
+                    "Value matches multiple oneOf schemas, exactly one expected"
+                )
+
+            matched = True
+            result = branch_result
+
+        if not matched:
+            raise ValueError("Value does not match any of the oneOf schemas")
+
+        return result
+
+
+class RoutedUnionValidator:
+    """
+    Validates a value against the union branches accepting its JSON type only.
+
+    It is meant to be used as a wrap validator: the JSON type of the value selects the
+    branches to try from a dispatch table, the other branches are never attempted.
+    Branches whose JSON types are unknown are tried for every value, and values that are
+    not native JSON values, such as dates, are tried against every branch.
+
+    The branches of each JSON type are validated as a union, or by a `OneOfValidator` when
+    `one_of` is set. Their validators are compiled the first time a value of that type is seen.
+    """
+
+    def __init__(
+        self,
+        subfield_types: list[Any],
+        branch_types: list[Optional[list[str]]],
+        one_of: bool = False,
+    ) -> None:
+        self.subfield_types = subfield_types
+        self.branch_types = branch_types
+        self.one_of = one_of
+        self._routes: dict[Optional[str], Any] = {}
+
+    @staticmethod
+    def get_json_type(value: Any) -> Optional[str]:
+        if value is None:
+            return "null"
+        if isinstance(value, bool):
+            return "boolean"
+        if isinstance(value, int) and not isinstance(value, Enum):
+            return "integer"
+        if isinstance(value, float):
+            return "number"
+        if isinstance(value, str) and not isinstance(value, Enum):
+            return "string"
+        if isinstance(value, (list, tuple)):
+            return "array"
+        if isinstance(value, (dict, BaseModel)):
+            return "object"
+        return None
+
+    def get_route(self, json_type: Optional[str]) -> list[int]:
+        """
+        Gets the indexes of the branches a value of the given JSON type is tried against.
+        """
+        return get_route(self.branch_types, json_type)
+
+    def __call__(self, value: Any, handler: Any) -> Any:
+        json_type = self.get_json_type(value)
+
+        if (route := self._routes.get(json_type)) is None:
+            route = self._routes[json_type] = self._compile_route(json_type)
+
+        if isinstance(route, OneOfValidator):
+            return route(value, handler)
+        return route.validate_python(value)
+
+    def _compile_route(self, json_type: Optional[str]) -> Any:
+        route_types = [self.subfield_types[i] for i in self.get_route(json_type)]
+
+        if not route_types:
+            return _NoMatchValidator(json_type)
+        if self.one_of:
+            return OneOfValidator(route_types)
+        if len(route_types) == 1:
+            return TypeAdapter(route_types[0])
+        return TypeAdapter(Union[(*route_types,)])  # type: ignore
+
+
+class _NoMatchValidator:
+    def __init__(self, json_type: Optional[str]) -> None:
+        self.json_type = json_type
+
+    def validate_python(self, value: Any) -> Any:
+        raise ValueError(
+            f"No schema of the union accepts a value of type {self.json_type}"
+        )
+
+
+class AdaptiveUnionValidator:
+    """
+    Validates a value against union branches ordered by how often each one matched.
+
+    It is meant to be used as a wrap validator: the number of values each branch matched is
+    counted, and every `reorder_interval` validations the branches are reordered, the most
+    frequently matched first. The order only decides which branches are tried first, never
+    which one is used, so the validated value doesn't depend on past validations.
+
+    Branches are first tried in strict mode, and only the branches accepting the JSON type of
+    the value are tried when `branch_types` is given. For anyOf unions the first branch of the
+    schema keeping the type of the value is used, found by trying the branches before the first
+    one matching in the adaptive order. For oneOf unions (`one_of` set) the value must match
+    exactly one branch, found by trying the branches after the first one matching. When
+    `overlapping` is given, only the branches that may overlap with the matching one are tried
+    after it, the others can't match the same value. When no branch matches in strict mode, the
+    branches are tried in lax mode in the order of the schema, as the `smart` mode would.
+
+    The counters are not synchronized, so they are approximate when validating concurrently.
+    """
+
+    def __init__(
+        self,
+        subfield_types: list[Any],
+        one_of: bool = False,
+        branch_types: Optional[list[Optional[list[str]]]] = None,
+        reorder_interval: int = 1000,
+        overlapping: Optional[list[tuple[int, int]]] = None,
+    ) -> None:
+        self.subfield_types = subfield_types
+        self.one_of = one_of
+        self.branch_types = branch_types
+        self.reorder_interval = reorder_interval
+        self.overlapping = overlapping
+
+        self._adapters: Optional[list[TypeAdapter]] = None
+        self._overlaps: Optional[list[set[int]]] = None
+        if overlapping is not None:
+            self._overlaps = [set() for _ in subfield_types]
+            for i, j in overlapping:
+                self._overlaps[i].add(j)
+                self._overlaps[j].add(i)
+        self._routes: dict[Optional[str], set[int]] = {}
+        self._order = list(range(len(subfield_types)))
+        self._counts = [0] * len(subfield_types)
+        self._validations = 0
+
+    @property
+    def adapters(self) -> list[TypeAdapter]:
+        if self._adapters is None:
+            self._adapters = [
+                TypeAdapter(field_type) for field_type in self.subfield_types
+            ]
+        return self._adapters
+
+    @property
+    def counts(self) -> list[int]:
+        """
+        :return: The number of values matched by each branch, in the order of the schema.
+        """
+        return list(self._counts)
+
+    @property
+    def order(self) -> list[int]:
+        """
+        :return: The indexes of the branches, in the order they are tried.
+        """
+        return list(self._order)
+
+    def reset(self) -> None:
+        """
+        Clears the counters and restores the order of the schema.
+        """
+        self._order = list(range(len(self.subfield_types)))
+        self._counts = [0] * len(self.subfield_types)
+        self._validations = 0
+
+    def _may_overlap(self, i: int, j: int) -> bool:
+        return self._overlaps is None or j in self._overlaps[i]
+
+    def __call__(self, value: Any, handler: Any) -> Any:
+        self._validations += 1
+        if self._validations % self.reorder_interval == 0:
+            counts = self._counts
+            self._order = sorted(self._order, key=lambda i: -counts[i])
+
+        json_type = RoutedUnionValidator.get_json_type(value)
+
+        if (route := self._routes.get(json_type)) is None:
+            route = self._routes[json_type] = set(
+                get_route(self.branch_types, json_type)
+                if self.branch_types is not None
+                else range(len(self.subfield_types))
+            )
+
+        if self.one_of:
+            matched, result = self._validate_one_of(value, route)
+        else:
+            matched, result = self._validate_any_of(value, json_type, route)
+
+        self._counts[matched] += 1
+        return result
+
+    def _validate_any_of(
+        self, value: Any, json_type: Optional[str], route: set[int]
+    ) -> tuple[int, Any]:
+        adapters = self.adapters
+        tried: set[int] = set()
+
+        def validate_strict(i: int) -> tuple[bool, Any]:
+            tried.add(i)
+            try:
+                result = adapters[i].validate_python(value, strict=True)
+            except ValidationError:
+                return False, None
+            # Strict validation still converts some values, such as integers to floats
+            return json_type not in _SCALAR_TYPES or type(result) is type(value), result
+
+        for i in self._order:
+            if i not in route:
+                continue
+
+            exact, result = validate_strict(i)
+            if not exact:
+                continue
+
+            # An earlier branch of the schema takes precedence over the adaptive order
+            for j in range(i):
+                if (
+                    j in route
+                    and j not in tried
+                    and self._may_overlap(i, j)
+                    and (earlier := validate_strict(j))[0]
+                ):
+                    return j, earlier[1]
+            return i, result
+
+        for i, adapter in enumerate(adapters):
+            try:
+                return i, adapter.validate_python(value)
+            except ValidationError:
+                continue
+
+        raise ValueError("Value does not match any of the anyOf schemas")
+
+    def _validate_one_of(self, value: Any, route: set[int]) -> tuple[int, Any]:
+        adapters = self.adapters
+
+        for strict, branches in (
+            (True, [i for i in self._order if i in route]),
+            (False, range(len(adapters))),
+        ):
+            matched: Optional[int] = None
+            result = None
+
+            for i in branches:
+                # Branches disjoint from the matching one can't match in strict mode
+                if strict and matched is not None and not self._may_overlap(matched, i):
+                    continue
+
+                try:
+                    branch_result = adapters[i].validate_python(value, strict=strict)
+                except ValidationError:
+                    continue
+
+                if matched is not None:
+                    raise ValueError(
+                        "Value matches multiple oneOf schemas, exactly one expected"
+                    )
+                matched, result = i, branch_result
+
+            if matched is not None:
+                return matched, result
+
+        raise ValueError("Value does not match any of the oneOf schemas")
+
+
+class ConstValidator:
+    """
+    Validates that a value is equal to a constant value.
+    """
+
+    def __init__(self, const_value: Any) -> None:
+        self.const_value = const_value
+
+    def __call__(self, value: Any) -> Any:
+        if value != self.const_value:
+            raise ValueError(
+                f"Value must be equal to the constant value: {self.const_value}"
+            )
+        return value
+
+
+class TagDiscriminator:
+    """
+    Extracts the tag of a value from its tag property, for tagged unions of objects.
+    The tag of each union member is built from its tag value with `get_tag`.
+    """
+
+    def __init__(self, property_name: str) -> None:
+        self.property_name = property_name
+        # Used by pydantic to name the tagged union in errors
+        self.__name__ = f"tag:{property_name}"
+
+    @staticmethod
+    def get_tag(tag_value: Any) -> str:
+        if isinstance(tag_value, Enum):
+            tag_value = tag_value.value
+        return json.dumps(tag_value, sort_keys=True)
+
+    def __call__(self, value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            if self.property_name not in value:
+                return None
+            tag_value = value[self.property_name]
+        elif hasattr(value, self.property_name):
+            tag_value = getattr(value, self.property_name)
+        else:
+            return None
+
+        try:
+            return self.get_tag(tag_value)
+        except TypeError:
+            return None
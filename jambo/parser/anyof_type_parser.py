@@ -1,9 +1,15 @@
 from jambo.exceptions import InvalidSchemaException
+from jambo.parser._discriminator import build_tagged_union, infer_tag_property
+from jambo.parser._disjointness import (
+    find_overlapping_branches,
+    get_branch_types,
+)
 from jambo.parser._type_parser import GenericTypeParser
+from jambo.parser._validators import AdaptiveUnionValidator, RoutedUnionValidator
 from jambo.types.type_parser_options import TypeParserOptions
 
-from pydantic import Field
-from typing_extensions import Annotated, Union, Unpack
+from pydantic import Field, WrapValidator
+from typing_extensions import Annotated, Any, Optional, Union, Unpack
 
 
 class AnyOfTypeParser(GenericTypeParser):
@@ -42,12 +48,56 @@ class AnyOfTypeParser(GenericTypeParser):
         # By defining the type as Union of Annotated type we can use the Field validator
         # to enforce the constraints of each union type when needed.
         # We use Annotated to attach the Field validators to the type.
-        field_types = []
+        # Types without constraints are left bare, so unions such as `Optional[str]`
+        # stay on the simple union validators of pydantic-core.
+        field_types: list[Any] = []
         for subType, subProp in sub_types:
             default_value = subProp.pop("default", None)
+            if default_value is None and not subProp:
+                field_types.append(subType)
+                continue
+
             if default_value is None:
                 default_value = ...
 
             field_types.append(Annotated[subType, Field(default_value, **subProp)])
 
+        # Objects tagged by a distinct constant property are dispatched by their tag,
+        # made optional when the field defaults to None, which the tags can't hold
+        tag_property = infer_tag_property(sub_properties, kwargs.get("context"))
+        if tag_property is not None:
+            tagged_type = build_tagged_union(sub_types, *tag_property)
+            if tagged_type is not None:
+                if (
+                    not kwargs.get("required", False)
+                    and mapped_properties.get("default") is None
+                ):
+                    return Optional[tagged_type], mapped_properties  # type: ignore
+                return tagged_type, mapped_properties
+
+        union_mode = kwargs.get("union_mode", "smart")
+
+        if union_mode == "routed" and len(field_types) > 1:
+            branch_types = get_branch_types(sub_properties, kwargs.get("context"))
+            return Annotated[
+                Union[(*field_types,)],
+                WrapValidator(RoutedUnionValidator(field_types, branch_types)),
+            ], mapped_properties
+
+        if union_mode == "adaptive" and len(field_types) > 1:
+            branch_types = get_branch_types(sub_properties, kwargs.get("context"))
+            overlapping = find_overlapping_branches(
+                sub_properties, kwargs.get("context")
+            )
+            return Annotated[
+                Union[(*field_types,)],
+                WrapValidator(
+                    AdaptiveUnionValidator(
+                        field_types,
+                        branch_types=branch_types,
+                        overlapping=overlapping,
+                    )
+                ),
+            ], mapped_properties
+
         return Union[(*field_types,)], mapped_properties
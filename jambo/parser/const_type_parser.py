@@ -1,10 +1,11 @@
 from jambo.exceptions import InvalidSchemaException
 from jambo.parser._type_parser import GenericTypeParser
+from jambo.parser._validators import ConstValidator
 from jambo.types.json_schema_type import JSONSchemaNativeTypes
 from jambo.types.type_parser_options import TypeParserOptions
 
 from pydantic import AfterValidator
-from typing_extensions import Annotated, Any, Literal, Unpack
+from typing_extensions import Annotated, Literal, Unpack
 
 
 class ConstTypeParser(GenericTypeParser):
@@ -47,11 +48,6 @@ class ConstTypeParser(GenericTypeParser):
             return Literal[const_value]
         except TypeError:
             # Non-hashable type (like list, dict), use validator approach
-            def _validate_const_value(value: Any) -> Any:
-                if value != const_value:
-                    raise ValueError(
-                        f"Value must be equal to the constant value: {const_value}"
-                    )
-                return value
-
-            return Annotated[type(const_value), AfterValidator(_validate_const_value)]
+            return Annotated[
+                type(const_value), AfterValidator(ConstValidator(const_value))
+            ]
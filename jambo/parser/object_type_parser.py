@@ -30,16 +30,21 @@ class ObjectTypeParser(GenericTypeParser):
         if (
             default_value := type_properties.pop("default", None)
         ) is not None or not kwargs.get("required", False):
-            type_properties["default_factory"] = (
-                lambda: type_parsing.model_validate(default_value)
+            type_properties["default_factory"] = lambda: (
+                type_parsing.model_validate(default_value)
                 if default_value is not None
                 else None
             )
 
         if (example_values := type_properties.pop("examples", None)) is not None:
-            type_properties["examples"] = [
-                type_parsing.model_validate(example) for example in example_values
-            ]
+            # The fast profile keeps the raw examples instead of validating them
+            type_properties["examples"] = (
+                example_values
+                if kwargs.get("profile", "strict") == "fast"
+                else [
+                    type_parsing.model_validate(example) for example in example_values
+                ]
+            )
 
         return type_parsing, type_properties
 
@@ -74,6 +79,9 @@ class ObjectTypeParser(GenericTypeParser):
             return model
 
         model_config = ConfigDict(validate_assignment=True)
+        if kwargs.get("lazy", False):
+            # Defers the core schema build of the model until its first use
+            model_config["defer_build"] = True
         fields = cls._parse_properties(name, properties, required_keys, **kwargs)
 
         model = create_model(
@@ -1,9 +1,23 @@
 from jambo.exceptions import InvalidSchemaException
+from jambo.parser._discriminator import build_tagged_union, infer_tag_property
+from jambo.parser._disjointness import (
+    find_overlapping_branches,
+    get_branch_types,
+)
 from jambo.parser._type_parser import GenericTypeParser
-from jambo.types.type_parser_options import TypeParserOptions
+from jambo.parser._validators import (
+    AdaptiveUnionValidator,
+    OneOfValidator,
+    RoutedUnionValidator,
+)
+from jambo.types.type_parser_options import (
+    JSONSchema,
+    SlowUnion,
+    TypeParserOptions,
+)
 
-from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter, ValidationError
-from typing_extensions import Annotated, Any, Union, Unpack, get_args
+from pydantic import BaseModel, Field, WrapValidator
+from typing_extensions import Annotated, Any, Optional, Union, Unpack, get_args
 
 
 Annotation = Annotated[Any, ...]
@@ -49,8 +63,39 @@ class OneOfTypeParser(GenericTypeParser):
             validated_type = self._build_type_one_of_with_discriminator(
                 subfield_types, discriminator
             )
+        elif (
+            tagged_type := self._build_type_one_of_with_tags(
+                properties["oneOf"],
+                sub_types,
+                mapped_properties.get("default"),
+                **kwargs,
+            )
+        ) is not None:
+            validated_type = tagged_type
         else:
-            validated_type = self._build_type_one_of_with_func(subfield_types)
+            overlapping = find_overlapping_branches(
+                properties["oneOf"], kwargs.get("context")
+            )
+            if overlapping and (slow_unions := kwargs.get("slow_unions")) is not None:
+                slow_unions.append(SlowUnion(name, overlapping))
+
+            if kwargs.get("union_mode", "smart") == "routed":
+                validated_type = self._build_type_one_of_routed(
+                    subfield_types,
+                    get_branch_types(properties["oneOf"], kwargs.get("context")),
+                    one_of=bool(overlapping),
+                )
+            elif kwargs.get("union_mode", "smart") == "adaptive":
+                validated_type = self._build_type_one_of_adaptive(
+                    subfield_types,
+                    get_branch_types(properties["oneOf"], kwargs.get("context")),
+                    overlapping,
+                )
+            elif not overlapping:
+                # Disjoint branches can match at most once, so the union alone enforces oneOf
+                validated_type = Union[(*subfield_types,)]
+            else:
+                validated_type = self._build_type_one_of_with_func(subfield_types)
 
         return validated_type, mapped_properties
 
@@ -86,29 +131,80 @@ class OneOfTypeParser(GenericTypeParser):
 
         return Annotated[Union[(*subfield_types,)], Field(discriminator=property_name)]
 
+    @staticmethod
+    def _build_type_one_of_with_tags(
+        sub_properties: list[JSONSchema],
+        sub_types: list[tuple[Any, dict]],
+        default: Any,
+        **kwargs: Unpack[TypeParserOptions],
+    ) -> Annotation | None:
+        """
+        Build a tagged union when every branch is an object tagged by a distinct constant property.
+        Exclusivity is guaranteed by the distinct tags, so no oneOf validation function is needed.
+        """
+        if (
+            tag_property := infer_tag_property(sub_properties, kwargs.get("context"))
+        ) is None:
+            return None
+
+        tagged_type = build_tagged_union(sub_types, *tag_property)
+
+        # Tagged unions can't hold the None default of an optional field by themselves
+        if (
+            tagged_type is not None
+            and not kwargs.get("required", False)
+            and default is None
+        ):
+            return Optional[tagged_type]  # type: ignore
+
+        return tagged_type
+
     @staticmethod
     def _build_type_one_of_with_func(subfield_types: list[Annotation]) -> Annotation:
         """
         Build a type with a validation function for the oneOf constraint.
+        The validation function replaces the validation of the union, which is only kept
+        for the JSON Schema and the serialization of the type.
         """
+        return Annotated[
+            Union[(*subfield_types,)], WrapValidator(OneOfValidator(subfield_types))
+        ]
 
-        def validate_one_of(value: Any) -> Any:
-            matched_count = 0
-
-            for field_type in subfield_types:
-                try:
-                    TypeAdapter(field_type).validate_python(value)
-                    matched_count += 1
-                except ValidationError:
-                    continue
-
-            if matched_count == 0:
-                raise ValueError("Value does not match any of the oneOf schemas")
-            elif matched_count > 1:
-                raise ValueError(
-                    "Value matches multiple oneOf schemas, exactly one expected"
-                )
-
-            return value
+    @staticmethod
+    def _build_type_one_of_routed(
+        subfield_types: list[Annotation],
+        branch_types: list[Optional[list[str]]],
+        one_of: bool,
+    ) -> Annotation:
+        """
+        Build a type validating each value only against the branches accepting its JSON type.
+        Exactly one of those branches must match when `one_of` is set, the other branches are
+        known not to overlap with them otherwise.
+        """
+        return Annotated[
+            Union[(*subfield_types,)],
+            WrapValidator(RoutedUnionValidator(subfield_types, branch_types, one_of)),
+        ]
 
-        return Annotated[Union[(*subfield_types,)], BeforeValidator(validate_one_of)]
+    @staticmethod
+    def _build_type_one_of_adaptive(
+        subfield_types: list[Annotation],
+        branch_types: list[Optional[list[str]]],
+        overlapping: list[tuple[int, int]],
+    ) -> Annotation:
+        """
+        Build a type trying the most frequently matched branches first.
+        Only the branches accepting the JSON type of a value are tried in strict mode, and
+        only the branches overlapping with the first one matching are tried after it.
+        """
+        return Annotated[
+            Union[(*subfield_types,)],
+            WrapValidator(
+                AdaptiveUnionValidator(
+                    subfield_types,
+                    one_of=True,
+                    branch_types=branch_types,
+                    overlapping=overlapping,
+                )
+            ),
+        ]
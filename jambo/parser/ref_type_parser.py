@@ -1,10 +1,12 @@
 from jambo.exceptions import InternalAssertionException, InvalidSchemaException
 from jambo.parser import GenericTypeParser
+from jambo.parser._discriminator import is_tagged_union
+from jambo.registry import SchemaIndex
 from jambo.types import RefCacheDict
 from jambo.types.json_schema_type import JSONSchema
 from jambo.types.type_parser_options import TypeParserOptions
 
-from typing_extensions import ForwardRef, Literal, Union, Unpack
+from typing_extensions import ForwardRef, Literal, Optional, Union, Unpack
 
 
 RefType = Union[type, ForwardRef]
@@ -36,19 +38,88 @@ class RefTypeParser(GenericTypeParser):
 
         mapped_properties = self.mappings_properties_builder(properties, **kwargs)
 
-        ref_strategy, ref_name, ref_property = self._examine_ref_strategy(
-            name, properties, **kwargs
+        # The document is indexed once, then passed along to resolve every other reference
+        if "schema_index" not in kwargs:
+            kwargs["schema_index"] = SchemaIndex(kwargs["context"])
+
+        ref_strategy, ref_name, ref_property, resource_uri, ref_index = (
+            self._examine_ref_strategy(name, properties, **kwargs)
+        )
+
+        ref = self.parse_target(
+            ref_name,
+            ref_property,
+            resource_uri,
+            ref_index,
+            ref_strategy=ref_strategy,
+            **kwargs,
         )
 
+        # Tagged unions can't serialize the None default of an optional field
+        if (
+            not kwargs.get("required", False)
+            and mapped_properties.get("default") is None
+            and is_tagged_union(ref)
+        ):
+            return Optional[ref], mapped_properties  # type: ignore
+
+        return ref, mapped_properties
+
+    def parse_target(
+        self,
+        ref_name: str,
+        ref_property: JSONSchema,
+        resource_uri: str,
+        ref_index: SchemaIndex,
+        ref_strategy: RefStrategy = "def_ref",
+        **kwargs: Unpack[TypeParserOptions],
+    ) -> RefType:
+        """
+        Gets the type of a referenced subschema from the reference cache, building it on a miss.
+        :param ref_name: The name of the type of the subschema.
+        :param ref_property: The referenced subschema.
+        :param resource_uri: The URI of the resource holding the subschema.
+        :param ref_index: The index of the document holding the subschema.
+        :param ref_strategy: How the type is built, `forward_ref` for the root of the schema being built.
+        :return: The type of the subschema, or a forward reference while it's being built.
+        """
+        ref_cache = kwargs["ref_cache"]
+
+        if ref_index is not kwargs.get("schema_index") or resource_uri != kwargs.get(
+            "base_uri", ref_index.base_uri
+        ):
+            # References within the target are relative to the resource holding it
+            kwargs["schema_index"] = ref_index
+            kwargs["base_uri"] = resource_uri
+            kwargs["context"] = ref_index.resources[resource_uri]
+
+        registry = kwargs.get("registry")
+        if (
+            registry is not None
+            and ref_index.qualified
+            and ref_name not in ref_cache
+            and (
+                shared_model := registry.get_model(
+                    ref_name, kwargs.get("registry_variant", "")
+                )
+            )
+            is not None
+        ):
+            # Models of registry documents are shared by every build using the registry
+            ref_cache[ref_name] = shared_model
+            return shared_model
+
         ref_state = self._get_ref_from_cache(ref_name, ref_cache)
         if ref_state is not None:
             # If the reference is either processing or already cached
-            return ref_state, mapped_properties
+            return ref_state
 
+        # The type is shared by every reference, whether the referencing fields are required or not
+        kwargs["required"] = True
         ref = self._parse_from_strategy(ref_strategy, ref_name, ref_property, **kwargs)
         ref_cache[ref_name] = ref
 
-        return ref, mapped_properties
+        return ref
 
     def _parse_from_strategy(
         self,
@@ -92,44 +163,52 @@ class RefTypeParser(GenericTypeParser):
 
     def _examine_ref_strategy(
         self, name: str, properties: JSONSchema, **kwargs: Unpack[TypeParserOptions]
-    ) -> tuple[RefStrategy, str, JSONSchema]:
-        if properties.get("$ref") == "#":
-            ref_name = kwargs["context"].get("title")
-            if ref_name is None:
-                raise InvalidSchemaException(
-                    "Missing title in properties for $ref of Root Reference",
-                    invalid_field="title",
+    ) -> tuple[RefStrategy, str, JSONSchema, str, SchemaIndex]:
+        ref = properties.get("$ref")
+        if not isinstance(ref, str):
+            raise InvalidSchemaException(
+                f"Invalid $ref {ref} for {name}", invalid_field="$ref"
+            )
+
+        schema_index = kwargs["schema_index"]
+        registry = kwargs.get("registry")
+        base_uri = kwargs.get("base_uri", schema_index.base_uri)
+
+        # References within registry documents are resolved by the registry, which tracks the models it shares
+        resolved = (
+            schema_index.resolve(ref, base_uri) if not schema_index.qualified else None
+        )
+        if resolved is None and registry is not None:
+            if (registry_ref := registry.resolve(ref, base_uri)) is not None:
+                return (
+                    "def_ref",
+                    registry_ref.name,
+                    registry_ref.schema,
+                    registry_ref.resource_uri,
+                    registry_ref.schema_index,
                 )
-            return "forward_ref", ref_name, {}
 
-        if properties.get("$ref", "").startswith("#/$defs/"):
-            target_name, target_property = self._extract_target_ref(
-                name, properties, **kwargs
+        if resolved is None:
+            raise InvalidSchemaException(
+                f"Unresolvable $ref {ref}, only references within the schema"
+                + (" or its registry" if registry is not None else "")
+                + " are supported",
+                invalid_field="$ref",
             )
-            return "def_ref", target_name, target_property
 
-        raise InvalidSchemaException(
-            "Only Root and $defs references are supported at the moment",
-            invalid_field="$ref",
-        )
+        resource_uri, target_property = resolved
 
-    def _extract_target_ref(
-        self, name: str, properties: JSONSchema, **kwargs: Unpack[TypeParserOptions]
-    ) -> tuple[str, JSONSchema]:
-        target_name = None
-        target_property = kwargs["context"]
-        for prop_name in properties["$ref"].split("/")[1:]:
-            if prop_name not in target_property:
+        if target_property is schema_index.document:
+            ref_name = target_property.get("title")
+            if ref_name is None:
                 raise InvalidSchemaException(
-                    f"Missing {prop_name} in properties for $ref {properties['$ref']}",
-                    invalid_field=prop_name,
+                    "Missing title in properties for $ref of Root Reference",
+                    invalid_field="title",
                 )
-            target_name = prop_name
-            target_property = target_property[prop_name]  # type: ignore
+            return "forward_ref", ref_name, {}, resource_uri, schema_index
 
-        if not isinstance(target_name, str) or target_property is None:
-            raise InvalidSchemaException(
-                f"Invalid $ref {properties['$ref']}", invalid_field="$ref"
-            )
+        target_name = schema_index.get_name(target_property)
+        if target_name is None:
+            raise InvalidSchemaException(f"Invalid $ref {ref}", invalid_field="$ref")
 
-        return target_name, target_property
+        return "def_ref", target_name, target_property, resource_uri, schema_index
@@ -66,7 +66,10 @@ class StringTypeParser(GenericTypeParser):
             mapped_properties["pattern"] = self.format_pattern_mapping[format_type]
 
         try:
-            if "examples" in mapped_properties:
+            if (
+                "examples" in mapped_properties
+                and kwargs.get("profile", "strict") == "strict"
+            ):
                 mapped_properties["examples"] = [
                     TypeAdapter(mapped_type).validate_python(example)
                     for example in mapped_properties["examples"]
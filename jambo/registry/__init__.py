@@ -0,0 +1,10 @@
+from .schema_index import SchemaIndex, parse_pointer
+from .schema_registry import ResolvedRef, SchemaRegistry
+
+
+__all__ = [
+    "ResolvedRef",
+    "SchemaIndex",
+    "SchemaRegistry",
+    "parse_pointer",
+]
@@ -0,0 +1,322 @@
+from jambo.cache.schema_hash import schema_hash
+from jambo.types.json_schema_type import JSONSchema
+
+from typing_extensions import Any, Callable, Optional
+
+import re
+from itertools import chain, count
+from urllib.parse import unquote, urldefrag, urljoin, urlsplit
+
+
+JSONPointer = tuple[str, ...]
+
+# Keywords whose values are instances rather than subschemas
+INSTANCE_KEYWORDS = frozenset(("const", "default", "enum", "examples"))
+
+DEFINITIONS_KEYWORDS = frozenset(("$defs", "definitions"))
+
+# Keywords whose values map arbitrary names to subschemas
+SCHEMA_MAP_KEYWORDS = DEFINITIONS_KEYWORDS | {
+    "dependentSchemas",
+    "patternProperties",
+    "properties",
+}
+
+
+def parse_pointer(fragment: str) -> Optional[JSONPointer]:
+    """
+    Splits the JSON Pointer of a URI fragment into its unescaped reference tokens.
+    :param fragment: The fragment of a URI, without the leading `#`.
+    :return: The reference tokens, or None if the fragment is not a JSON Pointer.
+    """
+    fragment = unquote(fragment)
+    if fragment == "":
+        return ()
+    if not fragment.startswith("/"):
+        return None
+
+    return tuple(
+        token.replace("~1", "/").replace("~0", "~") for token in fragment.split("/")[1:]
+    )
+
+
+class SchemaIndex:
+    """
+    Index of every addressable subschema of a schema document, built in a single pass.
+
+    Subschemas are addressed by JSON Pointer, by `$anchor` (or by a fragment `$id` of older drafts),
+    and embedded schemas with their own `$id` are indexed as resources of their own, so that
+    references relative to them can be resolved. Once indexed, resolving a reference is a lookup.
+    """
+
+    def __init__(
+        self,
+        document: JSONSchema,
+        base_uri: str = "",
+        qualified: bool = False,
+        resource_name: Optional[Callable[[str], str]] = None,
+        reserved: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        """
+        :param document: The schema document to index.
+        :param base_uri: The URI the document was retrieved from, used when it has no `$id`.
+        :param qualified: Whether the names of every subschema are prefixed by the name of the document,
+            for documents whose models are shared with other documents.
+        :param resource_name: Names a resource of the document by its URI, after its file name by default.
+        :param reserved: Whether a name is reserved for another document, in which case subschemas
+            other than the roots are named as if it was taken.
+        """
+        self.document = document
+        self.qualified = qualified
+        self._resource_name = resource_name
+        self._reserved = reserved
+
+        document_id = document.get("$id")
+        if isinstance(document_id, str) and not document_id.startswith("#"):
+            base_uri = urljoin(base_uri, document_id)
+        self.base_uri, _ = urldefrag(base_uri)
+
+        self._resources: dict[str, JSONSchema] = {}
+        self._pointers: dict[tuple[str, JSONPointer], Any] = {}
+        self._anchors: dict[tuple[str, str], JSONSchema] = {}
+        self._locations: dict[int, tuple[str, JSONPointer]] = {}
+        self._anchor_names: dict[int, str] = {}
+        self._names: Optional[dict[int, str]] = None
+        self._document_hash: Optional[str] = None
+
+        self._index()
+
+    @property
+    def resources(self) -> dict[str, JSONSchema]:
+        """
+        :return: The root schema of every resource of the document, by URI.
+        """
+        return dict(self._resources)
+
+    @property
+    def document_hash(self) -> str:
+        """
+        :return: The canonical hash of the document, telling apart documents without an `$id`.
+        """
+        if self._document_hash is None:
+            self._document_hash = schema_hash(self.document)
+        return self._document_hash
+
+    def resolve(
+        self, ref: str, base_uri: Optional[str] = None
+    ) -> Optional[tuple[str, JSONSchema]]:
+        """
+        Resolves a reference to a subschema of the document.
+        :param ref: The reference, as found in a `$ref`.
+        :param base_uri: The URI of the resource the reference was found in, the document by default.
+        :return: The URI of the resource holding the subschema and the subschema,
+            or None if the reference is not part of the document.
+        """
+        uri, fragment = urldefrag(
+            urljoin(base_uri if base_uri is not None else self.base_uri, ref)
+        )
+        if uri not in self._resources:
+            return None
+
+        if (pointer := parse_pointer(fragment)) is not None:
+            target = self._pointers.get((uri, pointer))
+        else:
+            target = self._anchors.get((uri, unquote(fragment)))
+
+        # Only subschemas are located, not the mappings or lists holding them
+        if (location := self._locations.get(id(target))) is None:
+            return None
+
+        resource_uri, _ = location
+        return resource_uri, target  # type: ignore
+
+    def get_name(self, schema: JSONSchema) -> Optional[str]:
+        """
+        Gets the name of the model built from a subschema of the document.
+
+        Definitions of the document are named after their key, anchors after the anchor and
+        other subschemas after their JSON Pointer. Names of subschemas of embedded resources,
+        or of every resource of a qualified index, are prefixed by the name of their resource.
+        Names of subschemas are unique within the document: when two of them would share a name,
+        `$defs` keep it first, then `definitions`, anchors and other subschemas, in document order,
+        and the others are named after their JSON Pointer, or numbered if it's still taken.
+        :param schema: A subschema of the document.
+        :return: The name of the subschema, or None if it's not part of the document.
+        """
+        return self._get_names().get(id(schema))
+
+    @property
+    def names(self) -> set[str]:
+        """
+        :return: The names of every subschema of the document.
+        """
+        return set(self._get_names().values())
+
+    def get_references(
+        self, schema: JSONSchema
+    ) -> list[Optional[tuple[str, JSONSchema]]]:
+        """
+        Gets the subschemas a subschema of the document refers to, without following them.
+        References of nested definitions are left out, since they are only used through references.
+        :param schema: A subschema of the document.
+        :return: The URI of the resource holding each referenced subschema and the subschema,
+            in document order, or None for the references that are not part of the document.
+        """
+        references: list[Optional[tuple[str, JSONSchema]]] = []
+
+        pending: list[tuple[Any, bool]] = [(schema, False)]
+        while pending:
+            node, is_schema_map = pending.pop()
+
+            if isinstance(node, dict) and is_schema_map:
+                children = list(node.items())
+            elif isinstance(node, dict):
+                if isinstance(ref := node.get("$ref"), str):
+                    location = self._locations.get(id(node))
+                    references.append(
+                        self.resolve(ref, location[0] if location is not None else None)
+                    )
+
+                children = [
+                    (key, value)
+                    for key, value in node.items()
+                    if key not in INSTANCE_KEYWORDS and key not in DEFINITIONS_KEYWORDS
+                ]
+            elif isinstance(node, list):
+                children = list(enumerate(node))  # type: ignore
+            else:
+                continue
+
+            for key, value in reversed(children):
+                if isinstance(value, (dict, list)):
+                    pending.append(
+                        (
+                            value,
+                            not is_schema_map
+                            and isinstance(node, dict)
+                            and key in SCHEMA_MAP_KEYWORDS,
+                        )
+                    )
+
+        return references
+
+    def _get_names(self) -> dict[int, str]:
+        if self._names is None:
+            self._names = self._assign_names()
+        return self._names
+
+    def _assign_names(self) -> dict[int, str]:
+        assigned: dict[int, str] = {}
+        taken: set[str] = set()
+        candidates: list[tuple[int, int, int, list[str]]] = []
+
+        for position, (node_id, (uri, pointer)) in enumerate(self._locations.items()):
+            node = self._pointers[(uri, pointer)]
+
+            # Roots are named after their title, which may be the key of the definition they refer to
+            if not pointer:
+                if self.qualified and uri == self.base_uri:
+                    name = self._get_resource_name(uri)
+                else:
+                    name = node.get("title") or self._get_resource_name(uri)
+                if isinstance(name, str):
+                    assigned[node_id] = name
+                continue
+
+            name = self._qualify_name(uri, "_".join(pointer))
+            # Names taken by other subschemas fall back to their pointer, as a valid identifier
+            pointer_name = re.sub(r"\W", "_", name)
+            if len(pointer) == 2 and pointer[0] in DEFINITIONS_KEYWORDS:
+                rank = 1 if pointer[0] == "$defs" else 2
+                names = [self._qualify_name(uri, pointer[1]), pointer_name]
+            elif (anchor := self._anchor_names.get(node_id)) is not None:
+                rank = 3
+                names = [self._qualify_name(uri, anchor), pointer_name]
+            else:
+                rank = 4
+                names = [name, pointer_name]
+            candidates.append((rank, position, node_id, names))
+
+        for _, _, node_id, names in sorted(candidates):
+            name = next(
+                name
+                for name in chain(names, (f"{names[-1]}_{i}" for i in count(2)))
+                if name not in taken
+                and (self._reserved is None or not self._reserved(name))
+            )
+            assigned[node_id] = name
+            taken.add(name)
+
+        return assigned
+
+    def _qualify_name(self, uri: str, name: str) -> str:
+        if uri == self.base_uri and not self.qualified:
+            return name
+        return f"{self._get_resource_name(uri)}_{name}"
+
+    def _get_resource_name(self, uri: str) -> str:
+        if self._resource_name is not None:
+            return self._resource_name(uri)
+
+        path = urlsplit(uri).path.rstrip("/")
+        stem = path.rsplit("/", 1)[-1].split(".", 1)[0] or uri
+        return re.sub(r"\W", "_", stem)
+
+    def _index(self) -> None:
+        # Every node is visited along with the resource it belongs to, its pointer in that resource,
+        # its pointer in the document and whether it maps names to subschemas
+        pending: list[tuple[Any, str, JSONPointer, JSONPointer, bool]] = [
+            (self.document, self.base_uri, (), (), False)
+        ]
+
+        while pending:
+            node, uri, pointer, document_pointer, is_schema_map = pending.pop()
+
+            if isinstance(node, dict) and is_schema_map:
+                children = list(node.items())
+            elif isinstance(node, dict):
+                if isinstance(node_id := node.get("$id"), str):
+                    if node_id.startswith("#"):
+                        # Plain name fragments were the anchors of older drafts
+                        self._add_anchor(uri, node_id[1:], node)  # type: ignore
+                    elif document_pointer:
+                        uri, _ = urldefrag(urljoin(uri, node_id))
+                        pointer = ()
+
+                if not pointer:
+                    self._resources.setdefault(uri, node)  # type: ignore
+
+                if isinstance(anchor := node.get("$anchor"), str):
+                    self._add_anchor(uri, anchor, node)  # type: ignore
+
+                self._locations.setdefault(id(node), (uri, pointer))
+                children = [
+                    (key, value)
+                    for key, value in node.items()
+                    if key not in INSTANCE_KEYWORDS
+                ]
+            elif isinstance(node, list):
+                children = [(str(i), value) for i, value in enumerate(node)]
+            else:
+                continue
+
+            self._pointers[(uri, pointer)] = node
+            if document_pointer != pointer:
+                self._pointers[(self.base_uri, document_pointer)] = node
+
+            # Reversed so the nodes are visited in document order
+            for key, value in reversed(children):
+                if isinstance(value, (dict, list)):
+                    pending.append(
+                        (
+                            value,
+                            uri,
+                            (*pointer, key),
+                            (*document_pointer, key),
+                            not is_schema_map and key in SCHEMA_MAP_KEYWORDS,
+                        )
+                    )
+
+    def _add_anchor(self, uri: str, anchor: str, node: JSONSchema) -> None:
+        self._anchors.setdefault((uri, anchor), node)
+        self._anchor_names.setdefault(id(node), anchor)
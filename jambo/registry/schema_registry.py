@@ -0,0 +1,284 @@
+from jambo.exceptions import InvalidSchemaException
+from jambo.registry.schema_index import SchemaIndex
+from jambo.types.json_schema_type import JSONSchema
+
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import validator_for
+from typing_extensions import (
+    Callable,
+    ForwardRef,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+import json
+import os
+import re
+from itertools import chain, count
+from pathlib import Path
+from threading import RLock
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+
+class ResolvedRef(NamedTuple):
+    name: str
+    resource_uri: str
+    schema: JSONSchema
+    schema_index: SchemaIndex
+
+
+class SchemaRegistry:
+    """
+    Registry of local schema documents, referenced from other schemas by URI.
+
+    Documents are only retrieved, validated and indexed the first time a reference to them
+    is resolved, and the models built from them are shared by every schema built with the registry
+    with the same build options, such as `union_mode` or `lazy`.
+    Models of registry documents are named after the document, `common.json#/$defs/Money`
+    is built as `common_Money`. Documents sharing a file name are told apart by their directories,
+    `v2/common.json#/$defs/Money` is then built as `v2_common_Money`, and names of the schemas
+    built with the registry are kept apart from those of its documents.
+    Nothing is ever fetched from the network.
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], Optional[JSONSchema]],
+        validate: bool = True,
+    ) -> None:
+        """
+        :param retrieve: Gets the document of a URI, or None if there is none.
+        :param validate: Whether to validate every document against its meta-schema when it's loaded.
+        """
+        self._retrieve = retrieve
+        self._validate = validate
+
+        self._indexes: dict[str, Optional[SchemaIndex]] = {}
+        self._names: set[str] = set()
+        self._resource_names: dict[str, str] = {}
+        self._reserved_names: set[str] = set()
+        self._models: dict[tuple[str, str], type] = {}
+        self._lock = RLock()
+
+    @classmethod
+    def from_mapping(
+        cls, documents: Mapping[str, JSONSchema], validate: bool = True
+    ) -> "SchemaRegistry":
+        """
+        Creates a registry of in-memory documents.
+        :param documents: The documents by URI, documents with an `$id` can also be referenced by it.
+        :param validate: Whether to validate every document against its meta-schema when it's loaded.
+        :return: The registry.
+        """
+        by_uri: dict[str, JSONSchema] = {}
+        for uri, document in documents.items():
+            by_uri[urldefrag(uri)[0]] = document
+            if isinstance(document_id := document.get("$id"), str):
+                by_uri.setdefault(urldefrag(urljoin(uri, document_id))[0], document)
+
+        return cls(by_uri.get, validate=validate)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, os.PathLike[str]],
+        base_uri: str = "",
+        validate: bool = True,
+    ) -> "SchemaRegistry":
+        """
+        Creates a registry of the JSON documents of a directory.
+
+        A URI is looked up as the path relative to `base_uri`, `https://example.com/schemas/common.json`
+        is the file `common.json` for the base URI `https://example.com/schemas/`. URIs that don't match
+        a file, such as an `$id` unrelated to the layout of the directory, are looked up by the `$id`
+        of every document, which reads the whole directory once.
+        :param directory: The directory holding the documents.
+        :param base_uri: The URI of the directory.
+        :param validate: Whether to validate every document against its meta-schema when it's loaded.
+        :return: The registry.
+        """
+        root = Path(directory).resolve()
+        ids: Optional[dict[str, Path]] = None
+
+        def load(path: Path) -> JSONSchema:
+            with path.open(encoding="utf-8") as file:
+                return json.load(file)
+
+        def retrieve(uri: str) -> Optional[JSONSchema]:
+            nonlocal ids
+
+            if uri.startswith(base_uri):
+                path = (root / uri[len(base_uri) :].lstrip("/")).resolve()
+                if path.is_relative_to(root) and path.is_file():
+                    return load(path)
+
+            if ids is None:
+                ids = {}
+                for path in sorted(root.rglob("*.json")):
+                    document = load(path)
+                    if isinstance(document, dict) and isinstance(
+                        document_id := document.get("$id"), str
+                    ):
+                        ids.setdefault(urldefrag(document_id)[0], path)
+
+            document_path = ids.get(uri)
+            return load(document_path) if document_path is not None else None
+
+        return cls(retrieve, validate=validate)
+
+    @property
+    def models(self) -> dict[str, type]:
+        """
+        :return: The models built from the documents of the registry with the default build options, by name.
+        """
+        with self._lock:
+            return {
+                name: model
+                for (name, variant), model in self._models.items()
+                if variant == ""
+            }
+
+    def get_index(self, uri: str) -> Optional[SchemaIndex]:
+        """
+        Gets the index of a document, retrieving and indexing it on first use.
+        :param uri: The URI of the document.
+        :return: The index of the document, or None if the registry has no such document.
+        """
+        uri, _ = urldefrag(uri)
+
+        with self._lock:
+            if uri in self._indexes:
+                return self._indexes[uri]
+
+            document = self._retrieve(uri)
+            if document is None:
+                self._indexes[uri] = None
+                return None
+
+            if not isinstance(document, dict):
+                raise InvalidSchemaException(
+                    f"Invalid document {uri} in schema registry", invalid_field="$ref"
+                )
+            if self._validate:
+                try:
+                    validator_for(document).check_schema(document)  # type: ignore
+                except SchemaError as err:
+                    raise InvalidSchemaException(
+                        f"Validation of {uri} in schema registry failed.", cause=err
+                    ) from err
+
+            index = SchemaIndex(
+                document, uri, qualified=True, resource_name=self._get_resource_name
+            )
+
+            # Embedded resources are reachable by their own URI
+            for resource_uri in index.resources:
+                self._indexes.setdefault(resource_uri, index)
+            self._indexes[uri] = index
+
+            return index
+
+    def resolve(self, ref: str, base_uri: str = "") -> Optional[ResolvedRef]:
+        """
+        Resolves a reference to a subschema of a document of the registry.
+        :param ref: The reference, as found in a `$ref`.
+        :param base_uri: The URI of the resource the reference was found in.
+        :return: The name of the model of the subschema, the URI of the resource holding it,
+            the subschema and the index of its document, or None if it's not part of the registry.
+        """
+        uri = urljoin(base_uri, ref)
+
+        if (index := self.get_index(uri)) is None:
+            return None
+        if (resolved := index.resolve(uri)) is None:
+            return None
+
+        resource_uri, schema = resolved
+        if (name := index.get_name(schema)) is None:
+            return None
+
+        with self._lock:
+            self._names.add(name)
+
+        return ResolvedRef(name, resource_uri, schema, index)
+
+    def reserve(self, index: SchemaIndex) -> None:
+        """
+        Keeps the names of a schema built with the registry apart from the names of its documents.
+        Documents loaded later are named so they avoid the names of the schema, which must itself be
+        indexed with :py:meth:`is_reserved` to avoid the names of the documents already loaded.
+        :param index: The index of the schema.
+        """
+        with self._lock:
+            self._reserved_names |= index.names
+
+    def is_reserved(self, name: str) -> bool:
+        """
+        :param name: The name of a subschema of a schema built with the registry.
+        :return: Whether the name could be the name of a model of a document already loaded.
+        """
+        with self._lock:
+            return any(
+                name == resource_name or name.startswith(f"{resource_name}_")
+                for resource_name in self._resource_names.values()
+            )
+
+    def get_model(self, name: str, variant: str = "") -> Optional[type]:
+        """
+        :param name: The name of a model of a registry document.
+        :param variant: The key of the build options the model was built with, empty for the default ones.
+        :return: The model, if it was already built with those options.
+        """
+        with self._lock:
+            return self._models.get((name, variant))
+
+    def share(
+        self, built: Mapping[str, Union[ForwardRef, type, None]], variant: str = ""
+    ) -> None:
+        """
+        Shares the models of registry documents built by a successful build with later builds.
+        :param built: The entries written to the reference cache by the build.
+        :param variant: The key of the build options of the build, empty for the default ones.
+        """
+        with self._lock:
+            for name, model in built.items():
+                if name in self._names and isinstance(model, type):
+                    self._models.setdefault((name, variant), model)
+
+    def _get_resource_name(self, uri: str) -> str:
+        with self._lock:
+            if (name := self._resource_names.get(uri)) is not None:
+                return name
+
+            path = urlsplit(uri).path.rstrip("/")
+            directories, _, file_name = path.rpartition("/")
+            segments = [
+                re.sub(r"\W", "_", segment)
+                for segment in (
+                    *directories.split("/"),
+                    file_name.split(".", 1)[0] or uri,
+                )
+                if segment
+            ]
+
+            # Documents sharing a file name are told apart by their directories, or numbered
+            candidates = [
+                "_".join(segments[i:]) for i in reversed(range(len(segments)))
+            ]
+            taken = set(self._resource_names.values())
+            name = next(
+                name
+                for name in chain(
+                    candidates, (f"{candidates[-1]}_{i}" for i in count(2))
+                )
+                if name not in taken
+                and not any(
+                    reserved == name or reserved.startswith(f"{name}_")
+                    for reserved in self._reserved_names
+                )
+            )
+
+            self._resource_names[uri] = name
+            return name
@@ -1,11 +1,48 @@
+from jambo.cache import (
+    CacheInfo,
+    DiskCache,
+    ModelCache,
+    RefGraph,
+    SingleFlight,
+    StagedRefCache,
+    ValidationCache,
+    schema_hash,
+)
+from jambo.codegen import SourceGenerator
 from jambo.exceptions import InvalidSchemaException, UnsupportedSchemaException
-from jambo.parser import ObjectTypeParser, RefTypeParser
-from jambo.types import JSONSchema, RefCacheDict
+from jambo.parser import GenericTypeParser, ObjectTypeParser, RefTypeParser
+from jambo.parser._validators import AdaptiveUnionValidator
+from jambo.registry import SchemaIndex, SchemaRegistry
+from jambo.types import (
+    BuildOptions,
+    BuildProfile,
+    DeferredCheck,
+    JSONSchema,
+    RefCacheDict,
+    SlowUnion,
+    TypeParserOptions,
+    UnionMode,
+)
 
 from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
 from jsonschema.validators import validator_for
-from pydantic import BaseModel
-from typing_extensions import MutableMapping, Optional
+from pydantic import BaseModel, WrapValidator
+from typing_extensions import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Unpack,
+    get_args,
+    get_origin,
+)
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, RLock, Thread
 
 
 class SchemaConverter:
@@ -19,12 +56,46 @@ class SchemaConverter:
 
     _namespace_registry: MutableMapping[str, RefCacheDict]
 
+    _ref_cache_factory: Callable[[], RefCacheDict]
+
+    _namespace_locks: dict[str, RLock]
+    _namespace_locks_guard: Lock
+    _single_flight: SingleFlight[tuple[str, str], type[BaseModel]]
+
+    _build_options: BuildOptions
+
+    _model_cache: ClassVar[ModelCache] = ModelCache()
+    _validation_cache: ClassVar[ValidationCache] = ValidationCache()
+    _disk_cache: ClassVar[Optional[DiskCache]] = None
+
     def __init__(
-        self, namespace_registry: Optional[MutableMapping[str, RefCacheDict]] = None
+        self,
+        namespace_registry: Optional[MutableMapping[str, RefCacheDict]] = None,
+        ref_cache_factory: Callable[[], RefCacheDict] = dict,
+        **build_options: Unpack[BuildOptions],
     ) -> None:
+        """
+        :param namespace_registry: An optional mapping of namespaces to reference caches.
+        :param ref_cache_factory: Creates the reference cache of each new namespace,
+            for example a `BoundedRefCache` to bound the memory of the namespace registry.
+        :param build_options: Options applied to every build of this converter.
+            `trusted` skips the meta-schema validation, use it only for schemas that were already validated elsewhere.
+            `lazy` defers building the validation schema of each model until its first use.
+            `profile` selects how defaults and examples are checked, see `build`.
+            `union_mode` selects how anyOf/oneOf unions are validated, see `build`.
+            `registry` resolves references to other local documents, see `build`.
+            `intern` shares the types of structurally identical subschemas, see `build`.
+            `max_workers` builds independent definitions in a thread pool, see `build`.
+        """
         if namespace_registry is None:
             namespace_registry = dict()
         self._namespace_registry = namespace_registry
+        self._ref_cache_factory = ref_cache_factory
+        self._build_options = build_options
+
+        self._namespace_locks = dict()
+        self._namespace_locks_guard = Lock()
+        self._single_flight = SingleFlight()
 
     def build_with_cache(
         self,
@@ -36,53 +107,418 @@ class SchemaConverter:
         Converts a JSON Schema to a Pydantic model.
         This is the instance method version of `build` and uses the instance's reference cache if none is provided.
         Use this method if you want to utilize the instance's reference cache.
+        Builds into the instance's reference cache are serialized per namespace, and concurrent
+        calls for the same schema wait for a single build and share its result.
 
             :param schema: The JSON Schema to convert.
             :param ref_cache: An optional reference cache to use during conversion.
             :param without_cache: Whether to use a clean reference cache for this conversion.
             :return: The generated Pydantic model.
         """
-        local_ref_cache: RefCacheDict
-
         if without_cache:
-            local_ref_cache = dict()
-        elif ref_cache is None:
-            namespace = schema.get("$id", "default")
-            local_ref_cache = self._namespace_registry.setdefault(namespace, dict())
-        else:
-            local_ref_cache = ref_cache
+            return self.build(schema, dict(), **self._build_options)
+
+        if ref_cache is not None:
+            return self.build(schema, ref_cache, **self._build_options)
+
+        namespace = schema.get("$id", "default")
 
-        return self.build(schema, local_ref_cache)
+        def build_in_namespace() -> type[BaseModel]:
+            with self._get_namespace_lock(namespace):
+                local_ref_cache = self._get_namespace_ref_cache(namespace)
+                return self.build(schema, local_ref_cache, **self._build_options)
+
+        return self._single_flight.do(
+            (namespace, schema_hash(schema)), build_in_namespace
+        )
+
+    def build_many(self, schemas: Iterable[JSONSchema]) -> dict[str, type[BaseModel]]:
+        """
+        Converts many JSON Schemas to Pydantic models in one pass.
+        Schemas are built into the instance's reference cache of their namespace, so `$defs` shared
+        between schemas of the same namespace are only built once, and identical inline subschemas of
+        a namespace are converted once for the whole batch, as with the `intern` option. Identical schemas
+        are only built once, the validator of each dialect is only resolved once and, unless the instance
+        is lazy, forward references of every built model are resolved at the end of the batch.
+
+            :param schemas: The JSON Schemas to convert.
+            :return: A mapping of each schema title to its generated Pydantic model.
+        """
+        models: dict[str, type[BaseModel]] = {}
+
+        built_models: dict[str, type[BaseModel]] = {}
+        used_ref_caches: dict[str, RefCacheDict] = {}
+        # Interned types may refer to the models of their namespace, so each namespace has its own table
+        interned_types: dict[str, dict[str, tuple[Any, dict]]] = {}
+        validators: dict[Optional[str], type[Validator]] = {}
+
+        for schema in schemas:
+            key = schema_hash(schema)
+
+            if (model := built_models.get(key)) is None:
+                if not self._build_options.get("trusted", False):
+                    dialect = schema.get("$schema")
+                    if dialect not in validators:
+                        validators[dialect] = validator_for(schema)
+                    self._validate_schema(schema, validators[dialect])
+
+                namespace = schema.get("$id", "default")
+                with self._get_namespace_lock(namespace):
+                    ref_cache = self._get_namespace_ref_cache(namespace)
+                    used_ref_caches[namespace] = ref_cache
+
+                    build_options = self._build_options.copy()
+                    build_options["trusted"] = True
+
+                    model = self._build(
+                        schema,
+                        ref_cache,
+                        interned_types=interned_types.setdefault(namespace, {}),
+                        **build_options,
+                    )
+                built_models[key] = model
+
+            title = schema["title"]
+            if title in models and models[title] is not model:
+                raise InvalidSchemaException(
+                    f"Duplicate title '{title}' in batch with a different schema.",
+                    invalid_field="title",
+                )
+            models[title] = model
+
+        for namespace, ref_cache in used_ref_caches.items():
+            with self._get_namespace_lock(namespace):
+                if self._build_options.get("lazy", False):
+                    # Lazy models are completed on their first use, as in `_build`
+                    self._defer_forward_refs(ref_cache)
+                else:
+                    self._resolve_forward_refs(ref_cache)
+
+        return models
 
     @staticmethod
     def build(
-        schema: JSONSchema, ref_cache: Optional[RefCacheDict] = None
+        schema: JSONSchema,
+        ref_cache: Optional[RefCacheDict] = None,
+        use_model_cache: bool = False,
+        **build_options: Unpack[BuildOptions],
     ) -> type[BaseModel]:
         """
         Converts a JSON Schema to a Pydantic model.
         This method doesn't use a reference cache if none is provided.
             :param schema: The JSON Schema to convert.
             :param ref_cache: An optional reference cache to use during conversion, if provided `with_clean_cache` will be ignored.
+            :param use_model_cache: Whether to reuse a previously compiled model for an identical schema,
+                from memory or from the disk cache if one is set. Only applies when no `ref_cache` is provided,
+                since a cache hit skips populating the reference cache.
+            :param build_options: `trusted` skips the meta-schema validation of the schema,
+                `lazy` defers building the validation schema of each model until its first use.
+                `profile` is `strict` (the default) to check every default and example during the build,
+                or `fast` to skip those checks and keep the raw examples. With the `fast` profile, the checks
+                run after the build when `on_deferred_errors` is set, which receives the model and the problems
+                found, if any. They run in a background thread if `background_checks` is set.
+                `union_mode` is `smart` (the default) to validate anyOf/oneOf unions as pydantic unions,
+                `routed` to only try the branches accepting the JSON type of each value,
+                or `adaptive` to try the most frequently matched branches first.
+                `registry` is a `SchemaRegistry` of local documents `$ref` may point to,
+                the models built from them are shared by every build using the registry.
+                `intern` shares a single type between structurally identical subschemas of the schema,
+                named after the first of them, instead of building one type per occurrence.
+                `max_workers` builds the definitions the schema refers to that don't depend on each other
+                in a pool of that many threads, when greater than 1.
             :return: The generated Pydantic model.
         """
+        # Models referring to a registry depend on its documents, which aren't part of the cache key
+        if ref_cache is not None or not use_model_cache or "registry" in build_options:
+            return SchemaConverter._build(schema, ref_cache, **build_options)
+
+        key = SchemaConverter._model_cache_key(schema, build_options)
+        if (model := SchemaConverter._model_cache.get(key)) is not None:
+            return model
+
+        model = SchemaConverter._load_or_build(schema, key, **build_options)
+        SchemaConverter._model_cache.put(key, model)
+
+        return model
+
+    @staticmethod
+    def build_source(schema: JSONSchema, **build_options: Unpack[BuildOptions]) -> str:
+        """
+        Converts a JSON Schema to the source of a Python module defining the equivalent Pydantic models.
+        The generated module only depends on pydantic and typing_extensions, so it can be imported
+        without any JSON Schema processing.
+            :param schema: The JSON Schema to convert.
+            :param build_options: The options of the build, see `build`.
+            :return: The source of the generated module.
+        """
+        ref_cache: RefCacheDict = dict()
+        model = SchemaConverter.build(schema, ref_cache, **build_options)
+
+        return SourceGenerator(ref_cache).generate([model])
+
+    @staticmethod
+    def get_slow_unions(schema: JSONSchema) -> list[SlowUnion]:
+        """
+        Lists the oneOf unions of a schema whose branches may overlap.
+        Those unions are validated by trying every branch to ensure exactly one matches,
+        every other oneOf union is validated as a plain or tagged union.
+            :param schema: The JSON Schema to analyze.
+            :return: The name of each slow union and the pairs of branches that may overlap.
+        """
+        SchemaConverter._validate_schema(schema)
+
+        if "title" not in schema:
+            raise InvalidSchemaException(
+                "Schema must have a title.", invalid_field="title"
+            )
+
+        slow_unions: list[SlowUnion] = []
+        SchemaConverter._parse_schema(
+            schema,
+            dict(),
+            lazy=True,
+            profile="fast",
+            deferred_checks=[],
+            slow_unions=slow_unions,
+        )
+
+        return slow_unions
+
+    @staticmethod
+    def get_adaptive_unions(
+        model: type[BaseModel],
+    ) -> dict[str, AdaptiveUnionValidator]:
+        """
+        Gets the validators of the unions of a model built with the `adaptive` union mode,
+        including the unions of the models it refers to. Their `counts` give the number of values
+        matched by each branch and their `order` the order the branches are tried in.
+            :param model: The model to inspect.
+            :return: The validator of each adaptive union, by the qualified name of its field.
+        """
+        validators: dict[str, AdaptiveUnionValidator] = {}
+        visited: set[type] = set()
+
+        def visit_metadata(name: str, metadata: Iterable[Any]) -> None:
+            for item in metadata:
+                if isinstance(item, WrapValidator) and isinstance(
+                    item.func, AdaptiveUnionValidator
+                ):
+                    validators.setdefault(name, item.func)
+                    for subfield_type in item.func.subfield_types:
+                        visit_type(name, subfield_type)
+
+        def visit_type(name: str, tp: Any) -> None:
+            if isinstance(tp, type) and issubclass(tp, BaseModel):
+                visit_model(tp)
+                return
+
+            if get_origin(tp) is Annotated:
+                visit_metadata(name, tp.__metadata__)
+            for arg in get_args(tp):
+                visit_type(name, arg)
+
+        def visit_model(tp: type[BaseModel]) -> None:
+            if tp in visited:
+                return
+            visited.add(tp)
+
+            for field_name, field in tp.model_fields.items():
+                name = f"{tp.__name__}.{field_name}"
+                visit_metadata(name, field.metadata)
+                visit_type(name, field.annotation)
+
+        visit_model(model)
+
+        return validators
+
+    def build_namespace_source(self, namespace: str = "default") -> str:
+        """
+        Generates the source of a Python module defining every model cached in a namespace.
+        Use it after building the schemas of the namespace with `build_with_cache` or `build_many`.
+            :param namespace: The namespace of the instance cache to render.
+            :return: The source of the generated module.
+        """
+        with self._get_namespace_lock(namespace):
+            ref_cache = dict(self._namespace_registry.get(namespace, {}))
+        models = [
+            ref
+            for ref in ref_cache.values()
+            if isinstance(ref, type) and issubclass(ref, BaseModel)
+        ]
+
+        return SourceGenerator(ref_cache).generate(models)
+
+    @staticmethod
+    def _load_or_build(
+        schema: JSONSchema, key: str, **build_options: Unpack[BuildOptions]
+    ) -> type[BaseModel]:
+        """
+        Loads the model of a schema from the disk cache, building and persisting it on a miss.
+        """
+        disk_cache = SchemaConverter._disk_cache
+        if disk_cache is None:
+            return SchemaConverter._build(schema, **build_options)
+
+        if (module := disk_cache.get(key)) is not None and (
+            model := getattr(module, "__jambo_root__", None)
+        ) is not None:
+            return model
+
+        ref_cache: RefCacheDict = dict()
+        model = SchemaConverter._build(schema, ref_cache, **build_options)
+
+        generator = SourceGenerator(ref_cache)
+        try:
+            source = generator.generate([model])
+        except UnsupportedSchemaException:
+            # Models that can't be rendered as source are only cached in memory
+            return model
+
+        disk_cache.put(
+            key, f"{source}\n__jambo_root__ = {generator.get_identifier(model)}\n"
+        )
+
+        return model
+
+    @staticmethod
+    def _build(
+        schema: JSONSchema,
+        ref_cache: Optional[RefCacheDict] = None,
+        interned_types: Optional[dict[str, tuple[Any, dict]]] = None,
+        **build_options: Unpack[BuildOptions],
+    ) -> type[BaseModel]:
+        """
+        :param interned_types: The interning table shared with other builds, identical subschemas
+            of every build sharing it are converted once. Builds only intern with `intern` otherwise.
+        """
         if ref_cache is None:
             ref_cache = dict()
 
-        try:
-            validator = validator_for(schema)
-            validator.check_schema(schema)  # type: ignore
-        except SchemaError as err:
-            raise InvalidSchemaException(
-                "Validation of JSON Schema failed.", cause=err
-            ) from err
+        if not build_options.get("trusted", False):
+            SchemaConverter._validate_schema(schema)
 
         if "title" not in schema:
             raise InvalidSchemaException(
                 "Schema must have a title.", invalid_field="title"
             )
 
+        profile = build_options.get("profile", "strict")
+        deferred_checks: list[DeferredCheck] = []
+
+        # Writes are staged so a failed build leaves no sentinels or half-built models behind
+        staged_ref_cache = StagedRefCache(ref_cache)
+        registry = build_options.get("registry")
+        # Models shared through the registry are only reused by builds with the same options
+        variant = SchemaConverter._get_build_variant(build_options)
+        registry_variant = schema_hash(variant) if variant is not None else ""
+        model = SchemaConverter._parse_schema(
+            schema,
+            staged_ref_cache,
+            lazy=build_options.get("lazy", False),
+            profile=profile,
+            deferred_checks=deferred_checks,
+            union_mode=build_options.get("union_mode", "smart"),
+            registry=registry,
+            registry_variant=registry_variant,
+            intern=build_options.get("intern", False),
+            interned_types=interned_types,
+            max_workers=build_options.get("max_workers"),
+        )
+        built = staged_ref_cache.staged
+
+        if not build_options.get("lazy", False):
+            # Resolves the forward references of recursive models now, instead of on their first use
+            SchemaConverter._resolve_forward_refs(
+                staged_ref_cache, built, raise_errors=False
+            )
+        else:
+            SchemaConverter._defer_forward_refs(staged_ref_cache, built)
+        staged_ref_cache.commit()
+
+        if registry is not None:
+            registry.share(built, registry_variant)
+
+        if (
+            on_deferred_errors := build_options.get("on_deferred_errors")
+        ) is not None and profile == "fast":
+            SchemaConverter._run_deferred_checks(
+                model,
+                deferred_checks,
+                on_deferred_errors,
+                background=build_options.get("background_checks", False),
+            )
+
+        return model
+
+    @staticmethod
+    def _run_deferred_checks(
+        model: type[BaseModel],
+        deferred_checks: list[DeferredCheck],
+        on_deferred_errors: Callable[
+            [type[BaseModel], list[InvalidSchemaException]], None
+        ],
+        background: bool,
+    ) -> None:
+        """
+        Runs the checks deferred by a `fast` build, reporting the problems found through the callback.
+        """
+
+        def run() -> None:
+            if errors := GenericTypeParser.run_deferred_checks(deferred_checks):
+                on_deferred_errors(model, errors)
+
+        if not background:
+            run()
+            return
+
+        Thread(target=run, name=f"jambo-checks-{model.__name__}", daemon=True).start()
+
+    @staticmethod
+    def _parse_schema(
+        schema: JSONSchema,
+        ref_cache: RefCacheDict,
+        lazy: bool,
+        profile: BuildProfile,
+        deferred_checks: list[DeferredCheck],
+        slow_unions: Optional[list[SlowUnion]] = None,
+        union_mode: UnionMode = "smart",
+        registry: Optional[SchemaRegistry] = None,
+        registry_variant: str = "",
+        intern: bool = False,
+        interned_types: Optional[dict[str, tuple[Any, dict]]] = None,
+        max_workers: Optional[int] = None,
+    ) -> type[BaseModel]:
         schema_type = SchemaConverter._get_schema_type(schema)
 
+        schema_index = SchemaIndex(
+            schema, reserved=registry.is_reserved if registry is not None else None
+        )
+        if registry is not None:
+            registry.reserve(schema_index)
+
+        options = TypeParserOptions(
+            context=schema,
+            ref_cache=ref_cache,
+            required=True,
+            lazy=lazy,
+            profile=profile,
+            deferred_checks=deferred_checks,
+            union_mode=union_mode,
+            schema_index=schema_index,
+        )
+        if slow_unions is not None:
+            options["slow_unions"] = slow_unions
+        if registry is not None:
+            options["registry"] = registry
+            options["registry_variant"] = registry_variant
+        if interned_types is not None:
+            options["interned_types"] = interned_types
+        elif intern:
+            options["interned_types"] = {}
+
+        if max_workers is not None and max_workers > 1:
+            SchemaConverter._build_definitions_in_parallel(schema, options, max_workers)
+
         match schema_type:
             case "object":
                 return ObjectTypeParser.to_model(
@@ -90,18 +526,12 @@ class SchemaConverter:
                     schema.get("properties", {}),
                     schema.get("required", []),
                     description=schema.get("description"),
-                    context=schema,
-                    ref_cache=ref_cache,
-                    required=True,
+                    **options,
                 )
 
             case "$ref":
                 parsed_model, _ = RefTypeParser().from_properties(
-                    schema["title"],
-                    schema,
-                    context=schema,
-                    ref_cache=ref_cache,
-                    required=True,
+                    schema["title"], schema, **options
                 )
                 return parsed_model
             case _:
@@ -113,16 +543,94 @@ class SchemaConverter:
                     unsupported_field=unsupported_type,
                 )
 
+    @classmethod
+    def get_model_cache_info(cls) -> CacheInfo:
+        """
+        Gets the hit/miss statistics of the process-wide compiled model cache.
+        :return: The statistics of the compiled model cache.
+        """
+        return cls._model_cache.cache_info()
+
+    @classmethod
+    def clear_model_cache(
+        cls, schema: Optional[JSONSchema] = None, **build_options: Unpack[BuildOptions]
+    ) -> None:
+        """
+        Clears the process-wide compiled model cache.
+        :param schema: If provided, only the model compiled from this schema is removed.
+        :param build_options: The options the model was built with, see `build`.
+        """
+        if schema is None:
+            cls._model_cache.clear()
+            return
+
+        cls._model_cache.invalidate(cls._model_cache_key(schema, build_options))
+
+    @staticmethod
+    def _model_cache_key(schema: JSONSchema, build_options: BuildOptions) -> str:
+        """
+        Gets the compiled model cache key of a schema.
+        Options changing the generated model are part of the key, unless they have their default value.
+        """
+        key = schema_hash(schema)
+
+        if (variant := SchemaConverter._get_build_variant(build_options)) is None:
+            return key
+
+        return schema_hash({"schema": key, **variant})
+
+    @staticmethod
+    def _get_build_variant(build_options: BuildOptions) -> Optional[dict[str, Any]]:
+        """
+        Gets the options of a build changing the generated models.
+        :return: The options, or None if they all have their default value.
+        """
+        variant = {
+            "lazy": build_options.get("lazy", False),
+            "profile": build_options.get("profile", "strict"),
+            "union_mode": build_options.get("union_mode", "smart"),
+            "intern": build_options.get("intern", False),
+            "parallel": build_options.get("max_workers", 1) > 1,
+        }
+        if variant == {
+            "lazy": False,
+            "profile": "strict",
+            "union_mode": "smart",
+            "intern": False,
+            "parallel": False,
+        }:
+            return None
+
+        return variant
+
+    @classmethod
+    def set_model_cache_size(cls, maxsize: int) -> None:
+        """
+        Sets the maximum number of models held by the process-wide compiled model cache.
+        :param maxsize: The new maximum number of models, least recently used models are evicted first.
+        """
+        cls._model_cache.resize(maxsize)
+
+    @classmethod
+    def set_disk_cache(cls, disk_cache: Optional[DiskCache]) -> None:
+        """
+        Sets the process-wide on-disk cache backing the compiled model cache.
+        :param disk_cache: The disk cache to persist compiled models to, or None to disable it.
+        """
+        cls._disk_cache = disk_cache
+
     def clear_ref_cache(self, namespace: Optional[str] = "default") -> None:
         """
         Clears the reference cache.
         """
         if namespace is None:
-            self._namespace_registry.clear()
+            with self._namespace_locks_guard:
+                self._namespace_registry.clear()
             return
 
-        if namespace in self._namespace_registry:
-            self._namespace_registry[namespace].clear()
+        with self._get_namespace_lock(namespace):
+            if namespace in self._namespace_registry:
+                self._namespace_registry[namespace].clear()
 
     def get_cached_ref(
         self, ref_name: str, namespace: str = "default"
@@ -132,13 +640,255 @@ class SchemaConverter:
         :param ref_name: The name of the reference to get.
         :return: The cached reference, or None if not found.
         """
-        cached_type = self._namespace_registry.get(namespace, {}).get(ref_name)
+        with self._get_namespace_lock(namespace):
+            cached_type = self._namespace_registry.get(namespace, {}).get(ref_name)
 
         if isinstance(cached_type, type):
             return cached_type
 
         return None
 
+    def _get_namespace_ref_cache(self, namespace: str) -> RefCacheDict:
+        """
+        Gets the reference cache of a namespace, creating it if needed.
+        Must be called while holding the lock of the namespace.
+        :param namespace: The namespace of the reference cache.
+        :return: The reference cache of the namespace.
+        """
+        if (ref_cache := self._namespace_registry.get(namespace)) is None:
+            ref_cache = self._namespace_registry[namespace] = self._ref_cache_factory()
+        return ref_cache
+
+    def _get_namespace_lock(self, namespace: str) -> RLock:
+        """
+        Gets the lock guarding the reference cache of a namespace, creating it if needed.
+        :param namespace: The namespace of the reference cache.
+        :return: The lock of the namespace.
+        """
+        with self._namespace_locks_guard:
+            return self._namespace_locks.setdefault(namespace, RLock())
+
+    @staticmethod
+    def _validate_schema(
+        schema: JSONSchema, validator: Optional[type[Validator]] = None
+    ) -> None:
+        """
+        Validates the schema against the meta-schema of its dialect.
+        Schemas that already passed validation are not checked again.
+        :param schema: The JSON Schema to validate.
+        :param validator: The validator of the schema dialect, resolved from the schema if not provided.
+        """
+        dialect = schema.get("$schema")
+        key = schema_hash(schema)
+
+        if SchemaConverter._validation_cache.is_validated(dialect, key):
+            return
+
+        try:
+            if validator is None:
+                validator = validator_for(schema)
+            validator.check_schema(schema)  # type: ignore
+        except SchemaError as err:
+            raise InvalidSchemaException(
+                "Validation of JSON Schema failed.", cause=err
+            ) from err
+
+        SchemaConverter._validation_cache.mark_validated(dialect, key)
+
+    @staticmethod
+    def _resolve_forward_refs(
+        ref_cache: RefCacheDict,
+        names: Optional[Iterable[str]] = None,
+        raise_errors: bool = True,
+    ) -> None:
+        """
+        Rebuilds the models of the reference cache that still have unresolved forward references.
+        The given names and the cached models they depend on are used as the namespace to resolve them.
+
+        Models are rebuilt in the topological order of their dependency graph, so every model
+        is rebuilt once, after the models it depends on, and each group of mutually recursive
+        models is resolved in a single pass.
+        :param ref_cache: The reference cache holding the models.
+        :param names: The names of the models to rebuild, along with the models they depend on,
+            every cached model by default.
+        :param raise_errors: Whether to raise when a forward reference can't be resolved,
+            otherwise the model is left to be rebuilt on its first use.
+        """
+        entries, types_namespace = SchemaConverter._get_types_namespace(
+            ref_cache, names
+        )
+
+        for component in RefGraph.from_entries(entries).components():
+            for name in component:
+                ref = types_namespace.get(name)
+                if (
+                    isinstance(ref, type)
+                    and issubclass(ref, BaseModel)
+                    and not ref.__pydantic_complete__
+                ):
+                    ref.model_rebuild(
+                        raise_errors=raise_errors, _types_namespace=types_namespace
+                    )
+
+    @staticmethod
+    def _defer_forward_refs(
+        ref_cache: RefCacheDict, names: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Gives the models of the reference cache that still have unresolved forward references
+        the namespace to resolve them on their first use, as :py:meth:`_resolve_forward_refs` would.
+        :param ref_cache: The reference cache holding the models.
+        :param names: The names of the models to complete, along with the models they depend on,
+            every cached model by default.
+        """
+        _, types_namespace = SchemaConverter._get_types_namespace(ref_cache, names)
+
+        for ref in types_namespace.values():
+            if issubclass(ref, BaseModel) and not ref.__pydantic_complete__:
+                # Pydantic resolves the forward references of a model with its parent namespace
+                ref.__pydantic_parent_namespace__ = types_namespace
+
+    @staticmethod
+    def _get_types_namespace(
+        ref_cache: RefCacheDict, names: Optional[Iterable[str]] = None
+    ) -> tuple[RefCacheDict, dict[str, type]]:
+        """
+        :param ref_cache: The reference cache holding the models.
+        :param names: The names of the models, every cached model by default.
+        :return: The entries of the models and of the models they depend on, and the types among them by name.
+        """
+        # Reads are not counted as lookups, so they don't skew the statistics of bounded caches
+        entries = RefGraph.get_entries(ref_cache, names)
+        types_namespace = {
+            name: ref for name, ref in entries.items() if isinstance(ref, type)
+        }
+        return entries, types_namespace
+
+    @staticmethod
+    def _build_definitions_in_parallel(
+        schema: JSONSchema, options: TypeParserOptions, max_workers: int
+    ) -> None:
+        """
+        Builds the definitions a schema refers to in a thread pool, before the schema itself.
+
+        Definitions are grouped by the strongly connected components of their reference graph and
+        built in waves, each wave only holding components whose dependencies were built by earlier
+        waves. Every component is built into its own overlay of the reference cache, and the overlays
+        are merged in topological order, each as soon as its component and the components submitted
+        before it in the wave are built, so the result doesn't depend on the scheduling of the threads.
+        Definitions are built the way a reference builds them, whatever the fields referring to them.
+        Definitions referring to other documents are left to the build of the schema, along with every
+        definition depending on them.
+        """
+        schema_index = options["schema_index"]
+        ref_cache = options["ref_cache"]
+
+        targets: dict[str, tuple[str, JSONSchema]] = {}
+        dependencies: dict[str, list[str]] = {}
+        external: set[str] = set()
+
+        def get_dependencies(subschema: JSONSchema) -> tuple[list[str], bool]:
+            names: list[str] = []
+            for reference in schema_index.get_references(subschema):
+                if reference is None:
+                    return names, True
+
+                resource_uri, target = reference
+                # References to the root are forward references, they don't need a build
+                if target is schema_index.document:
+                    continue
+                if (name := schema_index.get_name(target)) is None:
+                    return names, True
+
+                names.append(name)
+                targets.setdefault(name, (resource_uri, target))
+
+            return names, False
+
+        pending, _ = get_dependencies(schema)
+        while pending:
+            name = pending.pop()
+            if name in dependencies:
+                continue
+
+            dependencies[name], is_external = get_dependencies(targets[name][1])
+            if is_external:
+                external.add(name)
+            pending.extend(dependencies[name])
+
+        graph = RefGraph(dependencies)
+
+        waves: list[list[list[str]]] = []
+        levels: dict[str, int] = {}
+        for component in graph.components():
+            component_dependencies = {
+                dependency
+                for name in component
+                for dependency in graph.dependencies[name]
+                if dependency not in component
+            }
+            if any(name in external for name in component) or any(
+                dependency not in levels for dependency in component_dependencies
+            ):
+                continue
+
+            if all(isinstance(ref_cache.get(name), type) for name in component):
+                # Already built by a previous build of the namespace
+                level = -1
+            else:
+                level = 1 + max(
+                    (levels[dependency] for dependency in component_dependencies),
+                    default=-1,
+                )
+                if level == len(waves):
+                    waves.append([])
+                waves[level].append(component)
+
+            levels.update((name, level) for name in component)
+
+        def build_component(
+            component: list[str],
+        ) -> tuple[StagedRefCache, TypeParserOptions]:
+            component_options = options.copy()
+            component_options["ref_cache"] = StagedRefCache(ref_cache)
+            component_options["deferred_checks"] = []
+            if "slow_unions" in options:
+                component_options["slow_unions"] = []
+            if "interned_types" in options:
+                component_options["interned_types"] = dict(options["interned_types"])
+
+            for name in component:
+                resource_uri, target = targets[name]
+                RefTypeParser().parse_target(
+                    name, target, resource_uri, schema_index, **component_options
+                )
+
+            return component_options["ref_cache"], component_options  # type: ignore
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jambo-build"
+        ) as executor:
+            for wave in waves:
+                for component_cache, component_options in executor.map(
+                    build_component, wave
+                ):
+                    for name, ref in component_cache.staged.items():
+                        if ref is not None and not isinstance(
+                            ref_cache.get(name), type
+                        ):
+                            ref_cache[name] = ref
+
+                    options["deferred_checks"].extend(
+                        component_options["deferred_checks"]
+                    )
+                    if "slow_unions" in options:
+                        options["slow_unions"].extend(component_options["slow_unions"])
+                    if "interned_types" in options:
+                        for key, interned in component_options[
+                            "interned_types"
+                        ].items():
+                            options["interned_types"].setdefault(key, interned)
+
     @staticmethod
     def _get_schema_type(schema: JSONSchema) -> str | None:
         """
@@ -1,17 +1,28 @@
+from .build_options import BuildOptions, BuildProfile, UnionMode
 from .json_schema_type import (
     JSONSchema,
     JSONSchemaNativeTypes,
     JSONSchemaType,
     JSONType,
 )
-from .type_parser_options import RefCacheDict, TypeParserOptions
+from .type_parser_options import (
+    DeferredCheck,
+    RefCacheDict,
+    SlowUnion,
+    TypeParserOptions,
+)
 
 
 __all__ = [
+    "BuildOptions",
+    "BuildProfile",
+    "DeferredCheck",
     "JSONSchemaType",
     "JSONSchemaNativeTypes",
     "JSONType",
     "JSONSchema",
     "RefCacheDict",
+    "SlowUnion",
     "TypeParserOptions",
+    "UnionMode",
 ]
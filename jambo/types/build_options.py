@@ -0,0 +1,25 @@
+from jambo.exceptions import InvalidSchemaException
+
+from pydantic import BaseModel
+from typing_extensions import TYPE_CHECKING, Callable, Literal, TypedDict
+
+
+if TYPE_CHECKING:
+    from jambo.registry import SchemaRegistry
+
+
+BuildProfile = Literal["strict", "fast"]
+
+UnionMode = Literal["smart", "routed", "adaptive"]
+
+
+class BuildOptions(TypedDict, total=False):
+    trusted: bool
+    lazy: bool
+    profile: BuildProfile
+    on_deferred_errors: Callable[[type[BaseModel], list[InvalidSchemaException]], None]
+    background_checks: bool
+    union_mode: UnionMode
+    registry: "SchemaRegistry"
+    intern: bool
+    max_workers: int
@@ -1,12 +1,46 @@
+from jambo.types.build_options import BuildProfile, UnionMode
 from jambo.types.json_schema_type import JSONSchema
 
-from typing_extensions import ForwardRef, MutableMapping, TypedDict
+from typing_extensions import (
+    TYPE_CHECKING,
+    Any,
+    ForwardRef,
+    MutableMapping,
+    NamedTuple,
+    NotRequired,
+    TypedDict,
+)
+
+
+if TYPE_CHECKING:
+    from jambo.registry import SchemaIndex, SchemaRegistry
 
 
 RefCacheDict = MutableMapping[str, ForwardRef | type | None]
 
 
+class DeferredCheck(NamedTuple):
+    name: str
+    field_type: Any
+    field_properties: dict[str, Any]
+
+
+class SlowUnion(NamedTuple):
+    name: str
+    overlapping_branches: list[tuple[int, int]]
+
+
 class TypeParserOptions(TypedDict):
     required: bool
     context: JSONSchema
     ref_cache: RefCacheDict
+    lazy: NotRequired[bool]
+    profile: NotRequired[BuildProfile]
+    deferred_checks: NotRequired[list[DeferredCheck]]
+    slow_unions: NotRequired[list[SlowUnion]]
+    union_mode: NotRequired[UnionMode]
+    schema_index: NotRequired["SchemaIndex"]
+    base_uri: NotRequired[str]
+    registry: NotRequired["SchemaRegistry"]
+    registry_variant: NotRequired[str]
+    interned_types: NotRequired[dict[str, tuple[Any, dict]]]
@@ -0,0 +1,224 @@
+from jambo import SchemaConverter
+from jambo.cache import BoundedRefCache, CacheBudget, estimate_size
+from jambo.types import JSONSchema
+
+from pydantic import BaseModel, create_model
+from typing_extensions import ForwardRef, Optional
+
+from unittest import TestCase
+
+
+def make_model(name: str, **fields) -> type[BaseModel]:
+    return create_model(name, **fields)  # type: ignore
+
+
+class TestBoundedRefCache(TestCase):
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            BoundedRefCache(maxsize=-1)
+
+        with self.assertRaises(ValueError):
+            BoundedRefCache(max_memory=-1)
+
+        with self.assertRaises(ValueError):
+            BoundedRefCache(policy="fifo")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            CacheBudget(max_entries=-1)
+
+    def test_mapping_behaviour(self):
+        cache = BoundedRefCache()
+
+        cache["a"] = int
+        cache["b"] = None
+
+        self.assertIs(cache["a"], int)
+        self.assertIsNone(cache["b"])
+        self.assertEqual(list(cache), ["a", "b"])
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("c"))
+
+        del cache["a"]
+        self.assertNotIn("a", cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.memory_usage, 0)
+
+    def test_lru_eviction(self):
+        cache = BoundedRefCache(maxsize=2)
+
+        cache["a"] = make_model("A")
+        cache["b"] = make_model("B")
+        cache["a"]
+        cache["c"] = make_model("C")
+
+        self.assertEqual(set(cache), {"a", "c"})
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+    def test_lfu_eviction(self):
+        cache = BoundedRefCache(maxsize=2, policy="lfu")
+
+        cache["a"] = make_model("A")
+        cache["b"] = make_model("B")
+        cache["a"]
+        cache["a"]
+        cache["b"]
+        cache["c"] = make_model("C")
+
+        self.assertEqual(set(cache), {"a", "c"})
+
+    def test_memory_eviction(self):
+        cache = BoundedRefCache(max_memory=250, sizeof=lambda value: 100)
+
+        cache["a"] = int
+        cache["b"] = str
+        self.assertEqual(cache.memory_usage, 200)
+
+        cache["c"] = float
+
+        self.assertEqual(set(cache), {"b", "c"})
+        self.assertEqual(cache.memory_usage, 200)
+
+    def test_eviction_cascades_to_dependents(self):
+        cache = BoundedRefCache(maxsize=3)
+
+        address = make_model("Address", street=(str, None))
+        person = make_model("Person", address=(Optional[address], None))
+        tree = make_model("Tree", children=(list[ForwardRef("Tree")], []))
+
+        cache["address"] = address
+        cache["person"] = person
+        cache["Tree"] = tree
+        cache["other"] = make_model("Other")
+
+        # Evicting the address also evicts the person that depends on it
+        self.assertEqual(set(cache), {"Tree", "other"})
+        self.assertEqual(cache.cache_info().evictions, 2)
+
+    def test_newest_entry_dependencies_are_not_evicted(self):
+        cache = BoundedRefCache(maxsize=1)
+
+        address = make_model("Address", street=(str, None))
+        person = make_model("Person", address=(address, None))
+
+        cache["address"] = address
+        cache["person"] = person
+
+        self.assertEqual(set(cache), {"address", "person"})
+
+        cache["other"] = make_model("Other")
+
+        self.assertEqual(set(cache), {"other"})
+
+    def test_cache_info(self):
+        cache = BoundedRefCache(maxsize=4)
+
+        cache["a"] = int
+        cache["a"]
+        cache.get("b")
+
+        info = cache.cache_info()
+        self.assertEqual(
+            (info.hits, info.misses, info.maxsize, info.currsize), (1, 1, 4, 1)
+        )
+
+    def test_builds_only_count_lookups(self):
+        cache = BoundedRefCache(maxsize=4, policy="lfu")
+
+        for name in ("A", "B", "C", "D", "E"):
+            schema: JSONSchema = {
+                "title": f"{name}Root",
+                "type": "object",
+                "properties": {"node": {"$ref": f"#/$defs/{name}"}},
+                "$defs": {
+                    name: {
+                        "type": "object",
+                        "properties": {
+                            "children": {
+                                "type": "array",
+                                "items": {"$ref": f"#/$defs/{name}"},
+                            }
+                        },
+                    }
+                },
+            }
+            SchemaConverter.build(schema, cache)
+
+        # Resolving the forward references of a build doesn't count as a hit of older entries,
+        # so the oldest entries are evicted first
+        self.assertEqual(cache.cache_info().hits, 0)
+        self.assertEqual(list(cache), ["D", "DRoot", "E", "ERoot"])
+
+        SchemaConverter.build(
+            {
+                "title": "Reader",
+                "type": "object",
+                "properties": {"node": {"$ref": "#/$defs/D"}},
+                "$defs": {"D": {"type": "object", "properties": {}}},
+            },
+            cache,
+        )
+        self.assertEqual(cache.cache_info().hits, 1)
+
+    def test_estimate_size(self):
+        small = make_model("Small", a=(int, None))
+        large = make_model(
+            "Large", **{f"field_{i}": (Optional[str], None) for i in range(50)}
+        )
+
+        self.assertGreater(estimate_size(small), 0)
+        self.assertGreater(estimate_size(large), estimate_size(small))
+
+    def test_global_budget(self):
+        budget = CacheBudget(max_entries=3)
+        first = BoundedRefCache(budget=budget)
+        second = BoundedRefCache(budget=budget)
+
+        first["a"] = make_model("A")
+        second["b"] = make_model("B")
+        first["c"] = make_model("C")
+        second["d"] = make_model("D")
+
+        self.assertEqual(budget.entries, 3)
+        self.assertEqual(set(first), {"c"})
+        self.assertEqual(set(second), {"b", "d"})
+
+    def test_namespace_registry_is_bounded(self):
+        budget = CacheBudget(max_entries=6)
+        converter = SchemaConverter(
+            ref_cache_factory=lambda: BoundedRefCache(maxsize=4, budget=budget)
+        )
+
+        schema: JSONSchema = {
+            "type": "object",
+            "properties": {
+                "address": {"$ref": "#/$defs/address"},
+            },
+            "$defs": {
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                }
+            },
+        }
+
+        for namespace in ("tenant-a", "tenant-b"):
+            for i in range(5):
+                model = converter.build_with_cache(
+                    {**schema, "$id": namespace, "title": f"T{i}"}
+                )
+                self.assertEqual(
+                    model(address={"street": "Main"}).address.street,  # type: ignore
+                    "Main",
+                )
+
+                ref_cache = converter._namespace_registry[namespace]
+                self.assertIsInstance(ref_cache, BoundedRefCache)
+                self.assertLessEqual(len(ref_cache), 4)
+
+        self.assertLessEqual(budget.entries, 6)
+
+        # Evicted definitions are rebuilt on demand
+        model = converter.build_with_cache({**schema, "$id": "tenant-a", "title": "T0"})
+        self.assertEqual(model(address={"street": "Side"}).address.street, "Side")  # type: ignore
@@ -0,0 +1,119 @@
+from jambo.cache import DiskCache
+from jambo.cache.disk_cache import _jambo_version
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+
+SOURCE = "VALUE = 42\n"
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.directory.name)
+
+    def tearDown(self):
+        self.cache.clear()
+        self.directory.cleanup()
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.put("a", SOURCE)
+        module = self.cache.get("a")
+
+        self.assertIsNotNone(module)
+        self.assertEqual(module.VALUE, 42)  # type: ignore
+
+    def test_get_loads_from_disk_in_new_process(self):
+        self.cache.put("a", SOURCE)
+        self.cache.get("a")
+
+        # Simulates a fresh process, where the module was never imported
+        sys.modules.pop("_jambo_disk_cache_a")
+        module = DiskCache(self.directory.name).get("a")
+
+        self.assertEqual(module.VALUE, 42)  # type: ignore
+
+    def test_entries_are_stored_per_version(self):
+        self.cache.put("a", SOURCE)
+
+        entry = Path(self.directory.name) / DiskCache.version_tag() / "a.py"
+        self.assertTrue(entry.is_file())
+        self.assertIn("pydantic", DiskCache.version_tag())
+
+    def test_version_tag_changes_with_the_source(self):
+        version_tag = DiskCache.version_tag()
+        self.addCleanup(_jambo_version.cache_clear)
+
+        with mock.patch.object(Path, "read_bytes", return_value=b"changed"):
+            _jambo_version.cache_clear()
+            self.assertNotEqual(DiskCache.version_tag(), version_tag)
+
+        _jambo_version.cache_clear()
+        self.assertEqual(DiskCache.version_tag(), version_tag)
+
+    def test_corrupted_entries_are_misses(self):
+        for source in ("def broken(:\n", "raise RuntimeError('broken')\n"):
+            with self.subTest(source=source):
+                self.cache.put("a", source)
+
+                self.assertIsNone(self.cache.get("a"))
+                self.assertFalse(self.cache._entry_path("a").exists())
+                self.assertNotIn("_jambo_disk_cache_a", sys.modules)
+
+                self.cache.put("a", SOURCE)
+                self.assertEqual(self.cache.get("a").VALUE, 42)  # type: ignore
+                sys.modules.pop("_jambo_disk_cache_a")
+
+    def test_put_leaves_no_temporary_files(self):
+        self.cache.put("a", SOURCE)
+        self.cache.put("a", SOURCE)
+
+        files = list(Path(self.directory.name).rglob("*.tmp"))
+        self.assertEqual(files, [])
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = DiskCache(self.directory.name, max_size=len(SOURCE) * 2)
+
+        cache.put("a", SOURCE)
+        cache.put("b", SOURCE)
+        os.utime(cache._entry_path("a"), (0, 0))
+        cache.put("c", SOURCE)
+
+        self.assertFalse(cache._entry_path("a").exists())
+        self.assertTrue(cache._entry_path("b").exists())
+        self.assertTrue(cache._entry_path("c").exists())
+        self.assertLessEqual(cache.size(), cache.max_size)
+
+    def test_evicts_entries_of_other_versions_first(self):
+        cache = DiskCache(self.directory.name, max_size=len(SOURCE) * 2)
+
+        stale_directory = Path(self.directory.name) / "py0.0-jambo0-pydantic0"
+        stale_directory.mkdir()
+        (stale_directory / "a.py").write_text(SOURCE)
+
+        cache.put("b", SOURCE)
+        cache.put("c", SOURCE)
+
+        self.assertFalse((stale_directory / "a.py").exists())
+        self.assertTrue(cache._entry_path("b").exists())
+
+    def test_invalidate_and_clear(self):
+        self.cache.put("a", SOURCE)
+        self.cache.put("b", SOURCE)
+
+        self.assertTrue(self.cache.invalidate("a"))
+        self.assertFalse(self.cache.invalidate("a"))
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.clear()
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            DiskCache(self.directory.name, max_size=-1)
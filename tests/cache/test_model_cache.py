@@ -0,0 +1,84 @@
+from jambo.cache import ModelCache
+
+from pydantic import BaseModel
+
+from unittest import TestCase
+
+
+class ModelA(BaseModel):
+    pass
+
+
+class ModelB(BaseModel):
+    pass
+
+
+class TestModelCache(TestCase):
+    def test_get_and_put(self):
+        cache = ModelCache()
+
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", ModelA)
+
+        self.assertIs(cache.get("a"), ModelA)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_cache_info_counts_hits_and_misses(self):
+        cache = ModelCache()
+
+        cache.get("a")
+        cache.put("a", ModelA)
+        cache.get("a")
+        cache.get("a")
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.currsize, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = ModelCache(maxsize=2)
+
+        cache.put("a", ModelA)
+        cache.put("b", ModelB)
+        cache.get("a")
+        cache.put("c", ModelA)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+    def test_resize_evicts_entries(self):
+        cache = ModelCache(maxsize=3)
+
+        cache.put("a", ModelA)
+        cache.put("b", ModelB)
+        cache.put("c", ModelA)
+        cache.resize(1)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.cache_info().maxsize, 1)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ModelCache(maxsize=-1)
+
+        with self.assertRaises(ValueError):
+            ModelCache().resize(-1)
+
+    def test_invalidate_and_clear(self):
+        cache = ModelCache()
+
+        cache.put("a", ModelA)
+        cache.put("b", ModelB)
+
+        self.assertTrue(cache.invalidate("a"))
+        self.assertFalse(cache.invalidate("a"))
+        self.assertNotIn("a", cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.cache_info().hits, 0)
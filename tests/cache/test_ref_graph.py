@@ -0,0 +1,64 @@
+from jambo.cache import RefGraph
+
+from pydantic import create_model
+from typing_extensions import ForwardRef, Optional
+
+from unittest import TestCase
+
+
+class TestRefGraph(TestCase):
+    def test_components_are_in_topological_order(self):
+        graph = RefGraph(
+            {
+                "Root": ["A", "C"],
+                "A": ["B"],
+                "B": ["A", "C"],
+                "C": [],
+            }
+        )
+
+        self.assertEqual(graph.components(), [["C"], ["A", "B"], ["Root"]])
+
+    def test_is_recursive(self):
+        graph = RefGraph({"A": ["A"], "B": ["C"], "C": ["B"], "D": ["A"]})
+
+        recursive = {
+            tuple(component): graph.is_recursive(component)
+            for component in graph.components()
+        }
+
+        self.assertEqual(recursive, {("A",): True, ("B", "C"): True, ("D",): False})
+
+    def test_long_chains_are_not_recursive_calls(self):
+        size = 10_000
+        graph = RefGraph({f"n{i}": [f"n{i + 1}"] for i in range(size)})
+
+        components = graph.components()
+
+        self.assertEqual(len(components), size + 1)
+        self.assertEqual(components[0], [f"n{size}"])
+        self.assertEqual(components[-1], ["n0"])
+
+    def test_from_ref_cache(self):
+        leaf = create_model("Leaf", value=(int, None))
+        node = create_model(
+            "Node",
+            leaf=(Optional[leaf], None),
+            children=(list[ForwardRef("Node")], []),  # type: ignore
+        )
+        ref_cache = {"Leaf": leaf, "Node": node, "Pending": None}
+
+        graph = RefGraph.from_ref_cache(ref_cache)
+
+        self.assertEqual(graph.dependencies["Node"], ("Leaf", "Node"))
+        self.assertEqual(graph.dependencies["Leaf"], ())
+        self.assertEqual(graph.components(), [["Leaf"], ["Node"], ["Pending"]])
+
+        restricted = RefGraph.from_ref_cache(ref_cache, ["Node"])
+        self.assertEqual(
+            restricted.dependencies, {"Node": ("Leaf", "Node"), "Leaf": ()}
+        )
+
+        self.assertEqual(
+            RefGraph.from_ref_cache(ref_cache, ["Leaf"]).dependencies, {"Leaf": ()}
+        )
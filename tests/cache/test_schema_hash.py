@@ -0,0 +1,30 @@
+from jambo.cache import schema_hash
+
+from unittest import TestCase
+
+
+class TestSchemaHash(TestCase):
+    def test_schema_hash_is_stable(self):
+        schema = {"title": "Person", "type": "object"}
+
+        self.assertEqual(schema_hash(schema), schema_hash(dict(schema)))
+
+    def test_schema_hash_ignores_key_order(self):
+        schema_a = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+        }
+        schema_b = {
+            "properties": {"age": {"type": "integer"}, "name": {"type": "string"}},
+            "type": "object",
+            "title": "Person",
+        }
+
+        self.assertEqual(schema_hash(schema_a), schema_hash(schema_b))
+
+    def test_schema_hash_differs_for_different_schemas(self):
+        schema_a = {"title": "Person", "type": "object"}
+        schema_b = {"title": "Animal", "type": "object"}
+
+        self.assertNotEqual(schema_hash(schema_a), schema_hash(schema_b))
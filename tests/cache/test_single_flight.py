@@ -0,0 +1,76 @@
+from jambo.cache import SingleFlight
+
+from threading import Event, Thread
+from time import sleep
+from unittest import TestCase
+
+
+class TestSingleFlight(TestCase):
+    def run_concurrently(self, single_flight, fn, callers=4):
+        started = Event()
+        release = Event()
+        calls = []
+        outcomes = []
+
+        def blocking_fn():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return fn()
+
+        def call():
+            try:
+                outcomes.append(single_flight.do("key", blocking_fn))
+            except Exception as err:
+                outcomes.append(err)
+
+        threads = [Thread(target=call) for _ in range(callers)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+
+        # Gives the other callers time to block on the running call
+        sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        return calls, outcomes
+
+    def test_do_returns_result(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.in_flight(), 0)
+
+    def test_results_are_not_kept(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        single_flight.do("key", lambda: 1)
+
+        self.assertEqual(single_flight.do("key", lambda: 2), 2)
+
+    def test_concurrent_calls_share_one_run(self):
+        single_flight: SingleFlight[str, object] = SingleFlight()
+
+        calls, outcomes = self.run_concurrently(single_flight, object)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(outcomes), 4)
+        self.assertTrue(all(outcome is outcomes[0] for outcome in outcomes))
+        self.assertEqual(single_flight.in_flight(), 0)
+
+    def test_exceptions_are_shared(self):
+        single_flight: SingleFlight[str, object] = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        calls, outcomes = self.run_concurrently(single_flight, fail)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(outcomes), 4)
+        self.assertIsInstance(outcomes[0], ValueError)
+        self.assertTrue(all(outcome is outcomes[0] for outcome in outcomes))
+        self.assertEqual(single_flight.in_flight(), 0)
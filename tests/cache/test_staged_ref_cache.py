@@ -0,0 +1,80 @@
+from jambo.cache import StagedRefCache
+from jambo.types import RefCacheDict
+
+from typing_extensions import ForwardRef
+
+from unittest import TestCase
+
+
+class TestStagedRefCache(TestCase):
+    def test_reads_fall_back_to_base(self):
+        base: RefCacheDict = {"a": int}
+        staged = StagedRefCache(base)
+
+        self.assertIs(staged["a"], int)
+        self.assertIn("a", staged)
+        self.assertNotIn("b", staged)
+
+        with self.assertRaises(KeyError):
+            staged["b"]
+
+    def test_writes_are_staged_until_commit(self):
+        base: RefCacheDict = {"a": int}
+        staged = StagedRefCache(base)
+
+        staged["a"] = str
+        staged["b"] = float
+
+        self.assertIs(staged["a"], str)
+        self.assertEqual(set(staged), {"a", "b"})
+        self.assertEqual(len(staged), 2)
+        self.assertEqual(base, {"a": int})
+        self.assertEqual(staged.staged, {"a": str, "b": float})
+
+        staged.commit()
+
+        self.assertEqual(base, {"a": str, "b": float})
+        self.assertEqual(staged.staged, {})
+
+    def test_commit_skips_in_progress_sentinels(self):
+        base: RefCacheDict = {}
+        staged = StagedRefCache(base)
+
+        staged["a"] = None
+        staged["b"] = ForwardRef("b")
+
+        self.assertIsNone(staged["a"])
+
+        staged.commit()
+
+        self.assertEqual(base, {"b": ForwardRef("b")})
+
+    def test_deletes_are_staged(self):
+        base: RefCacheDict = {"a": int}
+        staged = StagedRefCache(base)
+
+        del staged["a"]
+
+        self.assertNotIn("a", staged)
+        self.assertEqual(list(staged), [])
+        with self.assertRaises(KeyError):
+            staged["a"]
+        with self.assertRaises(KeyError):
+            del staged["a"]
+
+        self.assertIn("a", base)
+
+        staged.commit()
+
+        self.assertNotIn("a", base)
+
+    def test_discard(self):
+        base: RefCacheDict = {"a": int}
+        staged = StagedRefCache(base)
+
+        staged["b"] = None
+        staged["a"] = str
+        staged.discard()
+
+        self.assertEqual(base, {"a": int})
+        self.assertIs(staged["a"], int)
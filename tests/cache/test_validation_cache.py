@@ -0,0 +1,46 @@
+from jambo.cache import ValidationCache
+
+from unittest import TestCase
+
+
+class TestValidationCache(TestCase):
+    def test_mark_validated(self):
+        cache = ValidationCache()
+
+        self.assertFalse(cache.is_validated(None, "a"))
+        cache.mark_validated(None, "a")
+
+        self.assertTrue(cache.is_validated(None, "a"))
+
+    def test_entries_are_keyed_by_dialect(self):
+        cache = ValidationCache()
+
+        cache.mark_validated("https://json-schema.org/draft/2020-12/schema", "a")
+
+        self.assertFalse(
+            cache.is_validated("http://json-schema.org/draft-07/schema#", "a")
+        )
+
+    def test_evicts_least_recently_used(self):
+        cache = ValidationCache(maxsize=2)
+
+        cache.mark_validated(None, "a")
+        cache.mark_validated(None, "b")
+        cache.is_validated(None, "a")
+        cache.mark_validated(None, "c")
+
+        self.assertTrue(cache.is_validated(None, "a"))
+        self.assertFalse(cache.is_validated(None, "b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = ValidationCache()
+
+        cache.mark_validated(None, "a")
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ValidationCache(maxsize=-1)
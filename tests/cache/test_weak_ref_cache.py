@@ -0,0 +1,85 @@
+from jambo import SchemaConverter
+from jambo.cache import WeakRefCache
+from jambo.types import JSONSchema
+
+from pydantic import create_model
+from typing_extensions import ForwardRef
+
+import gc
+from unittest import TestCase
+
+
+class TestWeakRefCache(TestCase):
+    def test_mapping_behaviour(self):
+        cache = WeakRefCache()
+        model = create_model("Model")
+
+        cache["model"] = model
+        cache["pending"] = None
+        cache["forward"] = ForwardRef("forward")
+
+        self.assertIs(cache["model"], model)
+        self.assertIsNone(cache["pending"])
+        self.assertEqual(set(cache), {"model", "pending", "forward"})
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(
+            dict(cache.items()),
+            {"model": model, "pending": None, "forward": ForwardRef("forward")},
+        )
+
+        cache["pending"] = model
+        self.assertIs(cache["pending"], model)
+
+        del cache["forward"]
+        self.assertNotIn("forward", cache)
+
+        with self.assertRaises(KeyError):
+            cache["missing"]
+
+    def test_unreferenced_types_are_collected(self):
+        cache = WeakRefCache()
+
+        model = create_model("Model")
+        cache["model"] = model
+        cache["forward"] = ForwardRef("model")
+
+        del model
+        gc.collect()
+
+        self.assertNotIn("model", cache)
+        self.assertEqual(list(cache), ["forward"])
+
+    def test_namespace_registry_with_weak_refs(self):
+        converter = SchemaConverter(ref_cache_factory=WeakRefCache)
+
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {
+                "address": {"$ref": "#/$defs/address"},
+            },
+            "$defs": {
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                }
+            },
+        }
+
+        person = converter.build_with_cache(schema)
+        gc.collect()
+
+        # The cached model keeps the models it depends on alive
+        address = converter.get_cached_ref("address")
+        self.assertIsNotNone(address)
+        self.assertIs(converter.get_cached_ref("Person"), person)
+
+        del person, address
+        gc.collect()
+
+        self.assertIsNone(converter.get_cached_ref("Person"))
+        self.assertIsNone(converter.get_cached_ref("address"))
+
+        person = converter.build_with_cache(schema)
+        self.assertEqual(person(address={"street": "Main"}).address.street, "Main")  # type: ignore
+        self.assertIs(converter.get_cached_ref("Person"), person)
@@ -0,0 +1,406 @@
+from jambo import SchemaConverter
+from jambo.codegen import SourceGenerator
+from jambo.exceptions import UnsupportedSchemaException
+from jambo.types import JSONSchema
+
+from pydantic import BaseModel, ValidationError, create_model
+
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from unittest import TestCase
+
+
+def import_source(source: str, module_name: str) -> ModuleType:
+    directory = tempfile.mkdtemp()
+    module_path = Path(directory) / f"{module_name}.py"
+    module_path.write_text(source)
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)  # type: ignore
+
+    return module
+
+
+class TestSourceGenerator(TestCase):
+    def assertSameValidation(self, runtime_model, generated_model, values):
+        self.assertEqual(
+            runtime_model.model_json_schema(), generated_model.model_json_schema()
+        )
+
+        for value in values:
+            try:
+                expected = runtime_model.model_validate(value).model_dump(mode="json")
+            except ValidationError:
+                with self.assertRaises(ValidationError):
+                    generated_model.model_validate(value)
+                continue
+
+            self.assertEqual(
+                generated_model.model_validate(value).model_dump(mode="json"),
+                expected,
+            )
+
+    def test_generated_source_does_not_depend_on_jambo(self):
+        schema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "blob": {"const": [1, 2]},
+            },
+        }
+
+        source = SchemaConverter.build_source(schema)
+
+        self.assertNotRegex(source, r"(?m)^\s*(from|import) (jambo|jsonschema)\b")
+
+    def test_generated_model_behaves_as_runtime_model(self):
+        schema: JSONSchema = {
+            "title": "Person",
+            "description": "A person",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 4, "pattern": "^[A-Z]"},
+                "first-name": {"type": "string", "default": "John"},
+                "age": {"type": "integer", "minimum": 0, "default": 3},
+                "score": {"type": "number", "exclusiveMaximum": 10.5},
+                "active": {"type": "boolean"},
+                "id": {
+                    "type": "string",
+                    "format": "uuid",
+                    "examples": ["9b2c1f0a-1c4e-4b6a-8f0a-0c1e2d3f4a5b"],
+                },
+                "born": {"type": "string", "format": "date"},
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "uniqueItems": True,
+                    "default": ["a"],
+                },
+                "status": {"enum": ["active", "inactive"], "default": "active"},
+                "kind": {"const": "person"},
+                "blob": {"const": [1, 2]},
+                "nickname": {"type": ["string", "null"]},
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                    "default": {"street": "Main"},
+                },
+            },
+            "required": ["name"],
+        }
+
+        runtime_model = SchemaConverter.build(schema)
+        module = import_source(SchemaConverter.build_source(schema), "generated_person")
+
+        self.assertSameValidation(
+            runtime_model,
+            module.Person,
+            [
+                {"name": "Jo"},
+                {"name": "jo"},
+                {"name": "Jo", "age": -1},
+                {"name": "Jo", "score": 10.5},
+                {"name": "Jo", "born": "2020-01-01", "active": True},
+                {"name": "Jo", "tags": ["a", "b", "a"]},
+                {"name": "Jo", "status": "inactive"},
+                {"name": "Jo", "status": "unknown"},
+                {"name": "Jo", "kind": "animal"},
+                {"name": "Jo", "blob": [1]},
+                {"name": "Jo", "nickname": None},
+                {"name": "Jo", "address": {"street": "Side"}},
+            ],
+        )
+
+        self.assertEqual(module.Person.__name__, "Person")
+        self.assertEqual(module.Person.__doc__, "A person")
+        self.assertEqual(module.Person(name="Jo").address.street, "Main")
+
+    def test_generated_one_of(self):
+        schema: JSONSchema = {
+            "title": "Shape",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "string", "maxLength": 5},
+                        {"type": "string", "minLength": 3},
+                        {"type": "integer"},
+                    ]
+                },
+                "pet": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "cat"}},
+                            "required": ["kind"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "dog"}},
+                            "required": ["kind"],
+                        },
+                    ],
+                    "discriminator": {"propertyName": "kind"},
+                },
+            },
+            "required": ["pet"],
+        }
+
+        runtime_model = SchemaConverter.build(schema)
+        module = import_source(SchemaConverter.build_source(schema), "generated_shape")
+
+        self.assertSameValidation(
+            runtime_model,
+            module.Shape,
+            [
+                {"value": "ab", "pet": {"kind": "cat"}},
+                {"value": "abcd", "pet": {"kind": "cat"}},
+                {"value": "abcdef", "pet": {"kind": "dog"}},
+                {"value": 1, "pet": {"kind": "dog"}},
+                {"pet": {"kind": "bird"}},
+            ],
+        )
+
+    def test_generated_recursive_models(self):
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "friends": {"type": "array", "items": {"$ref": "#"}},
+                "manager": {"$ref": "#/$defs/employee"},
+            },
+            "$defs": {
+                "employee": {
+                    "type": "object",
+                    "properties": {
+                        "subordinate": {"$ref": "#/$defs/employee"},
+                        "person": {"$ref": "#"},
+                    },
+                }
+            },
+        }
+
+        runtime_model = SchemaConverter.build(schema)
+        module = import_source(
+            SchemaConverter.build_source(schema), "generated_recursive"
+        )
+
+        self.assertSameValidation(
+            runtime_model,
+            module.Person,
+            [
+                {"name": "A", "friends": [{"name": "B", "friends": [{"name": 1}]}]},
+                {"manager": {"subordinate": {}, "person": {"name": "C"}}},
+            ],
+        )
+        self.assertEqual(
+            module.employee(person={"name": "D"}).person.name,  # type: ignore
+            "D",
+        )
+
+    def test_generated_tagged_union_behaves_as_runtime_model(self):
+        schema: JSONSchema = {
+            "title": "Drawing",
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"const": "circle"},
+                                "radius": {"type": "number"},
+                            },
+                            "required": ["kind", "radius"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"enum": ["square"]},
+                                "side": {"type": "number"},
+                            },
+                            "required": ["kind", "side"],
+                        },
+                    ]
+                },
+            },
+            "required": ["shape"],
+        }
+
+        runtime_model = SchemaConverter.build(schema)
+        source = SchemaConverter.build_source(schema)
+        self.assertIn("TagDiscriminator('kind')", source)
+
+        module = import_source(source, "generated_tagged_union")
+
+        self.assertSameValidation(
+            runtime_model,
+            module.Drawing,
+            [
+                {"shape": {"kind": "circle", "radius": 1}},
+                {"shape": {"kind": "square", "side": 2}},
+                {"shape": {"kind": "square", "radius": 1}},
+                {"shape": {"kind": "triangle"}},
+                {"shape": {"radius": 1}},
+            ],
+        )
+
+    def test_generated_union_modes_behave_as_runtime_model(self):
+        schema: JSONSchema = {
+            "title": "Routed",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "anyOf": [
+                        {"type": "integer"},
+                        {"type": "string", "maxLength": 2},
+                        {
+                            "type": "object",
+                            "properties": {"name": {"type": "string"}},
+                        },
+                    ]
+                },
+                "amount": {
+                    "oneOf": [
+                        {"type": "integer", "maximum": 9},
+                        {"type": "number", "minimum": 5},
+                    ]
+                },
+            },
+        }
+
+        for union_mode, validator_name in (
+            ("routed", "RoutedUnionValidator"),
+            ("adaptive", "AdaptiveUnionValidator"),
+        ):
+            with self.subTest(union_mode=union_mode):
+                runtime_model = SchemaConverter.build(schema, union_mode=union_mode)
+                source = SchemaConverter.build_source(schema, union_mode=union_mode)
+                self.assertIn(f"{validator_name}(", source)
+
+                module = import_source(source, f"generated_{union_mode}")
+
+                self.assertSameValidation(
+                    runtime_model,
+                    module.Routed,
+                    [
+                        {"value": 1, "amount": 1},
+                        {"value": "ab", "amount": 10.5},
+                        {"value": {"name": "A"}},
+                        {"value": "abc"},
+                        {"value": True},
+                        {"amount": 7},
+                    ],
+                )
+
+    def test_generated_lazy_models(self):
+        schema: JSONSchema = {
+            "title": "LazyPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "friends": {"type": "array", "items": {"$ref": "#"}},
+            },
+        }
+
+        source = SchemaConverter.build_source(schema, lazy=True)
+        self.assertNotIn("model_rebuild()", source)
+
+        module = import_source(source, "generated_lazy")
+        self.assertFalse(module.LazyPerson.__pydantic_complete__)
+
+        obj = module.LazyPerson(name="A", friends=[{"name": "B"}])
+        self.assertEqual(obj.friends[0].name, "B")
+
+    def test_build_namespace_source(self):
+        converter = SchemaConverter()
+
+        converter.build_with_cache(
+            {
+                "title": "Person",
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+            }
+        )
+        converter.build_with_cache(
+            {
+                "title": "Company",
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+            }
+        )
+
+        module = import_source(converter.build_namespace_source(), "generated_ns")
+
+        self.assertEqual(set(module.__all__), {"Person", "Company"})
+
+    def test_identifiers_are_sanitized_and_unique(self):
+        model_a = create_model("a.b", name=(str, ...))
+        model_b = create_model("a_b", name=(str, ...))
+        model_c = create_model("class", name=(str, ...))
+
+        source = SourceGenerator().generate([model_a, model_b, model_c])
+        module = import_source(source, "generated_identifiers")
+
+        self.assertEqual(module.__all__, ["a_b", "a_b_2", "class_2"])
+        self.assertEqual(module.a_b.__name__, "a.b")
+        self.assertEqual(module.class_2.__name__, "class")
+
+    def test_unsupported_type(self):
+        class Custom:
+            pass
+
+        model = create_model(
+            "Model", value=(Custom, ...), __config__={"arbitrary_types_allowed": True}
+        )  # type: ignore
+
+        with self.assertRaises(UnsupportedSchemaException):
+            SourceGenerator().generate([model])
+
+    def test_generated_models_are_base_models(self):
+        schema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+        module = import_source(SchemaConverter.build_source(schema), "generated_base")
+
+        self.assertTrue(issubclass(module.Person, BaseModel))
+
+    def test_generated_interned_models_are_shared(self):
+        address: JSONSchema = {
+            "type": "object",
+            "properties": {"street": {"type": "string"}},
+        }
+        schema: JSONSchema = {
+            "title": "InternedSource",
+            "type": "object",
+            "properties": {"home": address, "work": address},
+        }
+
+        runtime_model = SchemaConverter.build(schema, intern=True)
+        source = SchemaConverter.build_source(schema, intern=True)
+        module = import_source(source, "generated_interned_models")
+
+        self.assertEqual(source.count("= create_model("), 2)
+        generated_model = module.InternedSource
+        self.assertIs(
+            generated_model.model_fields["home"].annotation,
+            generated_model.model_fields["work"].annotation,
+        )
+        self.assertSameValidation(
+            runtime_model,
+            generated_model,
+            [
+                {"home": {"street": "A"}, "work": {"street": "B"}},
+                {"work": {"street": 1}},
+            ],
+        )
@@ -1,9 +1,12 @@
 from jambo.exceptions import InvalidSchemaException
+from jambo.parser._validators import AdaptiveUnionValidator
 from jambo.parser.anyof_type_parser import AnyOfTypeParser
 
-from typing_extensions import Annotated, Union, get_args, get_origin
+from pydantic import Discriminator, TypeAdapter, ValidationError, WrapValidator
+from typing_extensions import Annotated, Optional, Union, get_args, get_origin
 
-from unittest import TestCase
+from contextlib import ExitStack
+from unittest import TestCase, mock
 
 
 class TestAnyOfTypeParser(TestCase):
@@ -42,16 +45,9 @@ class TestAnyOfTypeParser(TestCase):
             "placeholder", properties, required=True
         )
 
-        # check union type has string and int
+        # check union type has string and int, left bare since they have no constraints
         self.assertEqual(get_origin(type_parsing), Union)
-
-        type_1, type_2 = get_args(type_parsing)
-
-        self.assertEqual(get_origin(type_1), Annotated)
-        self.assertIn(str, get_args(type_1))
-
-        self.assertEqual(get_origin(type_2), Annotated)
-        self.assertIn(int, get_args(type_2))
+        self.assertEqual(get_args(type_parsing), (str, int))
 
     def test_any_of_string_or_int_with_default(self):
         """
@@ -70,16 +66,9 @@ class TestAnyOfTypeParser(TestCase):
             "placeholder", properties
         )
 
-        # check union type has string and int
+        # check union type has string and int, left bare since they have no constraints
         self.assertEqual(get_origin(type_parsing), Union)
-
-        type_1, type_2 = get_args(type_parsing)
-
-        self.assertEqual(get_origin(type_1), Annotated)
-        self.assertIn(str, get_args(type_1))
-
-        self.assertEqual(get_origin(type_2), Annotated)
-        self.assertIn(int, get_args(type_2))
+        self.assertEqual(get_args(type_parsing), (str, int))
 
         self.assertEqual(type_validator["default"], 42)
 
@@ -141,3 +130,265 @@ class TestAnyOfTypeParser(TestCase):
         _, type_validator = AnyOfTypeParser().from_properties("placeholder", properties)
 
         self.assertEqual(type_validator["examples"], ["100", 100])
+
+    def test_any_of_tagged_objects(self):
+        properties = {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {
+                        "kind": {"const": "circle"},
+                        "radius": {"type": "number"},
+                    },
+                    "required": ["kind"],
+                },
+                {
+                    "type": "object",
+                    "properties": {
+                        "kind": {"const": "square"},
+                        "side": {"type": "number"},
+                    },
+                    "required": ["kind"],
+                },
+            ],
+        }
+
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder", properties, required=True, ref_cache={}
+        )
+
+        self.assertEqual(get_origin(type_parsing), Annotated)
+        self.assertTrue(
+            any(isinstance(item, Discriminator) for item in type_parsing.__metadata__)
+        )
+
+        adapter = TypeAdapter(type_parsing)
+        self.assertEqual(adapter.validate_python({"kind": "square", "side": 2}).side, 2)
+
+        with self.assertRaises(ValidationError):
+            adapter.validate_python({"kind": "triangle"})
+
+    def test_any_of_optional_tagged_objects(self):
+        properties = {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {"kind": {"const": "circle"}},
+                    "required": ["kind"],
+                },
+                {
+                    "type": "object",
+                    "properties": {"kind": {"const": "square"}},
+                    "required": ["kind"],
+                },
+            ],
+        }
+
+        type_parsing, type_validator = AnyOfTypeParser().from_properties(
+            "placeholder", properties, required=False, ref_cache={}
+        )
+
+        tagged_type, none_type = get_args(type_parsing)
+        self.assertIs(none_type, type(None))
+        self.assertTrue(
+            any(isinstance(item, Discriminator) for item in tagged_type.__metadata__)
+        )
+        self.assertIsNone(type_validator["default"])
+
+        adapter = TypeAdapter(type_parsing)
+        self.assertIsNone(adapter.validate_python(None))
+        self.assertEqual(adapter.validate_python({"kind": "square"}).kind, "square")
+
+    def test_any_of_routed_by_json_type(self):
+        properties = {
+            "anyOf": [
+                {"type": "integer"},
+                {"type": "string", "maxLength": 2},
+                {"type": "string", "pattern": "^[a-z]+$"},
+                {"type": "null"},
+            ],
+        }
+
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder", properties, required=True, union_mode="routed"
+        )
+
+        (validator,) = [
+            item.func
+            for item in type_parsing.__metadata__
+            if isinstance(item, WrapValidator)
+        ]
+        self.assertEqual(validator.get_route("string"), [1, 2])
+        self.assertEqual(validator.get_route("number"), [0])
+        self.assertEqual(validator.get_route("null"), [3])
+        self.assertEqual(validator.get_route(None), [0, 1, 2, 3])
+
+        adapter = TypeAdapter(type_parsing)
+        self.assertEqual(adapter.validate_python(1), 1)
+        self.assertEqual(adapter.validate_python("A1"), "A1")
+        self.assertEqual(adapter.validate_python("abc"), "abc")
+        self.assertIsNone(adapter.validate_python(None))
+
+        # Values are only tried against the branches accepting their JSON type
+        for value in ("ABC", True, [1]):
+            with self.assertRaises(ValidationError):
+                adapter.validate_python(value)
+
+    def test_any_of_nullable_type_is_optional(self):
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder",
+            {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            required=True,
+        )
+
+        self.assertEqual(type_parsing, Optional[str])
+        self.assertEqual(TypeAdapter(type_parsing).core_schema["type"], "nullable")
+
+    def test_any_of_keeps_constraints_of_its_types(self):
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder",
+            {"anyOf": [{"type": "string", "maxLength": 2}, {"type": "null"}]},
+            required=True,
+        )
+
+        type_1, type_2 = get_args(type_parsing)
+
+        self.assertEqual(get_origin(type_1), Annotated)
+        self.assertIn(str, get_args(type_1))
+        self.assertIs(type_2, type(None))
+
+        with self.assertRaises(ValidationError):
+            TypeAdapter(type_parsing).validate_python("abc")
+
+    def test_any_of_adaptive_order(self):
+        properties = {
+            "anyOf": [
+                {"type": "integer"},
+                {"type": "string", "maxLength": 2},
+                {"type": "string"},
+            ],
+        }
+
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder", properties, required=True, union_mode="adaptive"
+        )
+
+        (validator,) = [
+            item.func
+            for item in type_parsing.__metadata__
+            if isinstance(item, WrapValidator)
+        ]
+        validator.reorder_interval = 5
+
+        adapter = TypeAdapter(type_parsing)
+        for value in (1, "abc", "abcd", "abcde", "ab"):
+            self.assertEqual(adapter.validate_python(value), value)
+
+        # The branches were reordered before validating the fifth value,
+        # which was still matched by the first matching branch of the schema
+        self.assertEqual(validator.counts, [1, 1, 3])
+        self.assertEqual(validator.order, [2, 0, 1])
+
+        # Branches not accepting the JSON type of the value are never tried
+        with mock.patch.object(
+            validator.adapters[0],
+            "validate_python",
+            wraps=validator.adapters[0].validate_python,
+        ) as integer_branch_spy:
+            self.assertEqual(adapter.validate_python("abc"), "abc")
+            integer_branch_spy.assert_not_called()
+
+        with self.assertRaises(ValidationError):
+            adapter.validate_python([1])
+
+        validator.reset()
+        self.assertEqual(validator.counts, [0, 0, 0])
+        self.assertEqual(validator.order, [0, 1, 2])
+
+    def test_any_of_adaptive_only_checks_overlapping_branches(self):
+        # Every pair of branches is disjoint, but no single property tags all of them
+        branches = [
+            {
+                "type": "object",
+                "properties": {"x": {"const": x}, "y": {"const": y}},
+                "required": ["x", "y"],
+            }
+            for x, y in ((1, 1), (1, 2), (2, 1), (2, 2))
+        ]
+
+        type_parsing, _ = AnyOfTypeParser().from_properties(
+            "placeholder",
+            {"anyOf": branches},
+            required=True,
+            ref_cache={},
+            union_mode="adaptive",
+        )
+        (validator,) = [
+            item.func
+            for item in type_parsing.__metadata__
+            if isinstance(item, WrapValidator)
+        ]
+        self.assertEqual(validator.overlapping, [])
+
+        def count_attempts(validator):
+            validator.reorder_interval = 10
+            adapter = TypeAdapter(
+                Annotated[Union[(*validator.subfield_types,)], WrapValidator(validator)]
+            )
+            for _ in range(10):
+                adapter.validate_python({"x": 2, "y": 2})
+
+            with ExitStack() as stack:
+                spies = [
+                    stack.enter_context(
+                        mock.patch.object(
+                            branch, "validate_python", wraps=branch.validate_python
+                        )
+                    )
+                    for branch in validator.adapters
+                ]
+                self.assertEqual(adapter.validate_python({"x": 2, "y": 2}).x, 2)
+            return sum(spy.call_count for spy in spies)
+
+        # Once reordered, the last branch is tried first and no earlier branch can match
+        default_validator = AdaptiveUnionValidator(
+            validator.subfield_types, branch_types=validator.branch_types
+        )
+        self.assertEqual(count_attempts(validator), 1)
+        self.assertEqual(count_attempts(default_validator), 4)
+
+    def test_any_of_adaptive_result_does_not_depend_on_order(self):
+        for branches, value, expected in (
+            ([{"type": "integer"}, {"type": "string"}], "1", "1"),
+            ([{"type": "number"}, {"type": "integer"}], 1, 1),
+            ([{"type": "string"}, {"type": "integer"}], "1", "1"),
+            ([{"type": "integer"}, {"type": "boolean"}], True, True),
+        ):
+            with self.subTest(branches=branches, value=value):
+                type_parsing, _ = AnyOfTypeParser().from_properties(
+                    "placeholder",
+                    {"anyOf": branches},
+                    required=True,
+                    union_mode="adaptive",
+                )
+                (validator,) = [
+                    item.func
+                    for item in type_parsing.__metadata__
+                    if isinstance(item, WrapValidator)
+                ]
+                validator.reorder_interval = 2
+                adapter = TypeAdapter(type_parsing)
+
+                result = adapter.validate_python(value)
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+
+                # Reordered so the last branch of the schema is tried first
+                validator._counts = [0, 10]
+                result = adapter.validate_python(value)
+                self.assertEqual(validator.order, [1, 0])
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+
+                # Values only matching in lax mode use the order of the schema
+                self.assertEqual(adapter.validate_python(1.0), 1)
@@ -1,10 +1,21 @@
 from jambo import SchemaConverter
 from jambo.exceptions import InvalidSchemaException
+from jambo.parser._validators import AdaptiveUnionValidator
 from jambo.parser.oneof_type_parser import OneOfTypeParser
 
-from pydantic import ValidationError
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    TypeAdapter,
+    ValidationError,
+    WrapValidator,
+)
+from typing_extensions import Annotated, Union, get_args
 
-from unittest import TestCase
+import warnings
+from contextlib import ExitStack
+from datetime import date
+from unittest import TestCase, mock
 
 
 class TestOneOfTypeParser(TestCase):
@@ -600,3 +611,500 @@ class TestOneOfTypeParser(TestCase):
             model_schema["properties"]["value"]["examples"],
             ["example1", 2],
         )
+
+    def test_oneof_branch_validators_are_compiled_once(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "integer", "maximum": 9},
+                        {"type": "number", "minimum": 10},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        with mock.patch(
+            "jambo.parser._validators.TypeAdapter", wraps=TypeAdapter
+        ) as type_adapter_spy:
+            for value in (1, 10.5, 2, 11.5):
+                self.assertEqual(Model(value=value).value, value)  # type: ignore
+
+            with self.assertRaises(ValidationError):
+                Model(value=9.5)
+
+        self.assertEqual(type_adapter_spy.call_count, 2)
+
+    def test_oneof_returns_matched_branch_result(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"count": {"type": "integer"}},
+                            "required": ["count"],
+                        },
+                        {"type": "string", "format": "date"},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        obj = Model(value={"count": "1"})
+        self.assertIsInstance(obj.value, BaseModel)  # type: ignore
+        self.assertEqual(obj.value.count, 1)  # type: ignore
+
+        self.assertEqual(Model(value="2000-01-01").value, date(2000, 1, 1))  # type: ignore
+
+    def test_oneof_stops_at_second_match(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "string", "maxLength": 3},
+                        {"type": "integer"},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        (one_of_validator,) = [
+            item.func
+            for item in Model.model_fields["value"].metadata
+            if isinstance(item, WrapValidator)
+        ]
+        last_adapter = one_of_validator.adapters[-1]
+
+        with mock.patch.object(
+            last_adapter, "validate_python", wraps=last_adapter.validate_python
+        ) as last_adapter_spy:
+            with self.assertRaises(ValidationError) as ctx:
+                Model(value="abc")
+
+            last_adapter_spy.assert_not_called()
+
+            self.assertEqual(Model(value="abcd").value, "abcd")  # type: ignore
+            last_adapter_spy.assert_called_once()
+
+        self.assertIn("Value matches multiple oneOf schemas", str(ctx.exception))
+
+    def test_oneof_infers_tagged_union(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"const": "circle"},
+                                "radius": {"type": "number"},
+                            },
+                            "required": ["kind", "radius"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"enum": ["square"]},
+                                "side": {"type": "number"},
+                            },
+                            "required": ["kind", "side"],
+                        },
+                    ]
+                },
+            },
+            "required": ["shape"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        metadata = Model.model_fields["shape"].metadata
+        self.assertFalse(any(isinstance(item, WrapValidator) for item in metadata))
+        self.assertTrue(any(isinstance(item, Discriminator) for item in metadata))
+
+        self.assertEqual(Model(shape={"kind": "circle", "radius": 1}).shape.radius, 1)  # type: ignore
+        self.assertEqual(Model(shape={"kind": "square", "side": 2}).shape.side, 2)  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            Model(shape={"kind": "square", "radius": 1})
+
+        with self.assertRaises(ValidationError):
+            Model(shape={"kind": "triangle"})
+
+        with self.assertRaises(ValidationError):
+            Model(shape={"radius": 1})
+
+    def test_oneof_optional_field_is_a_nullable_tagged_union(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": 1}},
+                            "required": ["kind"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": 2}},
+                            "required": ["kind"],
+                        },
+                    ]
+                },
+            },
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        tagged_type, none_type = get_args(Model.model_fields["shape"].annotation)
+        self.assertIs(none_type, type(None))
+        self.assertTrue(
+            any(isinstance(item, Discriminator) for item in tagged_type.__metadata__)
+        )
+
+        self.assertIsNone(Model().shape)  # type: ignore
+        self.assertEqual(Model(shape={"kind": 2}).shape.kind, 2)  # type: ignore
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(Model().model_dump(), {"shape": None})
+            self.assertEqual(
+                Model(shape={"kind": 2}).model_dump(), {"shape": {"kind": 2}}
+            )
+
+    def test_oneof_without_distinct_required_tags_is_not_tagged(self):
+        branch = {
+            "type": "object",
+            "properties": {"kind": {"const": "a"}, "value": {"type": "string"}},
+            "required": ["kind"],
+        }
+        for other in (
+            {
+                **branch,
+                "properties": {"kind": {"const": "a"}, "value": {"type": "integer"}},
+            },
+            {**branch, "required": []},
+            {**branch, "properties": {"kind": {"enum": ["b", "c"]}}},
+        ):
+            with self.subTest(other=other):
+                schema = {
+                    "title": "Test",
+                    "type": "object",
+                    "properties": {"value": {"oneOf": [branch, other]}},
+                    "required": ["value"],
+                }
+
+                Model = SchemaConverter.build(schema)
+
+                metadata = Model.model_fields["value"].metadata
+                self.assertFalse(
+                    any(isinstance(item, Discriminator) for item in metadata)
+                )
+
+    def test_oneof_branch_without_properties_is_not_tagged(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "a"}},
+                            "required": ["kind"],
+                        },
+                        {"type": "object", "required": ["kind"]},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        metadata = Model.model_fields["value"].metadata
+        self.assertFalse(any(isinstance(item, Discriminator) for item in metadata))
+        self.assertIsNotNone(Model(value={"kind": "b"}).value)  # type: ignore
+
+    def test_oneof_disjoint_branches_are_a_plain_union(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                        {
+                            "type": "object",
+                            "properties": {"count": {"type": "integer"}},
+                        },
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        metadata = Model.model_fields["value"].metadata
+        self.assertFalse(any(isinstance(item, WrapValidator) for item in metadata))
+
+        # Values are matched by their own JSON type, "1" is only a string
+        self.assertEqual(Model(value="1").value, "1")  # type: ignore
+        self.assertEqual(Model(value=1).value, 1)  # type: ignore
+        self.assertEqual(Model(value={"count": 2}).value.count, 2)  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            Model(value=[1])
+
+    def test_oneof_optional_objects_with_distinct_tags_are_a_nullable_tagged_union(
+        self,
+    ):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "a"}},
+                            "required": ["kind"],
+                        },
+                        {"$ref": "#/$defs/b"},
+                    ]
+                },
+            },
+            "$defs": {
+                "b": {
+                    "type": "object",
+                    "properties": {"kind": {"enum": ["b"]}},
+                    "required": ["kind"],
+                }
+            },
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        metadata = Model.model_fields["shape"].metadata
+        self.assertFalse(any(isinstance(item, WrapValidator) for item in metadata))
+
+        tagged_type, _ = get_args(Model.model_fields["shape"].annotation)
+        self.assertTrue(
+            any(isinstance(item, Discriminator) for item in tagged_type.__metadata__)
+        )
+
+        self.assertIsNone(Model().shape)  # type: ignore
+        self.assertEqual(Model(shape={"kind": "b"}).shape.kind.value, "b")  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            Model(shape={"kind": "c"})
+
+    def test_oneof_overlapping_numbers_keep_the_exclusivity_check(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "integer", "maximum": 9},
+                        {"type": "number", "minimum": 5},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        metadata = Model.model_fields["value"].metadata
+        self.assertTrue(any(isinstance(item, WrapValidator) for item in metadata))
+
+        with self.assertRaises(ValidationError) as ctx:
+            Model(value=7)
+
+        self.assertIn("matches multiple oneOf schemas", str(ctx.exception))
+
+    def test_oneof_routed_by_json_type(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "integer", "maximum": 9},
+                        {"type": "number", "minimum": 5},
+                        {"type": "string"},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema, union_mode="routed")
+
+        (validator,) = [
+            item.func
+            for item in Model.model_fields["value"].metadata
+            if isinstance(item, WrapValidator)
+        ]
+        self.assertEqual(validator.get_route("integer"), [0, 1])
+        self.assertEqual(validator.get_route("string"), [2])
+
+        self.assertEqual(Model(value=1).value, 1)  # type: ignore
+        self.assertEqual(Model(value=10.5).value, 10.5)  # type: ignore
+        self.assertEqual(Model(value="1").value, "1")  # type: ignore
+
+        with self.assertRaises(ValidationError) as ctx:
+            Model(value=7)
+
+        self.assertIn("matches multiple oneOf schemas", str(ctx.exception))
+
+    def test_oneof_adaptive_only_checks_branches_of_the_json_type(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer", "maximum": 9},
+                        {"type": "number", "minimum": 5},
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema, union_mode="adaptive")
+
+        (validator,) = SchemaConverter.get_adaptive_unions(Model).values()
+        self.assertEqual(validator.branch_types, [["string"], ["integer"], ["number"]])
+
+        string_adapter, integer_adapter, number_adapter = validator.adapters
+        with (
+            mock.patch.object(
+                integer_adapter,
+                "validate_python",
+                wraps=integer_adapter.validate_python,
+            ) as integer_spy,
+            mock.patch.object(
+                number_adapter, "validate_python", wraps=number_adapter.validate_python
+            ) as number_spy,
+        ):
+            self.assertEqual(Model(value="a").value, "a")  # type: ignore
+            integer_spy.assert_not_called()
+            number_spy.assert_not_called()
+
+        self.assertEqual(Model(value=1).value, 1)  # type: ignore
+        with self.assertRaises(ValidationError) as ctx:
+            Model(value=7)
+
+        self.assertIn("matches multiple oneOf schemas", str(ctx.exception))
+        self.assertEqual(validator.counts, [1, 1, 0])
+
+    def test_oneof_adaptive_only_checks_overlapping_branches(self):
+        # Every pair of branches is disjoint, but no single property tags all of them
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {"x": {"const": x}, "y": {"const": y}},
+                            "required": ["x", "y"],
+                        }
+                        for x, y in ((1, 1), (1, 2), (2, 1), (2, 2))
+                    ]
+                },
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema, union_mode="adaptive")
+        (validator,) = SchemaConverter.get_adaptive_unions(Model).values()
+        self.assertEqual(validator.overlapping, [])
+
+        def count_attempts(validator):
+            validator.reorder_interval = 10
+            adapter = TypeAdapter(
+                Annotated[Union[(*validator.subfield_types,)], WrapValidator(validator)]
+            )
+            for _ in range(10):
+                adapter.validate_python({"x": 2, "y": 2})
+
+            with ExitStack() as stack:
+                spies = [
+                    stack.enter_context(
+                        mock.patch.object(
+                            branch, "validate_python", wraps=branch.validate_python
+                        )
+                    )
+                    for branch in validator.adapters
+                ]
+                self.assertEqual(adapter.validate_python({"x": 2, "y": 2}).y, 2)
+            return sum(spy.call_count for spy in spies)
+
+        # Once reordered, the last branch is tried first and no other branch can match
+        default_validator = AdaptiveUnionValidator(
+            validator.subfield_types, one_of=True, branch_types=validator.branch_types
+        )
+        self.assertEqual(count_attempts(validator), 1)
+        self.assertEqual(count_attempts(default_validator), 4)
+
+    def test_oneof_adaptive_result_does_not_depend_on_order(self):
+        schema = {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "value": {"oneOf": [{"type": "boolean"}, {"type": "integer"}]},
+            },
+            "required": ["value"],
+        }
+
+        Model = SchemaConverter.build(schema, union_mode="adaptive")
+        (validator,) = SchemaConverter.get_adaptive_unions(Model).values()
+        validator.reorder_interval = 4
+
+        for value in (1, 2, 3):
+            result = Model(value=value).value  # type: ignore
+            self.assertIs(type(result), int)
+            self.assertEqual(result, value)
+        self.assertEqual(validator.counts, [0, 3])
+
+        # Reordered so the integer branch is tried first
+        self.assertIs(Model(value=True).value, True)  # type: ignore
+        self.assertEqual(validator.order, [1, 0])
+
+        result = Model(value=1).value  # type: ignore
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+        self.assertIs(Model(value=False).value, False)  # type: ignore
+
+        # Values only matching in lax mode must match a single branch
+        with self.assertRaises(ValidationError) as ctx:
+            Model(value="1")
+        self.assertIn("matches multiple oneOf schemas", str(ctx.exception))
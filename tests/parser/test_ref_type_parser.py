@@ -1,10 +1,12 @@
+from jambo import SchemaConverter
 from jambo.exceptions import InternalAssertionException, InvalidSchemaException
 from jambo.parser import ObjectTypeParser, RefTypeParser
+from jambo.registry import SchemaIndex
 
 from pydantic import ValidationError
 from typing_extensions import ForwardRef
 
-from unittest import TestCase
+from unittest import TestCase, mock
 
 
 class TestRefTypeParser(TestCase):
@@ -520,3 +522,153 @@ class TestRefTypeParser(TestCase):
                 {"name": "Jane", "age": 25},
             ],
         )
+
+    def test_ref_type_parser_with_definitions(self):
+        properties = {
+            "title": "person",
+            "$ref": "#/definitions/person",
+            "definitions": {
+                "person": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "friend": {"$ref": "#/definitions/person"},
+                    },
+                }
+            },
+        }
+
+        model = SchemaConverter.build(properties)
+
+        obj = model(name="John", friend={"name": "Jane"})
+        self.assertEqual(obj.friend.name, "Jane")  # type: ignore
+
+    def test_ref_type_parser_with_escaped_pointer(self):
+        properties = {
+            "title": "person",
+            "type": "object",
+            "properties": {
+                "address": {"$ref": "#/$defs/a~1b~0c"},
+                "street": {"$ref": "#/$defs/a~1b~0c/properties/street"},
+                "tags": {"$ref": "#/$defs/tag%20list"},
+            },
+            "$defs": {
+                "a/b~c": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string", "maxLength": 4}},
+                },
+                "tag list": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+
+        model = SchemaConverter.build(properties)
+
+        obj = model(address={"street": "Main"}, street="High", tags=["a"])
+        self.assertEqual(obj.address.street, "Main")  # type: ignore
+        self.assertEqual(obj.tags, ["a"])  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            model(street=123)
+
+    def test_ref_type_parser_with_anchor(self):
+        properties = {
+            "title": "person",
+            "type": "object",
+            "properties": {"home": {"$ref": "#home-address"}},
+            "$defs": {
+                "address": {
+                    "$anchor": "home-address",
+                    "type": "object",
+                    "properties": {"city": {"type": "string"}},
+                },
+            },
+        }
+
+        model = SchemaConverter.build(properties)
+
+        obj = model(home={"city": "Lisbon"})
+        self.assertEqual(type(obj.home).__name__, "address")  # type: ignore
+        self.assertEqual(obj.home.city, "Lisbon")  # type: ignore
+
+    def test_ref_type_parser_with_draft_07_anchor(self):
+        properties = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "person",
+            "type": "object",
+            "properties": {"work": {"$ref": "#work-address"}},
+            "definitions": {
+                "address": {
+                    "$id": "#work-address",
+                    "type": "object",
+                    "properties": {"zip": {"type": "string"}},
+                },
+            },
+        }
+
+        model = SchemaConverter.build(properties)
+
+        obj = model(work={"zip": "1000"})
+        self.assertEqual(obj.work.zip, "1000")  # type: ignore
+
+    def test_ref_type_parser_with_embedded_resource(self):
+        properties = {
+            "$id": "https://example.com/schemas/order.json",
+            "title": "order",
+            "type": "object",
+            "properties": {
+                "item": {"$ref": "item.json"},
+                "part": {"$ref": "item.json#/$defs/part"},
+            },
+            "$defs": {
+                "item": {
+                    "$id": "item.json",
+                    "type": "object",
+                    "properties": {
+                        "sku": {"type": "string"},
+                        "part": {"$ref": "#/$defs/part"},
+                        "related": {"$ref": "#"},
+                    },
+                    "$defs": {
+                        "part": {
+                            "type": "object",
+                            "properties": {"code": {"type": "integer"}},
+                        }
+                    },
+                }
+            },
+        }
+
+        model = SchemaConverter.build(properties)
+
+        obj = model(
+            item={"sku": "A", "part": {"code": 1}, "related": {"sku": "B"}},
+            part={"code": 2},
+        )
+        self.assertEqual(obj.item.part.code, 1)  # type: ignore
+        self.assertEqual(obj.item.related.sku, "B")  # type: ignore
+        self.assertIs(type(obj.part), type(obj.item.part))  # type: ignore
+
+    def test_ref_type_parser_indexes_the_schema_once(self):
+        properties = {
+            "title": "person",
+            "type": "object",
+            "properties": {
+                "home": {"$ref": "#/$defs/address"},
+                "work": {"$ref": "#/$defs/address"},
+                "manager": {"$ref": "#/$defs/manager"},
+            },
+            "$defs": {
+                "address": {"type": "object", "properties": {}},
+                "manager": {
+                    "type": "object",
+                    "properties": {"address": {"$ref": "#/$defs/address"}},
+                },
+            },
+        }
+
+        with mock.patch(
+            "jambo.schema_converter.SchemaIndex", wraps=SchemaIndex
+        ) as schema_index_spy:
+            SchemaConverter.build(properties)
+
+        schema_index_spy.assert_called_once()
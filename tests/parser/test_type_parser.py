@@ -1,8 +1,8 @@
 from jambo.exceptions import InvalidSchemaException
-from jambo.parser import StringTypeParser
-from jambo.parser._type_parser import GenericTypeParser
+from jambo.parser import EnumTypeParser, ObjectTypeParser, StringTypeParser
+from jambo.parser._type_parser import GenericTypeParser, _get_cached_type_adapter
 
-from unittest import TestCase
+from unittest import TestCase, mock
 
 
 class TestGenericTypeParser(TestCase):
@@ -21,6 +21,119 @@ class TestGenericTypeParser(TestCase):
         with self.assertRaises(InvalidSchemaException):
             GenericTypeParser._get_impl({"type": "invalid_type"})
 
+    def test_get_impl_precedence(self):
+        self.assertIs(
+            GenericTypeParser._get_impl({"type": "string", "enum": ["a"]}),
+            EnumTypeParser,
+        )
+        self.assertIs(
+            GenericTypeParser._get_impl({"type": ["string", "null"], "enum": ["a"]}),
+            EnumTypeParser,
+        )
+
+        with self.assertRaises(InvalidSchemaException):
+            GenericTypeParser._get_impl({"type": ["string", "null"]})
+
+    def test_get_impl_reuses_dispatch_index(self):
+        GenericTypeParser._get_impl({"type": "string"})
+
+        with mock.patch.object(
+            StringTypeParser,
+            "_get_schema_type",
+            wraps=StringTypeParser._get_schema_type,
+        ) as get_schema_type_spy:
+            GenericTypeParser._get_impl({"type": "string"})
+            GenericTypeParser._get_impl({"type": "integer"})
+
+        get_schema_type_spy.assert_not_called()
+
+    def test_register_parser(self):
+        class UpperStringTypeParser(GenericTypeParser):
+            json_schema_type = "type:string"
+
+            def from_properties_impl(self, name, properties, **kwargs):
+                return str, {}
+
+        self.addCleanup(GenericTypeParser.unregister_parser, UpperStringTypeParser)
+
+        # Subclasses are registered with the lowest precedence
+        self.assertEqual(
+            GenericTypeParser.get_registered_parsers()[-1], UpperStringTypeParser
+        )
+        self.assertIs(GenericTypeParser._get_impl({"type": "string"}), StringTypeParser)
+
+        GenericTypeParser.register_parser(UpperStringTypeParser, precedence=0)
+
+        self.assertEqual(
+            GenericTypeParser.get_registered_parsers()[0], UpperStringTypeParser
+        )
+        self.assertIs(
+            GenericTypeParser._get_impl({"type": "string"}), UpperStringTypeParser
+        )
+
+    def test_register_parser_with_new_keyword(self):
+        class DecimalTypeParser(GenericTypeParser):
+            json_schema_type = "x-decimal"
+
+            def from_properties_impl(self, name, properties, **kwargs):
+                return float, {}
+
+        self.addCleanup(GenericTypeParser.unregister_parser, DecimalTypeParser)
+
+        self.assertIs(
+            GenericTypeParser._get_impl({"x-decimal": True}), DecimalTypeParser
+        )
+
+        with self.assertRaises(InvalidSchemaException):
+            GenericTypeParser._get_impl({"x-dec": True})
+
+    def test_type_adapters_are_cached(self):
+        _get_cached_type_adapter.cache_clear()
+
+        properties = {"type": "string", "maxLength": 4, "examples": ["a", "b"]}
+
+        for name in ("first", "second"):
+            StringTypeParser().from_properties(name, properties, required=True)
+
+        cache_info = _get_cached_type_adapter.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_examples_are_validated_in_one_call(self):
+        properties = {"type": "string", "maxLength": 4, "examples": ["a", "b", "c"]}
+
+        with mock.patch.object(
+            GenericTypeParser,
+            "_is_valid_value",
+            wraps=GenericTypeParser._is_valid_value,
+        ) as is_valid_value_spy:
+            StringTypeParser().from_properties("placeholder", properties, required=True)
+
+        is_valid_value_spy.assert_called_once()
+
+        with self.assertRaises(InvalidSchemaException):
+            StringTypeParser().from_properties(
+                "placeholder",
+                {**properties, "examples": ["a", "too long"]},
+                required=True,
+            )
+
+    def test_type_adapters_of_generated_models_are_not_cached(self):
+        _get_cached_type_adapter.cache_clear()
+
+        properties = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "default": {"name": "John"},
+        }
+
+        ObjectTypeParser().from_properties(
+            "placeholder", properties, required=True, ref_cache={}
+        )
+
+        # Only the default of the generated model is validated
+        self.assertEqual(_get_cached_type_adapter.cache_info().currsize, 0)
+
     def test_invalid_examples_not_list(self):
         parser = StringTypeParser()
 
@@ -31,3 +144,14 @@ class TestGenericTypeParser(TestCase):
 
         with self.assertRaises(InvalidSchemaException):
             parser.from_properties("placeholder", properties)
+
+    def test_type_from_properties_does_not_modify_properties(self):
+        properties = {"type": ["string", "null"], "description": "A name"}
+
+        GenericTypeParser.type_from_properties(
+            "placeholder", properties, required=False, context={}, ref_cache={}
+        )
+
+        self.assertEqual(
+            properties, {"type": ["string", "null"], "description": "A name"}
+        )
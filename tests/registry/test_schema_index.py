@@ -0,0 +1,137 @@
+from jambo.registry import SchemaIndex, parse_pointer
+
+from unittest import TestCase
+
+
+class TestSchemaIndex(TestCase):
+    def setUp(self):
+        self.person = {"type": "object", "properties": {"name": {"type": "string"}}}
+        self.escaped = {"type": "string"}
+        self.address = {"$anchor": "address", "type": "object"}
+        self.part = {"type": "integer"}
+        self.item = {
+            "$id": "item.json",
+            "type": "object",
+            "properties": {"part": {"$ref": "#/$defs/part"}},
+            "$defs": {"part": self.part},
+        }
+        self.document = {
+            "$id": "https://example.com/schemas/order.json",
+            "title": "Order",
+            "type": "object",
+            "properties": {
+                "default": {"type": "string"},
+                "customer": {"$ref": "#/definitions/person"},
+            },
+            "default": {"title": "not a schema", "$anchor": "ignored"},
+            "definitions": {
+                "person": self.person,
+                "a/b~c": self.escaped,
+                "address": self.address,
+                "item": self.item,
+            },
+        }
+        self.index = SchemaIndex(self.document)
+
+    def test_parse_pointer(self):
+        self.assertEqual(parse_pointer(""), ())
+        self.assertEqual(parse_pointer("/$defs/a~1b~0c"), ("$defs", "a/b~c"))
+        self.assertEqual(parse_pointer("/definitions/x%20y"), ("definitions", "x y"))
+        self.assertIsNone(parse_pointer("anchor"))
+
+    def test_resolve_pointers(self):
+        base_uri = "https://example.com/schemas/order.json"
+
+        self.assertEqual(self.index.base_uri, base_uri)
+        self.assertEqual(self.index.resolve("#"), (base_uri, self.document))
+        self.assertEqual(
+            self.index.resolve("#/definitions/person"), (base_uri, self.person)
+        )
+        self.assertEqual(
+            self.index.resolve("#/definitions/a~1b~0c"), (base_uri, self.escaped)
+        )
+        self.assertEqual(
+            self.index.resolve("order.json#/definitions/person/properties/name"),
+            (base_uri, {"type": "string"}),
+        )
+        self.assertEqual(
+            self.index.resolve("#/properties/default"), (base_uri, {"type": "string"})
+        )
+
+    def test_resolve_anchors(self):
+        self.assertEqual(
+            self.index.resolve("#address"),
+            ("https://example.com/schemas/order.json", self.address),
+        )
+        self.assertIsNone(self.index.resolve("#ignored"))
+
+    def test_resolve_embedded_resources(self):
+        item_uri = "https://example.com/schemas/item.json"
+
+        self.assertEqual(self.index.resolve("item.json"), (item_uri, self.item))
+        self.assertEqual(
+            self.index.resolve("#/definitions/item"), (item_uri, self.item)
+        )
+        self.assertEqual(
+            self.index.resolve("#/$defs/part", item_uri), (item_uri, self.part)
+        )
+        self.assertEqual(
+            self.index.resolve("item.json#/$defs/part"), (item_uri, self.part)
+        )
+        self.assertIsNone(self.index.resolve("#/$defs/part"))
+
+    def test_resolve_missing_references(self):
+        self.assertIsNone(self.index.resolve("#/definitions/missing"))
+        self.assertIsNone(self.index.resolve("#/definitions"))
+        self.assertIsNone(self.index.resolve("https://example.com/other.json"))
+
+    def test_get_name(self):
+        self.assertEqual(self.index.get_name(self.document), "Order")
+        self.assertEqual(self.index.get_name(self.person), "person")
+        self.assertEqual(self.index.get_name(self.address), "address")
+        self.assertEqual(self.index.get_name(self.item), "item")
+        self.assertEqual(self.index.get_name(self.part), "item_part")
+        self.assertEqual(
+            self.index.get_name(self.person["properties"]["name"]),
+            "definitions_person_properties_name",
+        )
+        self.assertIsNone(self.index.get_name({"type": "string"}))
+
+    def test_get_name_of_colliding_subschemas(self):
+        document = {
+            "title": "Collisions",
+            "type": "object",
+            "properties": {
+                "a": {"type": "string"},
+                "b": {"$anchor": "X", "type": "number"},
+            },
+            "$defs": {
+                "X": {"type": "string"},
+                "properties_a": {"type": "boolean"},
+            },
+            "definitions": {"X": {"type": "integer"}},
+        }
+        index = SchemaIndex(document)
+
+        self.assertEqual(index.get_name(document["$defs"]["X"]), "X")
+        self.assertEqual(index.get_name(document["definitions"]["X"]), "definitions_X")
+        self.assertEqual(index.get_name(document["properties"]["b"]), "properties_b")
+        self.assertEqual(
+            index.get_name(document["$defs"]["properties_a"]), "properties_a"
+        )
+        self.assertEqual(index.get_name(document["properties"]["a"]), "properties_a_2")
+
+    def test_get_references(self):
+        base_uri = "https://example.com/schemas/order.json"
+        item_uri = "https://example.com/schemas/item.json"
+
+        self.assertEqual(
+            self.index.get_references(self.document),
+            [(base_uri, self.person)],
+        )
+        self.assertEqual(self.index.get_references(self.item), [(item_uri, self.part)])
+        self.assertEqual(
+            self.index.get_references({"$ref": "other.json"}),
+            [None],
+        )
+        self.assertEqual(self.index.get_references(self.person), [])
@@ -0,0 +1,318 @@
+from jambo import SchemaConverter
+from jambo.exceptions import InvalidSchemaException
+from jambo.registry import SchemaRegistry
+
+from pydantic import ValidationError
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+
+class TestSchemaRegistry(TestCase):
+    def setUp(self):
+        self.common = {
+            "$id": "https://example.com/schemas/common.json",
+            "$defs": {
+                "Money": {
+                    "type": "object",
+                    "properties": {
+                        "amount": {"type": "number"},
+                        "currency": {"$ref": "#/$defs/Currency"},
+                    },
+                    "required": ["amount", "currency"],
+                },
+                "Currency": {"type": "string", "enum": ["EUR", "USD"]},
+                "Tree": {
+                    "type": "object",
+                    "properties": {
+                        "children": {"type": "array", "items": {"$ref": "#/$defs/Tree"}}
+                    },
+                },
+            },
+        }
+        self.order = {
+            "$id": "https://example.com/schemas/order.json",
+            "title": "Order",
+            "type": "object",
+            "properties": {
+                "total": {"$ref": "common.json#/$defs/Money"},
+                "tax": {"$ref": "https://example.com/schemas/common.json#/$defs/Money"},
+            },
+            "required": ["total"],
+        }
+        self.invoice = {
+            "$id": "https://example.com/schemas/invoice.json",
+            "title": "Invoice",
+            "type": "object",
+            "properties": {"due": {"$ref": "common.json#/$defs/Money"}},
+        }
+
+    def test_resolves_references_to_other_documents(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+
+        model = SchemaConverter.build(self.order, registry=registry)
+
+        obj = model(total={"amount": 10, "currency": "EUR"})
+        self.assertEqual(type(obj.total).__name__, "common_Money")  # type: ignore
+        self.assertEqual(obj.total.currency.value, "EUR")  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            model(total={"amount": 10, "currency": "GBP"})
+
+    def test_documents_are_loaded_lazily_and_once(self):
+        documents = {
+            "https://example.com/schemas/common.json": self.common,
+            "https://example.com/schemas/unused.json": {"type": "string"},
+        }
+        retrieve = mock.Mock(side_effect=documents.get)
+        registry = SchemaRegistry(retrieve)
+
+        SchemaConverter.build(self.order, registry=registry)
+        SchemaConverter.build(self.invoice, registry=registry)
+
+        retrieve.assert_called_once_with("https://example.com/schemas/common.json")
+
+    def test_models_are_shared_between_schemas(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+
+        order = SchemaConverter.build(self.order, registry=registry)
+        invoice = SchemaConverter.build(self.invoice, registry=registry)
+
+        money = registry.models["common_Money"]
+        self.assertIs(order.model_fields["total"].annotation, money)
+        self.assertIs(invoice.model_fields["due"].annotation, money)
+
+    def test_documents_sharing_a_file_name_are_told_apart(self):
+        money_v2 = {
+            "$defs": {
+                "Money": {
+                    "type": "object",
+                    "properties": {"cents": {"type": "integer"}},
+                    "required": ["cents"],
+                }
+            }
+        }
+        registry = SchemaRegistry.from_mapping(
+            {
+                "https://example.com/v1/common.json": {"$defs": self.common["$defs"]},
+                "https://example.com/v2/common.json": money_v2,
+            }
+        )
+        schema = {
+            "title": "Payment",
+            "type": "object",
+            "properties": {
+                "old": {"$ref": "https://example.com/v1/common.json#/$defs/Money"},
+                "new": {"$ref": "https://example.com/v2/common.json#/$defs/Money"},
+            },
+        }
+
+        model = SchemaConverter.build(schema, registry=registry)
+
+        old_money = model.model_fields["old"].annotation
+        new_money = model.model_fields["new"].annotation
+        self.assertIsNot(old_money, new_money)
+        self.assertEqual(old_money.__name__, "common_Money")  # type: ignore
+        self.assertEqual(new_money.__name__, "v2_common_Money")  # type: ignore
+
+        obj = model(old={"amount": 1, "currency": "EUR"}, new={"cents": 100})
+        self.assertEqual(obj.new.cents, 100)  # type: ignore
+        with self.assertRaises(ValidationError):
+            model(new={"amount": 1, "currency": "EUR"})
+
+        # Later builds referring to the second document get its model
+        other = SchemaConverter.build(
+            {
+                "title": "Refund",
+                "type": "object",
+                "properties": {
+                    "amount": {
+                        "$ref": "https://example.com/v2/common.json#/$defs/Money"
+                    }
+                },
+            },
+            registry=registry,
+        )
+        self.assertIs(other.model_fields["amount"].annotation, new_money)
+
+    def test_local_definitions_dont_shadow_registry_models(self):
+        schema = {
+            "title": "Wallet",
+            "type": "object",
+            "properties": {
+                "local": {"$ref": "#/$defs/common_Money"},
+                "shared": {"$ref": "common.json#/$defs/Money"},
+            },
+            "$defs": {
+                "common_Money": {
+                    "type": "object",
+                    "properties": {"coins": {"type": "integer"}},
+                    "required": ["coins"],
+                }
+            },
+        }
+
+        # Whether the document of the registry is loaded before the schema or not
+        for order in (None, self.order):
+            with self.subTest(loaded=order is not None):
+                registry = SchemaRegistry.from_mapping({"common.json": self.common})
+                if order is not None:
+                    SchemaConverter.build(order, registry=registry)
+
+                model = SchemaConverter.build(schema, registry=registry)
+
+                local = model.model_fields["local"].annotation
+                shared = model.model_fields["shared"].annotation
+                self.assertIsNot(local, shared)
+
+                obj = model(local={"coins": 2}, shared={"amount": 1, "currency": "EUR"})
+                self.assertEqual(obj.local.coins, 2)  # type: ignore
+                self.assertEqual(obj.shared.amount, 1)  # type: ignore
+
+    def test_models_are_only_shared_between_builds_with_the_same_options(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+
+        order = SchemaConverter.build(self.order, registry=registry)
+        adaptive_order = SchemaConverter.build(
+            self.order, registry=registry, union_mode="adaptive"
+        )
+        adaptive_invoice = SchemaConverter.build(
+            self.invoice, registry=registry, union_mode="adaptive"
+        )
+        lazy_invoice = SchemaConverter.build(self.invoice, registry=registry, lazy=True)
+
+        money = order.model_fields["total"].annotation
+        adaptive_money = adaptive_order.model_fields["total"].annotation
+        lazy_money = lazy_invoice.model_fields["due"].annotation
+
+        self.assertIs(money, registry.models["common_Money"])
+        self.assertIsNot(adaptive_money, money)
+        self.assertIs(adaptive_invoice.model_fields["due"].annotation, adaptive_money)
+        self.assertIsNot(lazy_money, money)
+        self.assertIsNot(lazy_money, adaptive_money)
+        self.assertFalse(lazy_money.__pydantic_complete__)  # type: ignore
+
+    def test_recursive_definitions_of_other_documents(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+        schema = {
+            "$id": "https://example.com/schemas/forest.json",
+            "title": "Forest",
+            "type": "object",
+            "properties": {"tree": {"$ref": "common.json#/$defs/Tree"}},
+        }
+
+        model = SchemaConverter.build(schema, registry=registry)
+
+        obj = model(tree={"children": [{"children": []}]})
+        self.assertEqual(len(obj.tree.children), 1)  # type: ignore
+
+    def test_unknown_documents_are_not_resolved(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+        schema = {
+            "title": "Order",
+            "type": "object",
+            "properties": {"total": {"$ref": "other.json#/$defs/Money"}},
+        }
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema, registry=registry)
+
+    def test_invalid_documents_are_rejected(self):
+        registry = SchemaRegistry.from_mapping(
+            {"common.json": {"$defs": {"Money": {"type": "money"}}}}
+        )
+        schema = {
+            "title": "Order",
+            "type": "object",
+            "properties": {"total": {"$ref": "common.json#/$defs/Money"}},
+        }
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema, registry=registry)
+
+    def test_failed_builds_share_no_models(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+        schema = {
+            "$id": "https://example.com/schemas/order.json",
+            "title": "Order",
+            "type": "object",
+            "properties": {
+                "total": {"$ref": "common.json#/$defs/Money"},
+                "other": {"$ref": "other.json"},
+            },
+        }
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema, registry=registry)
+
+        self.assertEqual(registry.models, {})
+
+    def test_from_directory(self):
+        with TemporaryDirectory() as directory:
+            Path(directory, "common.json").write_text(json.dumps(self.common))
+            Path(directory, "nested").mkdir()
+            Path(directory, "nested", "unrelated.json").write_text(
+                json.dumps(
+                    {
+                        "$id": "urn:example:currency",
+                        "type": "string",
+                        "enum": ["EUR"],
+                    }
+                )
+            )
+
+            registry = SchemaRegistry.from_directory(
+                directory, base_uri="https://example.com/schemas/"
+            )
+            self.assertIsNotNone(
+                registry.get_index("https://example.com/schemas/common.json")
+            )
+            self.assertIsNotNone(registry.get_index("urn:example:currency"))
+            self.assertIsNone(registry.get_index("https://example.com/other.json"))
+
+            model = SchemaConverter.build(self.order, registry=registry)
+
+        obj = model(total={"amount": 1, "currency": "USD"})
+        self.assertEqual(obj.total.amount, 1)  # type: ignore
+
+    def test_from_directory_stays_within_the_directory(self):
+        with TemporaryDirectory() as parent:
+            Path(parent, "secret.json").write_text(json.dumps({"type": "string"}))
+            Path(parent, "schemas").mkdir()
+
+            registry = SchemaRegistry.from_directory(Path(parent, "schemas"))
+
+            self.assertIsNone(registry.get_index("../secret.json"))
+
+    def test_parallel_builds_resolve_other_documents(self):
+        registry = SchemaRegistry.from_mapping({"common.json": self.common})
+        schema = {
+            "$id": "https://example.com/schemas/cart.json",
+            "title": "Cart",
+            "type": "object",
+            "properties": {
+                "line": {"$ref": "#/$defs/Line"},
+                "note": {"$ref": "#/$defs/Note"},
+            },
+            "$defs": {
+                "Line": {
+                    "type": "object",
+                    "properties": {"price": {"$ref": "common.json#/$defs/Money"}},
+                },
+                "Note": {"type": "object", "properties": {"text": {"type": "string"}}},
+            },
+        }
+
+        model = SchemaConverter.build(schema, registry=registry, max_workers=2)
+        other_model = SchemaConverter.build(
+            self.order, registry=registry, max_workers=2
+        )
+
+        obj = model(line={"price": {"amount": 1, "currency": "EUR"}}, note={})
+        self.assertEqual(type(obj.line.price).__name__, "common_Money")  # type: ignore
+        self.assertIs(
+            type(obj.line.price),  # type: ignore
+            other_model.model_fields["total"].annotation,
+        )
@@ -1,12 +1,20 @@
 from jambo import SchemaConverter
+from jambo.cache import DiskCache, schema_hash
 from jambo.exceptions import InvalidSchemaException, UnsupportedSchemaException
-from jambo.types import JSONSchema
+from jambo.types import JSONSchema, SlowUnion
 
-from pydantic import AnyUrl, BaseModel, ValidationError
-from typing_extensions import get_args
+from jsonschema.validators import validator_for
+from pydantic import AnyUrl, BaseModel, Discriminator, ValidationError
+from typing_extensions import Optional, get_args
 
+import sys
+import tempfile
+import threading
+import time
+import warnings
 from ipaddress import IPv4Address, IPv6Address
-from unittest import TestCase
+from pathlib import Path
+from unittest import TestCase, mock
 from uuid import UUID
 
 
@@ -645,6 +653,25 @@ class TestSchemaConverter(TestCase):
         self.assertEqual(obj.emergency_contact.name, "Jane")
         self.assertEqual(obj.emergency_contact.age, 28)
 
+    def test_ref_to_definitions_sharing_a_name(self):
+        schema = {
+            "title": "Collisions",
+            "type": "object",
+            "properties": {
+                "text": {"$ref": "#/$defs/X"},
+                "number": {"$ref": "#/definitions/X"},
+            },
+            "$defs": {"X": {"type": "string"}},
+            "definitions": {"X": {"type": "integer"}},
+        }
+
+        model = SchemaConverter.build(schema)
+
+        obj = model(text="a", number=1)
+        self.assertEqual((obj.text, obj.number), ("a", 1))  # type: ignore
+        with self.assertRaises(ValidationError):
+            model(number="a")
+
     def test_ref_with_def_another_model(self):
         schema = {
             "title": "Person",
@@ -1171,3 +1198,1098 @@ class TestSchemaConverter(TestCase):
             "Person", namespace=namespace
         )
         self.assertIsNone(cleared_cached_model)
+
+    def test_build_with_model_cache_returns_compiled_model(self):
+        SchemaConverter.clear_model_cache()
+
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+            },
+            "required": ["name"],
+        }
+
+        model1 = SchemaConverter.build(schema, use_model_cache=True)
+        model2 = SchemaConverter.build(schema, use_model_cache=True)
+
+        self.assertIs(model1, model2)
+
+        cache_info = SchemaConverter.get_model_cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
+        SchemaConverter.clear_model_cache(schema)
+        model3 = SchemaConverter.build(schema, use_model_cache=True)
+
+        self.assertIsNot(model1, model3)
+
+    def test_build_without_model_cache_returns_fresh_model(self):
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+        model1 = SchemaConverter.build(dict(schema))
+        model2 = SchemaConverter.build(dict(schema))
+
+        self.assertIsNot(model1, model2)
+
+    def test_model_cache_is_size_bounded(self):
+        SchemaConverter.clear_model_cache()
+        SchemaConverter.set_model_cache_size(1)
+        self.addCleanup(SchemaConverter.set_model_cache_size, 256)
+
+        SchemaConverter.build(
+            {"title": "A", "type": "object", "properties": {}}, use_model_cache=True
+        )
+        SchemaConverter.build(
+            {"title": "B", "type": "object", "properties": {}}, use_model_cache=True
+        )
+
+        cache_info = SchemaConverter.get_model_cache_info()
+        self.assertEqual(cache_info.currsize, 1)
+        self.assertEqual(cache_info.evictions, 1)
+
+    def test_meta_schema_validation_is_memoized(self):
+        schema: JSONSchema = {
+            "title": "MemoizedPerson",
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+        with mock.patch(
+            "jambo.schema_converter.validator_for", wraps=validator_for
+        ) as validator_for_spy:
+            SchemaConverter.build(dict(schema))
+            SchemaConverter.build(dict(schema))
+
+        self.assertEqual(validator_for_spy.call_count, 1)
+
+    def test_invalid_schema_is_not_memoized(self):
+        schema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"name": {"type": 1}},
+        }
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema)
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema)
+
+    def test_trusted_converter_skips_meta_schema_validation(self):
+        converter = SchemaConverter(trusted=True)
+
+        schema: JSONSchema = {
+            "title": "TrustedPerson",
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+        with mock.patch(
+            "jambo.schema_converter.validator_for", wraps=validator_for
+        ) as validator_for_spy:
+            model = converter.build_with_cache(schema)
+
+        validator_for_spy.assert_not_called()
+        self.assertEqual(model(name="John").name, "John")
+
+    def test_build_many(self):
+        schemas: list[JSONSchema] = [
+            {
+                "title": "Person",
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "address": {"$ref": "#/$defs/address"},
+                },
+                "$defs": {
+                    "address": {
+                        "type": "object",
+                        "properties": {"street": {"type": "string"}},
+                    }
+                },
+            },
+            {
+                "title": "Company",
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "address": {"$ref": "#/$defs/address"},
+                },
+                "$defs": {
+                    "address": {
+                        "type": "object",
+                        "properties": {"street": {"type": "string"}},
+                    }
+                },
+            },
+        ]
+
+        models = self.converter.build_many(schemas)
+
+        self.assertEqual(set(models), {"Person", "Company"})
+        self.assertIs(
+            models["Person"].model_fields["address"].annotation,
+            models["Company"].model_fields["address"].annotation,
+        )
+        self.assertIs(self.converter.get_cached_ref("Person"), models["Person"])
+
+    def test_build_many_shares_identical_subschemas(self):
+        address: JSONSchema = {
+            "type": "object",
+            "properties": {"street": {"type": "string"}},
+        }
+        schemas: list[JSONSchema] = [
+            {
+                "title": "Customer",
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "address": address},
+            },
+            {
+                "title": "Supplier",
+                "type": "object",
+                "properties": {"address": address, "billing": address},
+            },
+        ]
+
+        models = self.converter.build_many(schemas)
+
+        customer_address = models["Customer"].model_fields["address"].annotation
+        self.assertIs(
+            models["Supplier"].model_fields["address"].annotation, customer_address
+        )
+        self.assertIs(
+            models["Supplier"].model_fields["billing"].annotation, customer_address
+        )
+        self.assertEqual(
+            models["Supplier"](billing={"street": "Main"}).billing.street,  # type: ignore
+            "Main",
+        )
+
+    def test_build_many_keeps_subschemas_referring_to_their_document_apart(self):
+        child: JSONSchema = {
+            "type": "object",
+            "properties": {"parent": {"$ref": "#"}},
+        }
+        schemas: list[JSONSchema] = [
+            {
+                "title": "A",
+                "type": "object",
+                "properties": {"a_only": {"type": "string"}, "child": child},
+                "required": ["a_only"],
+            },
+            {
+                "title": "B",
+                "type": "object",
+                "properties": {"b_only": {"type": "string"}, "child": child},
+                "required": ["b_only"],
+            },
+        ]
+
+        models = self.converter.build_many(schemas)
+
+        self.assertIsNot(
+            models["B"].model_fields["child"].annotation,
+            models["A"].model_fields["child"].annotation,
+        )
+
+        obj = models["B"].model_validate(
+            {"b_only": "x", "child": {"parent": {"b_only": "y"}}}
+        )
+        self.assertEqual(obj.child.parent.b_only, "y")  # type: ignore
+
+    def test_build_many_builds_identical_schemas_once(self):
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        }
+
+        with mock.patch.object(
+            SchemaConverter, "_build", wraps=SchemaConverter._build
+        ) as build_spy:
+            models = self.converter.build_many([schema, dict(schema)])
+
+        self.assertEqual(build_spy.call_count, 1)
+        self.assertEqual(list(models), ["Person"])
+
+    def test_build_many_rejects_duplicated_titles(self):
+        schemas: list[JSONSchema] = [
+            {
+                "$id": "namespace_a",
+                "title": "Person",
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+            },
+            {
+                "$id": "namespace_b",
+                "title": "Person",
+                "type": "object",
+                "properties": {"age": {"type": "integer"}},
+            },
+        ]
+
+        with self.assertRaises(InvalidSchemaException):
+            self.converter.build_many(schemas)
+
+    def test_build_many_resolves_forward_refs(self):
+        schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "manager": {"$ref": "#/$defs/employee"},
+            },
+            "$defs": {
+                "employee": {
+                    "type": "object",
+                    "properties": {
+                        "subordinate": {"$ref": "#/$defs/employee"},
+                        "person": {"$ref": "#"},
+                    },
+                }
+            },
+        }
+
+        self.converter.build_many([schema])
+
+        employee_model = self.converter.get_cached_ref("employee")
+        employee = employee_model(subordinate={}, person={"name": "John"})
+
+        self.assertEqual(employee.person.name, "John")
+
+    def test_build_with_disk_cache(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        disk_cache = DiskCache(directory.name)
+        SchemaConverter.set_disk_cache(disk_cache)
+        self.addCleanup(SchemaConverter.set_disk_cache, None)
+        self.addCleanup(disk_cache.clear)
+
+        schema: JSONSchema = {
+            "title": "DiskPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 4},
+                "age": {"type": "integer"},
+            },
+            "required": ["name"],
+        }
+
+        SchemaConverter.clear_model_cache()
+        SchemaConverter.build(schema, use_model_cache=True)
+        self.assertEqual(len(list(Path(directory.name).rglob("*.py"))), 1)
+
+        # Simulates a fresh process, where only the disk cache is available
+        SchemaConverter.clear_model_cache()
+        sys.modules.pop(f"_jambo_disk_cache_{schema_hash(schema)}", None)
+
+        with mock.patch.object(SchemaConverter, "_build") as build_spy:
+            model = SchemaConverter.build(schema, use_model_cache=True)
+
+        build_spy.assert_not_called()
+        self.assertEqual(model.__name__, "DiskPerson")
+        self.assertEqual(model(name="John").name, "John")
+        with self.assertRaises(ValidationError):
+            model(name="Johnny")
+
+    def test_build_with_corrupted_disk_cache_entry(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        disk_cache = DiskCache(directory.name)
+        SchemaConverter.set_disk_cache(disk_cache)
+        self.addCleanup(SchemaConverter.set_disk_cache, None)
+        self.addCleanup(disk_cache.clear)
+
+        schema: JSONSchema = {
+            "title": "CorruptedPerson",
+            "type": "object",
+            "properties": {"name": {"type": "string", "maxLength": 4}},
+        }
+
+        SchemaConverter.clear_model_cache()
+        SchemaConverter.build(schema, use_model_cache=True)
+        (entry,) = Path(directory.name).rglob("*.py")
+        entry.write_text("class CorruptedPerson(:\n")
+
+        # Simulates a fresh process, which finds the corrupted entry
+        SchemaConverter.clear_model_cache()
+        sys.modules.pop(f"_jambo_disk_cache_{schema_hash(schema)}", None)
+
+        model = SchemaConverter.build(schema, use_model_cache=True)
+
+        self.assertEqual(model(name="John").name, "John")  # type: ignore
+        self.assertIn("create_model", entry.read_text())
+
+    def test_lazy_build_defers_model_construction(self):
+        schema: JSONSchema = {
+            "title": "LazyPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 4},
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                },
+            },
+            "required": ["name"],
+        }
+
+        model = SchemaConverter.build(schema, lazy=True)
+
+        self.assertFalse(model.__pydantic_complete__)
+
+        obj = model(name="John", address={"street": "Main"})
+        self.assertTrue(model.__pydantic_complete__)
+        self.assertEqual(obj.address.street, "Main")  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            model(name="Johnny")
+
+    def test_lazy_converter_resolves_recursive_refs(self):
+        converter = SchemaConverter(lazy=True)
+
+        schema: JSONSchema = {
+            "title": "LazyTree",
+            "type": "object",
+            "properties": {"root": {"$ref": "#/$defs/node"}},
+            "$defs": {
+                "node": {
+                    "type": "object",
+                    "properties": {
+                        "value": {"type": "integer"},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/$defs/node"},
+                        },
+                    },
+                }
+            },
+        }
+
+        model = converter.build_with_cache(schema)
+        node = converter.get_cached_ref("node")
+
+        self.assertIsNotNone(node)
+        self.assertFalse(node.__pydantic_complete__)  # type: ignore
+
+        obj = model(root={"value": 1, "children": [{"value": 2}]})
+        self.assertEqual(obj.root.children[0].value, 2)  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            model(root={"value": "one"})
+
+        models = converter.build_many([{**schema, "title": "OtherLazyTree"}])
+        self.assertFalse(models["OtherLazyTree"].__pydantic_complete__)
+
+        obj = models["OtherLazyTree"](root={"value": 1, "children": [{"value": 2}]})
+        self.assertEqual(obj.root.children[0].value, 2)  # type: ignore
+
+    def test_lazy_build_resolves_mutually_recursive_refs(self):
+        schema: JSONSchema = {
+            "title": "LazyGraph",
+            "type": "object",
+            "properties": {"node": {"$ref": "#/$defs/Node"}},
+            "$defs": {
+                "Node": {
+                    "type": "object",
+                    "properties": {
+                        "value": {"type": "integer"},
+                        "other": {"$ref": "#/$defs/Other"},
+                    },
+                },
+                "Other": {
+                    "type": "object",
+                    "properties": {"node": {"$ref": "#/$defs/Node"}},
+                },
+            },
+        }
+        data = {"node": {"other": {"node": {"value": 1}}}}
+
+        model = SchemaConverter.build(schema, lazy=True)
+        self.assertFalse(model.__pydantic_complete__)
+
+        obj = model.model_validate(data)
+        self.assertEqual(obj.node.other.node.value, 1)  # type: ignore
+
+        models = SchemaConverter(lazy=True).build_many(
+            [schema, {**schema, "title": "OtherLazyGraph"}]
+        )
+        self.assertFalse(models["OtherLazyGraph"].__pydantic_complete__)
+
+        obj = models["OtherLazyGraph"].model_validate(data)
+        self.assertEqual(obj.node.other.node.value, 1)  # type: ignore
+
+        with self.assertRaises(ValidationError):
+            models["LazyGraph"].model_validate({"node": {"value": "one"}})
+
+    def test_concurrent_builds_share_one_build(self):
+        converter = SchemaConverter()
+
+        schema: JSONSchema = {
+            "title": "ConcurrentPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "address": {"$ref": "#/$defs/address"},
+            },
+            "$defs": {
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                }
+            },
+        }
+
+        build = SchemaConverter.build
+
+        def slow_build(*args, **kwargs):
+            time.sleep(0.1)
+            return build(*args, **kwargs)
+
+        models = []
+
+        def build_schema():
+            models.append(converter.build_with_cache(schema))
+
+        threads = [threading.Thread(target=build_schema) for _ in range(8)]
+        with mock.patch.object(
+            SchemaConverter, "build", side_effect=slow_build
+        ) as build_spy:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(build_spy.call_count, 1)
+        self.assertEqual(len(models), 8)
+        self.assertTrue(all(model is models[0] for model in models))
+        self.assertIsInstance(converter.get_cached_ref("address"), type)
+
+    def test_concurrent_builds_of_a_namespace_are_serialized(self):
+        converter = SchemaConverter()
+
+        schema: JSONSchema = {
+            "type": "object",
+            "properties": {"address": {"$ref": "#/$defs/address"}},
+            "$defs": {
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                }
+            },
+        }
+
+        models = {}
+
+        def build_schema(title: str):
+            models[title] = converter.build_with_cache({**schema, "title": title})
+
+        threads = [
+            threading.Thread(target=build_schema, args=(f"Person{i}",))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        address = converter.get_cached_ref("address")
+        self.assertEqual(len(models), 8)
+        for model in models.values():
+            self.assertIsInstance(model(address={"street": "Main"}).address, address)  # type: ignore
+
+    def test_failed_build_leaves_ref_cache_untouched(self):
+        converter = SchemaConverter()
+
+        address_def: JSONSchema = {
+            "type": "object",
+            "properties": {"street": {"type": "string"}},
+        }
+        valid_schema: JSONSchema = {
+            "title": "Person",
+            "type": "object",
+            "properties": {"address": {"$ref": "#/$defs/address"}},
+            "$defs": {"address": address_def},
+        }
+        invalid_schema: JSONSchema = {
+            "title": "Company",
+            "type": "object",
+            "properties": {
+                "headquarters": {"$ref": "#/$defs/building"},
+                "address": {"$ref": "#/$defs/address"},
+            },
+            "$defs": {
+                "building": {
+                    "type": "object",
+                    "properties": {
+                        "owner": {"$ref": "#/$defs/company"},
+                        "floors": {"type": "integer"},
+                        "location": {"$ref": "https://example.com/location"},
+                    },
+                },
+                "address": address_def,
+            },
+        }
+
+        person = converter.build_with_cache(valid_schema)
+        cached_before = dict(converter._namespace_registry["default"])
+
+        with self.assertRaises(InvalidSchemaException):
+            converter.build_with_cache(invalid_schema)
+
+        self.assertEqual(converter._namespace_registry["default"], cached_before)
+        self.assertIsNone(converter.get_cached_ref("building"))
+        self.assertIs(converter.get_cached_ref("Person"), person)
+
+    def test_fast_profile_skips_default_and_examples_checks(self):
+        schema: JSONSchema = {
+            "title": "FastPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 4, "default": "Johnny"},
+                "birthday": {
+                    "type": "string",
+                    "format": "date",
+                    "examples": ["2000-01-01"],
+                },
+                "address": {
+                    "type": "object",
+                    "properties": {"street": {"type": "string"}},
+                    "examples": [{"street": "Main"}],
+                },
+            },
+        }
+
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema)
+
+        model = SchemaConverter.build(schema, profile="fast")
+
+        # Raw examples are kept as they are in the schema
+        self.assertEqual(model.model_fields["birthday"].examples, ["2000-01-01"])
+        self.assertEqual(model.model_fields["address"].examples, [{"street": "Main"}])
+
+        self.assertEqual(model(name="John").name, "John")
+
+    def test_fast_profile_reports_deferred_errors(self):
+        schema: JSONSchema = {
+            "title": "DeferredPerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 4, "default": "Johnny"},
+                "age": {"type": "integer", "examples": [1, "two"]},
+                "email": {"type": "string", "examples": ["john@example.com"]},
+            },
+        }
+
+        reports = []
+        model = SchemaConverter.build(
+            schema,
+            profile="fast",
+            on_deferred_errors=lambda model, errors: reports.append((model, errors)),
+        )
+
+        self.assertEqual(len(reports), 1)
+
+        reported_model, errors = reports[0]
+        self.assertIs(reported_model, model)
+        self.assertEqual(
+            sorted(error.invalid_field for error in errors),  # type: ignore
+            ["DeferredPerson.age", "DeferredPerson.name"],
+        )
+
+    def test_fast_profile_runs_deferred_checks_in_background(self):
+        schema: JSONSchema = {
+            "title": "BackgroundPerson",
+            "type": "object",
+            "properties": {
+                "age": {"type": "integer", "minimum": 0, "default": -1},
+            },
+        }
+
+        reported = threading.Event()
+        reports = []
+
+        def on_deferred_errors(model, errors):
+            reports.append((threading.current_thread(), errors))
+            reported.set()
+
+        SchemaConverter.build(
+            schema,
+            profile="fast",
+            on_deferred_errors=on_deferred_errors,
+            background_checks=True,
+        )
+
+        self.assertTrue(reported.wait(5))
+
+        thread, errors = reports[0]
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertEqual(len(errors), 1)
+
+    def test_fast_profile_without_errors_is_not_reported(self):
+        schema: JSONSchema = {
+            "title": "ValidPerson",
+            "type": "object",
+            "properties": {"name": {"type": "string", "default": "John"}},
+        }
+
+        on_deferred_errors = mock.Mock()
+        SchemaConverter.build(
+            schema, profile="fast", on_deferred_errors=on_deferred_errors
+        )
+
+        on_deferred_errors.assert_not_called()
+
+    def test_model_cache_keeps_profiles_apart(self):
+        schema: JSONSchema = {
+            "title": "ProfilePerson",
+            "type": "object",
+            "properties": {
+                "birthday": {
+                    "type": "string",
+                    "format": "date",
+                    "examples": ["2000-01-01"],
+                },
+            },
+        }
+
+        SchemaConverter.clear_model_cache()
+
+        strict_model = SchemaConverter.build(schema, use_model_cache=True)
+        fast_model = SchemaConverter.build(schema, use_model_cache=True, profile="fast")
+
+        self.assertIsNot(strict_model, fast_model)
+        self.assertIs(
+            SchemaConverter.build(schema, use_model_cache=True, profile="fast"),
+            fast_model,
+        )
+
+        SchemaConverter.clear_model_cache(schema, profile="fast")
+        self.assertIs(SchemaConverter.build(schema, use_model_cache=True), strict_model)
+        self.assertIsNot(
+            SchemaConverter.build(schema, use_model_cache=True, profile="fast"),
+            fast_model,
+        )
+
+    def test_get_slow_unions(self):
+        schema: JSONSchema = {
+            "title": "UnionReport",
+            "type": "object",
+            "properties": {
+                "id": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+                "amount": {
+                    "oneOf": [
+                        {"type": "integer", "maximum": 9},
+                        {"type": "string"},
+                        {"type": "number", "minimum": 5},
+                    ]
+                },
+                "nested": {
+                    "type": "object",
+                    "properties": {
+                        "code": {
+                            "oneOf": [
+                                {"type": "string", "maxLength": 3},
+                                {"type": "string", "pattern": "^[A-Z]+$"},
+                            ]
+                        },
+                    },
+                },
+            },
+        }
+
+        self.assertEqual(
+            SchemaConverter.get_slow_unions(schema),
+            [
+                SlowUnion("UnionReport.amount", [(0, 2)]),
+                SlowUnion("UnionReport.nested.code", [(0, 1)]),
+            ],
+        )
+
+    def test_get_slow_unions_requires_title(self):
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.get_slow_unions({"type": "object"})
+
+    def test_model_cache_keeps_union_modes_apart(self):
+        schema: JSONSchema = {
+            "title": "UnionModePerson",
+            "type": "object",
+            "properties": {
+                "id": {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+            },
+        }
+
+        SchemaConverter.clear_model_cache()
+
+        smart_model = SchemaConverter.build(schema, use_model_cache=True)
+        routed_model = SchemaConverter.build(
+            schema, use_model_cache=True, union_mode="routed"
+        )
+
+        self.assertIsNot(smart_model, routed_model)
+        self.assertEqual(smart_model(id="1").id, "1")  # type: ignore
+        self.assertEqual(routed_model(id="1").id, "1")  # type: ignore
+
+    def test_union_mode_per_converter(self):
+        schema: JSONSchema = {
+            "title": "RoutedPerson",
+            "type": "object",
+            "properties": {
+                "id": {"anyOf": [{"type": "integer"}, {"type": "boolean"}]},
+            },
+        }
+
+        converter = SchemaConverter(union_mode="routed")
+        model = converter.build_with_cache(schema)
+
+        self.assertEqual(model(id=1).id, 1)  # type: ignore
+        with self.assertRaises(ValidationError):
+            model(id="1")
+
+        self.assertEqual(SchemaConverter().build_with_cache(schema)(id="1").id, 1)  # type: ignore
+
+    def test_nullable_type_list_is_optional(self):
+        schema: JSONSchema = {
+            "title": "NullablePerson",
+            "type": "object",
+            "properties": {
+                "name": {"type": ["string", "null"]},
+            },
+            "required": ["name"],
+        }
+
+        Model = SchemaConverter.build(schema)
+
+        self.assertEqual(Model.model_fields["name"].annotation, Optional[str])
+        self.assertIsNone(Model(name=None).name)  # type: ignore
+        self.assertEqual(Model(name="A").name, "A")  # type: ignore
+
+    def test_get_adaptive_unions(self):
+        schema: JSONSchema = {
+            "title": "AdaptivePerson",
+            "type": "object",
+            "properties": {
+                "id": {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+                "friends": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "contact": {
+                                "oneOf": [
+                                    {"type": "string", "format": "email"},
+                                    {"type": "string", "maxLength": 4},
+                                ]
+                            }
+                        },
+                    },
+                },
+            },
+        }
+
+        Model = SchemaConverter.build(schema, union_mode="adaptive")
+        Model(id=1, friends=[{"contact": "a@example.com"}, {"contact": "1234"}])
+
+        validators = SchemaConverter.get_adaptive_unions(Model)
+
+        self.assertEqual(
+            {name: validator.counts for name, validator in validators.items()},
+            {"AdaptivePerson.id": [1, 0], "AdaptivePerson.friends.contact": [1, 1]},
+        )
+        self.assertEqual(
+            SchemaConverter.get_adaptive_unions(SchemaConverter.build(schema)), {}
+        )
+
+    def test_intern_shares_identical_subschemas(self):
+        address: JSONSchema = {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "kind": {"type": "string", "enum": ["home", "work"]},
+            },
+            "required": ["street"],
+        }
+        schema: JSONSchema = {
+            "title": "InternedPerson",
+            "type": "object",
+            "properties": {
+                "home": address,
+                "work": address,
+                "previous": {"type": "array", "items": address},
+                "status": {"type": "string", "enum": ["home", "work"]},
+                "labelled": {**address, "description": "A labelled address"},
+            },
+            "required": ["home", "work"],
+        }
+
+        Model = SchemaConverter.build(schema, intern=True)
+        fields = Model.model_fields
+
+        address_model = fields["home"].annotation
+        self.assertIs(fields["work"].annotation, address_model)
+        self.assertIs(get_args(fields["previous"].annotation)[0], address_model)
+        self.assertIs(
+            fields["status"].annotation,
+            address_model.model_fields["kind"].annotation,  # type: ignore
+        )
+        self.assertIsNot(fields["labelled"].annotation, address_model)
+
+        obj = Model(home={"street": "A", "kind": "home"}, work={"street": "B"})
+        self.assertEqual(obj.work.street, "B")  # type: ignore
+        self.assertIsNone(obj.previous)  # type: ignore
+
+        Model = SchemaConverter.build(schema)
+        fields = Model.model_fields
+        self.assertIsNot(fields["work"].annotation, fields["home"].annotation)
+
+    def test_intern_shares_subschemas_whether_required_or_not(self):
+        address: JSONSchema = {
+            "type": "object",
+            "properties": {"street": {"type": "string"}},
+            "required": ["street"],
+        }
+        schema: JSONSchema = {
+            "title": "InternedCustomer",
+            "type": "object",
+            "properties": {
+                "billing": address,
+                "home": address,
+                "previous": {"type": "array", "items": address},
+            },
+            "required": ["home"],
+        }
+
+        Model = SchemaConverter.build(schema, intern=True)
+        fields = Model.model_fields
+
+        address_model = fields["home"].annotation
+        self.assertIs(fields["billing"].annotation, address_model)
+        self.assertIs(get_args(fields["previous"].annotation)[0], address_model)
+
+        self.assertTrue(fields["home"].is_required())
+        self.assertFalse(fields["billing"].is_required())
+
+        obj = Model(home={"street": "A"})
+        self.assertIsNone(obj.billing)  # type: ignore
+        self.assertEqual(
+            obj.model_dump(),
+            {"home": {"street": "A"}, "billing": None, "previous": None},
+        )
+
+    def test_intern_keeps_field_properties_apart(self):
+        schema: JSONSchema = {
+            "title": "InternedDefaults",
+            "type": "object",
+            "properties": {
+                "a": {"type": "string", "maxLength": 2},
+                "b": {"type": "string", "maxLength": 2},
+            },
+            "required": ["a"],
+        }
+
+        Model = SchemaConverter.build(schema, intern=True)
+
+        self.assertTrue(Model.model_fields["a"].is_required())
+        self.assertFalse(Model.model_fields["b"].is_required())
+        with self.assertRaises(ValidationError):
+            Model(a="abc")
+
+    def test_recursive_models_are_resolved_during_the_build(self):
+        schema: JSONSchema = {
+            "title": "RecursiveRoot",
+            "type": "object",
+            "properties": {"a": {"$ref": "#/$defs/A"}},
+            "$defs": {
+                "A": {
+                    "type": "object",
+                    "properties": {
+                        "b": {"$ref": "#/$defs/B"},
+                        "nested": {
+                            "type": "object",
+                            "properties": {"a": {"$ref": "#/$defs/A"}},
+                        },
+                    },
+                },
+                "B": {
+                    "type": "object",
+                    "properties": {"a": {"$ref": "#/$defs/A"}},
+                },
+            },
+        }
+
+        rebuilt = []
+        model_rebuild = BaseModel.model_rebuild.__func__  # type: ignore
+
+        def spy(cls, *args, **kwargs):
+            rebuilt.append(cls.__name__)
+            return model_rebuild(cls, *args, **kwargs)
+
+        ref_cache: dict = {}
+        with mock.patch.object(BaseModel, "model_rebuild", classmethod(spy)):
+            SchemaConverter.build(schema, ref_cache)
+
+        self.assertEqual(len(rebuilt), len(set(rebuilt)))
+        for name, model in ref_cache.items():
+            self.assertTrue(model.__pydantic_complete__, name)
+
+        obj = ref_cache["B"](a={"b": {"a": {}}, "nested": {"a": {}}})
+        self.assertIsNotNone(obj.a.b.a)
+
+        lazy_ref_cache: dict = {}
+        SchemaConverter.build(schema, lazy_ref_cache, lazy=True)
+        self.assertFalse(lazy_ref_cache["B"].__pydantic_complete__)
+
+    def test_parallel_build_matches_serial_build(self):
+        definitions: dict = {}
+        for i in range(12):
+            properties: dict = {"value": {"type": "integer"}}
+            if i % 3 != 2:
+                properties["next"] = {"$ref": f"#/$defs/D{i + 1}"}
+            if i % 4 == 1:
+                properties["previous"] = {"$ref": f"#/$defs/D{i - 1}"}
+            definitions[f"D{i}"] = {"type": "object", "properties": properties}
+        definitions["Unused"] = {"type": "object", "properties": {}}
+
+        schema: JSONSchema = {
+            "title": "ParallelRoot",
+            "type": "object",
+            "properties": {f"d{i}": {"$ref": f"#/$defs/D{i}"} for i in range(0, 12, 3)},
+            "$defs": definitions,
+        }
+
+        serial_ref_cache: dict = {}
+        serial_model = SchemaConverter.build(schema, serial_ref_cache)
+
+        orders = []
+        for _ in range(3):
+            ref_cache: dict = {}
+            model = SchemaConverter.build(schema, ref_cache, max_workers=4)
+
+            self.assertEqual(
+                model.model_json_schema(), serial_model.model_json_schema()
+            )
+            self.assertEqual(set(ref_cache), set(serial_ref_cache))
+            self.assertNotIn("Unused", ref_cache)
+            orders.append(list(ref_cache))
+
+        self.assertTrue(all(order == orders[0] for order in orders))
+
+        obj = model(d0={"value": 1, "next": {"value": 2, "previous": {"value": 3}}})
+        self.assertEqual(obj.d0.next.previous.value, 3)  # type: ignore
+
+    def test_parallel_build_matches_serial_build_of_unions(self):
+        schema: JSONSchema = {
+            "title": "ParallelUnions",
+            "type": "object",
+            "properties": {
+                "shape": {"$ref": "#/$defs/Shape"},
+                "size": {"$ref": "#/$defs/Size"},
+                "other_shape": {"$ref": "#/$defs/Shape"},
+            },
+            "required": ["shape", "size"],
+            "$defs": {
+                "Shape": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"const": "circle"},
+                                "radius": {"type": "number"},
+                            },
+                            "required": ["kind"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {"kind": {"const": "square"}},
+                            "required": ["kind"],
+                        },
+                    ]
+                },
+                "Size": {
+                    "anyOf": [
+                        {"type": "object", "properties": {"cm": {"type": "number"}}},
+                        {"type": "string"},
+                    ]
+                },
+            },
+        }
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            serial_model = SchemaConverter.build(schema)
+            parallel_model = SchemaConverter.build(schema, max_workers=2)
+
+        self.assertEqual(
+            parallel_model.model_json_schema(), serial_model.model_json_schema()
+        )
+
+        for model in (serial_model, parallel_model):
+            (discriminator,) = model.model_fields["shape"].metadata
+            self.assertIsInstance(discriminator, Discriminator)
+
+            obj = model(shape={"kind": "circle"}, size="large")
+            self.assertEqual(obj.model_dump()["other_shape"], None)
+
+            with self.assertRaises(ValidationError) as ctx:
+                model(shape={"kind": "triangle"}, size="large")
+            self.assertEqual(ctx.exception.errors()[0]["type"], "union_tag_invalid")
+            self.assertEqual(ctx.exception.errors()[0]["loc"], ("shape",))
+
+    def test_parallel_build_reports_invalid_definitions(self):
+        schema: JSONSchema = {
+            "title": "ParallelInvalid",
+            "type": "object",
+            "properties": {
+                "a": {"$ref": "#/$defs/A"},
+                "b": {"$ref": "#/$defs/B"},
+            },
+            "$defs": {
+                "A": {"type": "object", "properties": {}},
+                "B": {"type": "integer", "default": "not an integer"},
+            },
+        }
+
+        ref_cache: dict = {}
+        with self.assertRaises(InvalidSchemaException):
+            SchemaConverter.build(schema, ref_cache, max_workers=2)
+
+        self.assertEqual(ref_cache, {})
+
+    def test_parallel_build_into_namespace(self):
+        schema: JSONSchema = {
+            "$id": "parallel",
+            "title": "ParallelNamespace",
+            "type": "object",
+            "properties": {
+                "a": {"$ref": "#/$defs/A"},
+                "b": {"$ref": "#/$defs/B"},
+            },
+            "$defs": {
+                "A": {"type": "object", "properties": {"b": {"$ref": "#/$defs/B"}}},
+                "B": {"type": "object", "properties": {"v": {"type": "string"}}},
+            },
+        }
+        other_schema: JSONSchema = {
+            **schema,
+            "title": "OtherParallelNamespace",
+            "properties": {"a": {"$ref": "#/$defs/A"}},
+        }
+
+        converter = SchemaConverter(max_workers=2)
+        model = converter.build_with_cache(schema)
+        other_model = converter.build_with_cache(other_schema)
+
+        self.assertIs(
+            model.model_fields["a"].annotation, other_model.model_fields["a"].annotation
+        )
+        self.assertEqual(model(a={"b": {"v": "x"}}).a.b.v, "x")  # type: ignore